@@ -0,0 +1,223 @@
+"""Compressed vs plain transfers of search responses and imports.
+
+Runs a local stand-in Typesense server (in its own process), serving
+a large search response, gzipped when accepted, and answering imports,
+gzipped or not. Transfers are throttled to `--bandwidth` (MB/s), as
+across availability zones, then:
+
+- runs `--searches` searches, with and without `response_compression`;
+- imports `--documents` documents, with and without a
+  `request_compression_threshold`.
+
+    python benchmarks/bench_compression.py --bandwidth 20 --hits 250
+
+br and zstd need the `compression` extra; the stand-in only gzips.
+"""
+import argparse
+import asyncio
+import gzip
+import multiprocessing
+import time
+import random
+import orjson
+from typesense_aio import Client, Configuration
+
+
+WORDS = (
+    'wizard school scar owl wand potion dragon castle forest letter '
+    'friend train quest secret stone chamber prisoner goblet prince '
+    'order phoenix hallows magic broom spell'
+).split()
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words))
+
+
+def make_search(hits: int) -> bytes:
+    rng = random.Random(hits)
+    return orjson.dumps({
+        "facet_counts": [{
+            "field_name": "authors",
+            "counts": [
+                {"count": 10 - index, "value": f"Author {index}"}
+                for index in range(10)
+            ]
+        }],
+        "found": hits * 10,
+        "page": 1,
+        "search_time_ms": 3,
+        "hits": [{
+            "document": {
+                "id": str(index),
+                "title": f"Harry Potter and the Volume {index}",
+                "authors": ["J.K. Rowling", "Mary GrandPré"],
+                "publication_year": 1997 + index % 20,
+                "average_rating": round(rng.uniform(1, 5), 2),
+                "description": sentence(rng, 40),
+            },
+            "highlights": [{
+                "field": "title",
+                "snippet": "<mark>Harry</mark> Potter and the Volume",
+                "matched_tokens": ["Harry"]
+            }],
+            "text_match": rng.getrandbits(60)
+        } for index in range(hits)]
+    })
+
+
+class StandIn:
+
+    def __init__(self, hits: int, bandwidth: float):
+        self.search = make_search(hits)
+        self.search_gzip = gzip.compress(self.search, 6)
+        self.bandwidth = bandwidth * 1024 * 1024
+
+    async def throttle(self, size: int):
+        await asyncio.sleep(size / self.bandwidth)
+
+    async def read_body(self, reader, headers: dict) -> bytes:
+        if 'content-length' in headers:
+            return await reader.readexactly(int(headers['content-length']))
+        if headers.get('transfer-encoding') != 'chunked':
+            return b''
+        body = bytearray()
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            body += await reader.readexactly(size + 2)
+            del body[-2:]
+            if not size:
+                return bytes(body)
+
+    async def handle(self, reader, writer):
+        while True:
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except (asyncio.IncompleteReadError, ConnectionError):
+                break
+            request, *lines = head.decode().split('\r\n')
+            headers = {}
+            for line in lines:
+                if line:
+                    name, value = line.split(':', 1)
+                    headers[name.lower()] = value.strip()
+            body = await self.read_body(reader, headers)
+            await self.throttle(len(head) + len(body))
+            encoding = None
+            if request.startswith('POST'):
+                if headers.get('content-encoding') == 'gzip':
+                    body = gzip.decompress(body)
+                payload = b'\n'.join(
+                    [b'{"success":true}'] * (body.count(b'\n') + 1)
+                )
+            elif 'gzip' in headers.get('accept-encoding', ''):
+                payload, encoding = self.search_gzip, 'gzip'
+            else:
+                payload = self.search
+            response = (
+                b'HTTP/1.1 200 OK\r\n'
+                b'Content-Type: application/json\r\n'
+                + (b'Content-Encoding: gzip\r\n' if encoding else b'')
+                + b'Content-Length: ' + str(len(payload)).encode()
+                + b'\r\n\r\n' + payload
+            )
+            await self.throttle(len(response))
+            writer.write(response)
+            await writer.drain()
+        writer.close()
+
+
+async def serve(hits: int, bandwidth: float, ports: multiprocessing.Queue):
+    server = await asyncio.start_server(
+        StandIn(hits, bandwidth).handle, '127.0.0.1', 0)
+    ports.put(server.sockets[0].getsockname()[1])
+    async with server:
+        await server.serve_forever()
+
+
+def run_server(hits: int, bandwidth: float, ports: multiprocessing.Queue):
+    asyncio.run(serve(hits, bandwidth, ports))
+
+
+async def searches(config: Configuration, count: int):
+    async with Client(config) as client:
+        documents = client.collections['bench'].documents
+        await documents.search(q='harry')
+        start = time.perf_counter()
+        for page in range(count):
+            await documents.search(q='harry', page=page)
+        return time.perf_counter() - start
+
+
+async def imports(config: Configuration, count: int):
+    rng = random.Random(count)
+    documents = [{
+        "id": str(index),
+        "title": sentence(rng, 6),
+        "authors": ["J.K. Rowling", "Mary GrandPré"],
+        "description": sentence(rng, 40),
+    } for index in range(count)]
+    async with Client(config) as client:
+        collection = client.collections['bench'].documents
+        start = time.perf_counter()
+        summary = await collection.import_summary(documents)
+        assert summary.succeeded == count
+        return time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--hits', type=int, default=250)
+    parser.add_argument('--searches', type=int, default=200)
+    parser.add_argument('--documents', type=int, default=100000)
+    parser.add_argument('--bandwidth', type=float, default=20.0)
+    args = parser.parse_args()
+
+    ports = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=run_server,
+        args=(args.hits, args.bandwidth, ports),
+        daemon=True
+    )
+    server.start()
+    port = ports.get()
+
+    base = Configuration(
+        urls=[f'http://127.0.0.1:{port}'],
+        api_key='benchmark',
+        timeout=60.0,
+    )
+    search = make_search(args.hits)
+    print(
+        f'search response: {len(search)} bytes, '
+        f'{len(gzip.compress(search, 6))} gzipped, '
+        f'{args.bandwidth} MB/s'
+    )
+    modes = {
+        'searches, identity': base._replace(response_compression=False),
+        'searches, gzip': base,
+    }
+    for name, config in modes.items():
+        elapsed = await searches(config, args.searches)
+        print(
+            f'{name:<20} {args.searches / elapsed:>9.1f} searches/s '
+            f'({elapsed:.2f}s)'
+        )
+
+    modes = {
+        'import, identity': base,
+        'import, gzip': base._replace(request_compression_threshold=0),
+    }
+    for name, config in modes.items():
+        elapsed = await imports(config, args.documents)
+        print(
+            f'{name:<20} {args.documents / elapsed:>9.0f} documents/s '
+            f'({elapsed:.2f}s)'
+        )
+
+    server.terminate()
+    server.join()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,160 @@
+"""HTTP/1.1 connection pool vs HTTP/2 multiplexing.
+
+Runs a local stand-in Typesense server (in its own process) answering
+`/search` requests after a small artificial delay, then fires bursts of concurrent
+`Documents.search` calls through a `Client` configured for each
+transport mode.
+
+    python benchmarks/bench_http2.py --requests 5000 --concurrency 500
+
+HTTP/2 needs the `http2` extra (`pip install typesense_aio[http2]`).
+"""
+import argparse
+import asyncio
+import multiprocessing
+import time
+import h2.config
+import h2.connection
+import h2.events
+import h2.settings
+from typesense_aio import Client, Configuration
+
+
+PAYLOAD = (
+    b'{"found": 1, "took_ms": 1, "hits": '
+    b'[{"document": {"id": "1", "name": "apple"}}]}'
+)
+H2_PREFACE = b'PRI * HTTP/2.0'
+
+
+class StandInServer(asyncio.Protocol):
+    # Answers HTTP/1.1 keep-alive and h2c (prior knowledge) requests.
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.buffer = b''
+        self.h2 = None
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data: bytes):
+        if self.h2 is None and not self.buffer:
+            if data.startswith(H2_PREFACE):
+                self.h2 = h2.connection.H2Connection(
+                    config=h2.config.H2Configuration(client_side=False)
+                )
+                self.h2.initiate_connection()
+                self.h2.update_settings({
+                    h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: 1000
+                })
+        if self.h2 is not None:
+            for event in self.h2.receive_data(data):
+                if isinstance(event, h2.events.StreamEnded):
+                    asyncio.ensure_future(self.respond_h2(event.stream_id))
+            self.transport.write(self.h2.data_to_send())
+            return
+
+        self.buffer += data
+        while b'\r\n\r\n' in self.buffer:
+            _, self.buffer = self.buffer.split(b'\r\n\r\n', 1)
+            asyncio.ensure_future(self.respond_h1())
+
+    async def respond_h1(self):
+        await asyncio.sleep(self.delay)
+        self.transport.write(
+            b'HTTP/1.1 200 OK\r\n'
+            b'Content-Type: application/json\r\n'
+            b'Content-Length: ' + str(len(PAYLOAD)).encode() + b'\r\n'
+            b'\r\n' + PAYLOAD
+        )
+
+    async def respond_h2(self, stream_id: int):
+        await asyncio.sleep(self.delay)
+        if self.transport.is_closing():
+            return
+        self.h2.send_headers(stream_id, [
+            (':status', '200'),
+            ('content-type', 'application/json'),
+            ('content-length', str(len(PAYLOAD))),
+        ])
+        self.h2.send_data(stream_id, PAYLOAD, end_stream=True)
+        self.transport.write(self.h2.data_to_send())
+
+
+async def serve(delay: float, ports: multiprocessing.Queue):
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(
+        lambda: StandInServer(delay), '127.0.0.1', 0)
+    ports.put(server.sockets[0].getsockname()[1])
+    async with server:
+        await server.serve_forever()
+
+
+def run_server(delay: float, ports: multiprocessing.Queue):
+    asyncio.run(serve(delay, ports))
+
+
+async def run(config: Configuration, requests: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with Client(config) as client:
+        documents = client.collections['bench'].documents
+
+        async def search(page: int):
+            async with semaphore:
+                await documents.search(q='apple', page=page)
+
+        # Warm up the connections.
+        await asyncio.gather(*(search(1) for _ in range(concurrency)))
+        start = time.perf_counter()
+        await asyncio.gather(*(search(i) for i in range(requests)))
+        elapsed = time.perf_counter() - start
+        pool = client.requester.pool
+        connections = sum(
+            len(http_client._transport._pool.connections)
+            for http_client in pool.clients.values()
+        )
+    return elapsed, connections
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=500)
+    parser.add_argument('--pool', type=int, default=20)
+    parser.add_argument('--delay', type=float, default=0.005)
+    args = parser.parse_args()
+
+    ports = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=run_server, args=(args.delay, ports), daemon=True)
+    server.start()
+    port = ports.get()
+
+    base = Configuration(
+        urls=[f'http://127.0.0.1:{port}'],
+        api_key='benchmark',
+        timeout=30.0,
+        pool_max_connections=args.pool,
+        pool_max_keepalive=args.pool,
+    )
+    modes = {
+        'HTTP/1.1 pool': base,
+        'HTTP/2 (h2c)': base._replace(http2=True, http1=False),
+    }
+    for name, config in modes.items():
+        elapsed, connections = await run(
+            config, args.requests, args.concurrency)
+        print(
+            f'{name:<14} {args.requests / elapsed:>9.0f} req/s '
+            f'({elapsed:.2f}s, {connections} connection(s))'
+        )
+
+    server.terminate()
+    server.join()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+"""Lazily decoded search responses.
+
+Reads the same search response body, of `--hits` hits with facet
+counts, as a handler would:
+
+- decoded with orjson into dicts, the default, then reading `found`;
+- as a `LazySearchResponse`, reading `found` only;
+- as a `LazySearchResponse`, reading `found` and the hits.
+
+    python benchmarks/bench_lazy.py --hits 250 --rounds 2000
+
+Per-key decoding needs the `models` extra (msgspec).
+"""
+import argparse
+import time
+import orjson
+from typesense_aio.responses import LazySearchResponse
+
+
+def make_body(hits: int) -> bytes:
+    return orjson.dumps({
+        "facet_counts": [{
+            "field_name": "authors",
+            "counts": [
+                {"count": 100 - index, "value": f"Author {index}"}
+                for index in range(100)
+            ]
+        }],
+        "found": hits * 10,
+        "page": 1,
+        "search_time_ms": 3,
+        "hits": [{
+            "document": {
+                "id": str(index),
+                "title": f"Harry Potter and the Volume {index}",
+                "authors": ["J.K. Rowling", "Mary GrandPré"],
+                "publication_year": 1997 + index % 20,
+                "average_rating": 4.44,
+                "description": "A boy, a scar, a school of wizardry.",
+            },
+            "highlights": [{
+                "field": "title",
+                "snippet": "<mark>Harry</mark> Potter",
+                "matched_tokens": ["Harry"]
+            }],
+            "text_match": 578730123365187705
+        } for index in range(hits)]
+    })
+
+
+def measure(read, body: bytes, rounds: int) -> float:
+    read(body)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        read(body)
+    return (time.perf_counter() - started) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--hits', type=int, default=250)
+    parser.add_argument('--rounds', type=int, default=2000)
+    args = parser.parse_args()
+
+    body = make_body(args.hits)
+    readers = {
+        'dict, found': lambda body: orjson.loads(body)["found"],
+        'lazy, found': lambda body: LazySearchResponse(
+            body, orjson.loads
+        )["found"],
+        'lazy, found and hits': lambda body: (
+            lambda response: (response["found"], response["hits"])
+        )(LazySearchResponse(body, orjson.loads)),
+    }
+    print(f'{len(body)} bytes, {args.hits} hits')
+    for name, read in readers.items():
+        elapsed = measure(read, body, args.rounds)
+        print(f'{name:<24} {elapsed * 1e6:>9.1f} µs/response')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""Decoding search responses into document models.
+
+Decodes the same search response body, of `--hits` hits, with:
+
+- orjson into dicts, the default;
+- orjson into dicts, then the documents into dataclasses, as an
+  application converting the results does;
+- `ModelCodec` without msgspec, building dataclasses from the dicts;
+- `ModelCodec` with msgspec, into dataclasses and into Structs.
+
+    python benchmarks/bench_models.py --hits 250 --rounds 2000
+
+The msgspec rows need the `models` extra (`pip install typesense_aio[models]`).
+"""
+import argparse
+import dataclasses
+import time
+from unittest import mock
+import msgspec
+import orjson
+from typesense_aio.models import ModelCodec
+
+
+@dataclasses.dataclass(slots=True)
+class Book:
+    id: str
+    title: str
+    authors: list[str]
+    publication_year: int
+    ratings_count: int
+    average_rating: float
+    image_url: str
+
+
+class BookStruct(msgspec.Struct):
+    id: str
+    title: str
+    authors: list[str]
+    publication_year: int
+    ratings_count: int
+    average_rating: float
+    image_url: str
+
+
+FIELDS = tuple(field.name for field in dataclasses.fields(Book))
+
+
+def make_body(hits: int) -> bytes:
+    return orjson.dumps({
+        "facet_counts": [],
+        "found": hits * 10,
+        "out_of": hits * 100,
+        "page": 1,
+        "request_params": {"per_page": hits, "q": "harry"},
+        "search_cutoff": False,
+        "search_time_ms": 3,
+        "hits": [{
+            "document": {
+                "id": str(index),
+                "title": f"Harry Potter and the Volume {index}",
+                "authors": ["J.K. Rowling", "Mary GrandPré"],
+                "publication_year": 1997 + index % 20,
+                "ratings_count": 4000000 + index,
+                "average_rating": 4.44,
+                "image_url": f"https://images.example.com/{index}.jpg",
+                "description": "A boy, a scar, a school of wizardry.",
+            },
+            "highlights": [{
+                "field": "title",
+                "snippet": "<mark>Harry</mark> Potter",
+                "matched_tokens": ["Harry"]
+            }],
+            "text_match": 578730123365187705
+        } for index in range(hits)]
+    })
+
+
+def dicts_then_models(body: bytes):
+    result = orjson.loads(body)
+    for hit in result["hits"]:
+        document = hit["document"]
+        hit["document"] = Book(**{key: document[key] for key in FIELDS})
+    return result
+
+
+def measure(decode, body: bytes, rounds: int) -> float:
+    decode(body)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        decode(body)
+    return (time.perf_counter() - started) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--hits', type=int, default=250)
+    parser.add_argument('--rounds', type=int, default=2000)
+    args = parser.parse_args()
+
+    body = make_body(args.hits)
+    with mock.patch('typesense_aio.models.msgspec', None):
+        fallback = ModelCodec(Book)
+    decoders = {
+        'orjson dicts': orjson.loads,
+        'orjson dicts + dataclasses': dicts_then_models,
+        'codec, dataclasses, no msgspec': fallback.search,
+        'codec, dataclasses': ModelCodec(Book).search,
+        'codec, msgspec Struct': ModelCodec(BookStruct).search,
+    }
+    print(f'{len(body)} bytes, {args.hits} hits')
+    for name, decode in decoders.items():
+        if name.endswith('no msgspec'):
+            with mock.patch('typesense_aio.models.msgspec', None):
+                elapsed = measure(decode, body, args.rounds)
+        else:
+            elapsed = measure(decode, body, args.rounds)
+        print(f'{name:<32} {elapsed * 1e6:>9.1f} µs/response')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+import httpx
+import pytest
+from collections import Counter
+from typesense_aio.balancing import (
+    NodeLoad, RoundRobin, LeastOutstanding, EWMALatency, resolve_strategy
+)
+from typesense_aio.config import Configuration
+from typesense_aio.nodes import Node, NodeList
+from typesense_aio.requester import Requester
+
+
+node1 = Node('http://test.com:80/indexer')
+node2 = Node('http://example.com:12345/')
+node3 = Node('http://other.com:8108')
+
+
+def test_resolve_strategy():
+    assert isinstance(resolve_strategy('round_robin'), RoundRobin)
+    strategy = EWMALatency()
+    assert resolve_strategy(strategy) is strategy
+    with pytest.raises(ValueError):
+        resolve_strategy('fastest')
+
+
+def test_round_robin():
+    nodes = NodeList((node1, node2, node3), strategy='round_robin')
+    assert [nodes.get() for _ in range(6)] == [
+        node1, node2, node3, node1, node2, node3
+    ]
+    nodes.quarantine(node2)
+    assert set(nodes.get() for _ in range(4)) == {node1, node3}
+    nodes.close()
+
+
+def test_least_outstanding():
+    load = {node1: NodeLoad(), node2: NodeLoad(), node3: NodeLoad()}
+    load[node1].started()
+    load[node2].started()
+    load[node2].started()
+    strategy = LeastOutstanding()
+    assert strategy.select([node1, node2, node3], load) == node3
+    assert strategy.select([node1, node2], load) == node1
+
+
+def test_ewma_latency():
+    load = {node1: NodeLoad(), node2: NodeLoad()}
+    for _ in range(3):
+        load[node1].started()
+        load[node1].finished(0.5)
+        load[node2].started()
+        load[node2].finished(0.01)
+    assert load[node1].latency == pytest.approx(0.5)
+    assert load[node1].outstanding == 0
+
+    strategy = EWMALatency()
+    assert all(
+        strategy.select([node1, node2], load) == node2 for _ in range(10)
+    )
+    # An unmeasured node is tried first.
+    assert strategy.select([node1, node3], load) == node3
+
+
+async def test_requester_load_balancing(api_key, respx_mock):
+    for url in ("http://test.com:80/indexer", "http://example.com:12345",
+                "http://other.com:8108"):
+        respx_mock.get(f"{url}/health").mock(
+            return_value=httpx.Response(200, content=b'{"ok": true}')
+        )
+    requester = Requester(Configuration(
+        urls=[node1, node2, node3],
+        api_key=api_key,
+        load_balancing='round_robin'
+    ))
+    for _ in range(6):
+        await requester.get('/health')
+    assert Counter(
+        {node: load.requests for node, load in requester.load.items()}
+    ) == Counter({node1: 2, node2: 2, node3: 2})
+    assert all(load.outstanding == 0 for load in requester.load.values())
+    assert all(load.latency is not None for load in requester.load.values())
+    await requester.aclose()
@@ -0,0 +1,119 @@
+from unittest import mock
+from typesense_aio.breaker import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+from typesense_aio.nodes import Node, NodeList
+
+
+def clock(value):
+    return mock.patch("typesense_aio.breaker.monotonic", return_value=value)
+
+
+def test_breaker_consecutive_failures():
+    transitions = []
+    breaker = CircuitBreaker(
+        'node', failure_threshold=3, open_interval=1.0,
+        listener=lambda *args: transitions.append(args)
+    )
+    with clock(100):
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert not breaker.allow()
+
+    with clock(101):
+        assert breaker.allow()
+        assert breaker.state == HALF_OPEN
+        # Only one trial at a time.
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        assert breaker.allow()
+
+    assert transitions == [
+        ('node', CLOSED, OPEN),
+        ('node', OPEN, HALF_OPEN),
+        ('node', HALF_OPEN, CLOSED),
+    ]
+
+
+def test_breaker_error_rate():
+    breaker = CircuitBreaker(
+        'node', failure_threshold=10, error_rate=0.5, window=4
+    )
+    for _ in range(2):
+        breaker.record_success()
+        breaker.record_failure()
+    assert breaker.state == OPEN
+
+
+def test_breaker_exponential_interval():
+    breaker = CircuitBreaker(
+        'node', failure_threshold=1, open_interval=1.0, max_open_interval=3.0
+    )
+    with clock(100):
+        breaker.record_failure()
+    assert breaker.interval == 1.0
+
+    with clock(101):
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == OPEN
+    assert breaker.interval == 2.0
+
+    with clock(102):
+        assert not breaker.allow()
+
+    with clock(103):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.interval == 3.0
+
+    with clock(106):
+        assert breaker.allow()
+        breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.interval == 1.0
+
+
+def test_breaker_lost_trial():
+    breaker = CircuitBreaker('node', failure_threshold=1, open_interval=1.0)
+    with clock(100):
+        breaker.record_failure()
+    with clock(101):
+        assert breaker.allow()
+    with clock(101.5):
+        assert not breaker.allow()
+    with clock(102):
+        # The first trial never reported back.
+        assert breaker.allow()
+
+
+def test_nodes_half_open():
+    node1 = Node('http://test.com:80/indexer')
+    node2 = Node('http://example.com:12345/')
+    nodes = NodeList(
+        (node1, node2),
+        breaker=lambda node: CircuitBreaker(
+            node, failure_threshold=2, open_interval=1.0
+        )
+    )
+    with clock(100):
+        nodes.record_failure(node1)
+        assert nodes.sane == {node1, node2}
+        nodes.record_failure(node1)
+        assert nodes.sane == {node2}
+        assert {nodes.get() for _ in range(4)} == {node2}
+
+    with clock(101):
+        # A single trial request goes to the half-open node.
+        assert nodes.get() == node1
+        assert nodes.get() == node2
+        nodes.record_success(node1)
+        assert nodes.sane == {node1, node2}
+        assert nodes.breakers[node1].state == CLOSED
+
+    nodes.close()
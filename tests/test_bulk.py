@@ -0,0 +1,136 @@
+import asyncio
+import httpx
+import orjson
+import pytest
+from unittest import mock
+from typesense_aio.bulk import BulkIndexer
+from typesense_aio.client import Client
+from typesense_aio.config import Configuration
+
+
+IMPORT_URL = "http://test.com:80/collections/fruits/documents/import"
+
+
+def import_documents(request):
+    results = []
+    for line in request.read().split(b"\n"):
+        document = orjson.loads(line)
+        if document["name"] == "rotten":
+            results.append({"success": False, "error": "Rotten fruit"})
+        else:
+            results.append({"success": True})
+    return httpx.Response(
+        200, content=b"\n".join(orjson.dumps(r) for r in results)
+    )
+
+
+async def test_bulk_indexer_batches(api_key, respx_mock):
+    route = respx_mock.post(IMPORT_URL).mock(side_effect=import_documents)
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key
+    ))
+    documents = client.collections["fruits"].documents
+
+    async with BulkIndexer(
+            documents, batch_size=3, concurrency=2, max_pending=2,
+            params={"action": "upsert"}) as indexer:
+        for idx in range(7):
+            await indexer.add({"id": str(idx), "name": "apple"})
+        await indexer.add({"id": "7", "name": "rotten"})
+
+    stats = indexer.stats
+    assert route.call_count == 3
+    assert route.calls.last.request.url.params["action"] == "upsert"
+    assert stats.submitted == 8
+    assert stats.succeeded == 7
+    assert stats.failed == 1
+    assert stats.batches == 3
+    assert stats.failures == [(
+        {"id": "7", "name": "rotten"},
+        {"success": False, "error": "Rotten fruit"}
+    )]
+    await client.aclose()
+
+
+async def test_bulk_indexer_flush_interval(api_key, respx_mock):
+    route = respx_mock.post(IMPORT_URL).mock(side_effect=import_documents)
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key
+    ))
+    indexer = BulkIndexer(
+        client.collections["fruits"].documents,
+        batch_size=100,
+        flush_interval=0.05
+    )
+    await indexer.add({"id": "1", "name": "apple"})
+    await asyncio.sleep(0.2)
+    assert route.call_count == 1
+
+    stats = await indexer.close()
+    assert route.call_count == 1
+    assert stats.succeeded == 1
+    assert stats.throughput > 0
+    await client.aclose()
+
+
+async def test_bulk_indexer_request_failure(api_key, respx_mock):
+    respx_mock.post(IMPORT_URL).mock(return_value=httpx.Response(400))
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key
+    ))
+    async with BulkIndexer(client.collections["fruits"].documents) as indexer:
+        await indexer.add({"id": "1", "name": "apple"})
+        await indexer.add({"id": "2", "name": "pear"})
+
+    assert indexer.stats.failed == 2
+    assert [doc["id"] for doc, _ in indexer.stats.failures] == ["1", "2"]
+    await client.aclose()
+
+
+async def test_bulk_indexer_encoding_failure(api_key, respx_mock):
+    route = respx_mock.post(IMPORT_URL).mock(side_effect=import_documents)
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key
+    ))
+    unencodable = {"id": "2", "name": object()}
+    async with BulkIndexer(
+            client.collections["fruits"].documents,
+            batch_size=2, max_pending=1) as indexer:
+        await indexer.add({"id": "1", "name": "apple"})
+        await indexer.add(unencodable)
+        await indexer.add({"id": "3", "name": "pear"})
+
+    stats = indexer.stats
+    assert route.call_count == 1
+    assert orjson.loads(
+        route.calls.last.request.content.split(b"\n")[1]
+    ) == {"id": "3", "name": "pear"}
+    assert stats.succeeded == 2
+    assert stats.failed == 1
+    [(document, result)] = stats.failures
+    assert document is unencodable
+    assert result["success"] is False
+    assert result["error"].startswith("Not encodable:")
+    await client.aclose()
+
+
+async def test_bulk_indexer_crash_does_not_block(api_key):
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key
+    ))
+    indexer = BulkIndexer(
+        client.collections["fruits"].documents, batch_size=1, max_pending=1
+    )
+
+    async def flush(*args):
+        await asyncio.sleep(0.05)
+        raise RuntimeError('Crashed.')
+
+    # The producer waits on a full queue when the batcher crashes.
+    with mock.patch.object(indexer, "flush", side_effect=flush):
+        with pytest.raises(RuntimeError):
+            for idx in range(3):
+                await asyncio.wait_for(
+                    indexer.add({"id": str(idx)}), timeout=1
+                )
+    await client.aclose()
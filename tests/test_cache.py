@@ -0,0 +1,151 @@
+import asyncio
+import httpx
+from unittest import mock
+from typesense_aio.cache import SearchCache
+from typesense_aio.client import Client
+from typesense_aio.config import Configuration
+
+
+SEARCH_URL = "http://test.com:80/collections/fruits/documents/search"
+
+
+def test_cache_key_normalization():
+    key = SearchCache.make_key(
+        ["fruits"], {"q": "apple", "query_by": "name", "page": None}
+    )
+    assert key == SearchCache.make_key(
+        ["fruits"], {"query_by": "name", "q": "apple"}
+    )
+    assert key != SearchCache.make_key(["veggies"], {
+        "query_by": "name", "q": "apple"
+    })
+
+
+def test_cache_lru_eviction():
+    cache = SearchCache(ttl=60, max_entries=2, max_bytes=10)
+    cache.set(b"a", ["fruits"], b"123")
+    cache.set(b"b", ["fruits"], b"456")
+    assert cache.get(b"a") == b"123"
+
+    cache.set(b"c", ["fruits"], b"789")
+    assert len(cache) == 2
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == b"123"
+
+    cache.set(b"d", ["fruits"], b"abcdefg")
+    assert cache.size == 10
+    assert list(cache.entries) == [b"a", b"d"]
+
+    cache.set(b"e", ["fruits"], b"too large value")
+    assert cache.get(b"e") is None
+    assert cache.hits == 2
+    assert cache.misses == 2
+
+
+def test_cache_ttl():
+    cache = SearchCache(ttl=10)
+    with mock.patch("typesense_aio.cache.monotonic", return_value=100):
+        cache.set(b"a", ["fruits"], b"123")
+    with mock.patch("typesense_aio.cache.monotonic", return_value=105):
+        assert cache.get(b"a") == b"123"
+    with mock.patch("typesense_aio.cache.monotonic", return_value=110):
+        assert cache.get(b"a") is None
+    assert cache.size == 0
+
+
+async def test_search_cache(api_key, respx_mock):
+    route = respx_mock.get(SEARCH_URL).mock(
+        return_value=httpx.Response(200, content=b'{"found": 1}')
+    )
+    respx_mock.post(
+        "http://test.com:80/collections/fruits/documents"
+    ).mock(return_value=httpx.Response(201, content=b'{"id": "1"}'))
+
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key, cache_ttl=60
+    ))
+    documents = client.collections["fruits"].documents
+    assert await documents.search(q="*", query_by="name") == {"found": 1}
+    assert await documents.search(q="*", query_by=["name"]) == {"found": 1}
+    assert route.call_count == 1
+    assert client.requester.cache.hits == 1
+
+    await documents.create({"id": "1"})
+    assert len(client.requester.cache) == 0
+    assert await documents.search(q="*", query_by="name") == {"found": 1}
+    assert route.call_count == 2
+    await client.aclose()
+
+
+async def test_multi_search_cache(api_key, respx_mock):
+    route = respx_mock.post("http://test.com:80/multi_search").mock(
+        return_value=httpx.Response(200, content=b'{"results": []}')
+    )
+    respx_mock.delete(
+        "http://test.com:80/collections/veggies/documents/1"
+    ).mock(return_value=httpx.Response(200, content=b'{"id": "1"}'))
+
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key, cache_ttl=60
+    ))
+    searches = {"searches": [
+        {"collection": "fruits", "q": "*"},
+        {"collection": "veggies", "q": "*"},
+    ]}
+    await client.multi_search.perform(searches, {"query_by": "name"})
+    await client.multi_search.perform(searches, {"query_by": "name"})
+    assert route.call_count == 1
+
+    await client.collections["veggies"].documents["1"].delete()
+    await client.multi_search.perform(searches, {"query_by": "name"})
+    assert route.call_count == 2
+    await client.aclose()
+
+
+async def test_search_cache_write_race(api_key, respx_mock):
+    release = asyncio.Event()
+
+    async def search(request):
+        await release.wait()
+        return httpx.Response(200, content=b'{"found": 0}')
+
+    route = respx_mock.get(SEARCH_URL).mock(side_effect=search)
+    respx_mock.post(
+        "http://test.com:80/collections/fruits/documents"
+    ).mock(return_value=httpx.Response(201, content=b'{"id": "1"}'))
+
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key, cache_ttl=60
+    ))
+    documents = client.collections["fruits"].documents
+    searching = asyncio.ensure_future(documents.search(q="*"))
+    await asyncio.sleep(0.01)
+    await documents.create({"id": "1"})
+    release.set()
+    # Loaded before the write completed: not cached.
+    assert await searching == {"found": 0}
+    assert len(client.requester.cache) == 0
+    await documents.search(q="*")
+    assert route.call_count == 2
+    await client.aclose()
+
+
+async def test_search_cache_alias(api_key, respx_mock):
+    route = respx_mock.get(
+        "http://test.com:80/collections/food/documents/search"
+    ).mock(return_value=httpx.Response(200, content=b'{"found": 1}'))
+    respx_mock.put("http://test.com:80/aliases/food").mock(
+        return_value=httpx.Response(200, content=b'{"name": "food"}')
+    )
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key, cache_ttl=60
+    ))
+    documents = client.collections["food"].documents
+    await documents.search(q="*")
+    await documents.search(q="*")
+    assert route.call_count == 1
+
+    await client.aliases["food"].upsert({"collection_name": "fruits"})
+    await documents.search(q="*")
+    assert route.call_count == 2
+    await client.aclose()
@@ -0,0 +1,83 @@
+import asyncio
+import httpx
+import orjson
+from typesense_aio.client import Client
+from typesense_aio.config import Configuration
+from typesense_aio.exc import RequestMalformed
+
+
+def multi_search(request):
+    results = []
+    for search in orjson.loads(request.read())["searches"]:
+        if search["q"] == "bad":
+            results.append({"code": 400, "error": "Bad query."})
+        elif search["collection"] == "unknown":
+            results.append({"code": 404, "error": "Not found."})
+        else:
+            results.append({"found": 1, "q": search["q"]})
+    return httpx.Response(200, content=orjson.dumps({"results": results}))
+
+
+async def test_coalesce_searches(api_key, respx_mock):
+    route = respx_mock.post("http://test.com:80/multi_search").mock(
+        side_effect=multi_search
+    )
+    client = Client(Configuration(
+        urls=["http://test.com:80"],
+        api_key=api_key,
+        coalesce_window=0.01,
+        coalesce_max_batch=3
+    ))
+    fruits = client.collections["fruits"].documents
+    results = await asyncio.gather(
+        fruits.search(q="apple", query_by="name"),
+        fruits.search(q="pear", query_by="name"),
+        client.collections["unknown"].documents.search(q="kiwi"),
+        fruits.search(q="bad", query_by="name"),
+        fruits.search(q="plum", query_by="name"),
+        return_exceptions=True
+    )
+    assert route.call_count == 2
+    assert results[0] == {"found": 1, "q": "apple"}
+    assert results[1] == {"found": 1, "q": "pear"}
+    assert results[2] is None
+    assert isinstance(results[3], RequestMalformed)
+    assert results[4] == {"found": 1, "q": "plum"}
+
+    searches = orjson.loads(route.calls[0].request.read())["searches"]
+    assert searches[0] == {
+        "q": "apple", "query_by": "name", "collection": "fruits"
+    }
+    await client.aclose()
+
+
+async def test_coalesce_single_search(api_key, respx_mock):
+    multi = respx_mock.post("http://test.com:80/multi_search")
+    single = respx_mock.get(
+        "http://test.com:80/collections/fruits/documents/search"
+    ).mock(return_value=httpx.Response(200, content=b'{"found": 2}'))
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key, coalesce_window=0.01
+    ))
+    result = await client.collections["fruits"].documents.search(q="*")
+    assert result == {"found": 2}
+    assert single.call_count == 1
+    assert multi.call_count == 0
+    await client.aclose()
+
+
+async def test_coalesce_request_failure(api_key, respx_mock):
+    respx_mock.post("http://test.com:80/multi_search").mock(
+        return_value=httpx.Response(400, content=b'Bad')
+    )
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key, coalesce_window=0.01
+    ))
+    fruits = client.collections["fruits"].documents
+    results = await asyncio.gather(
+        fruits.search(q="apple"),
+        fruits.search(q="pear"),
+        return_exceptions=True
+    )
+    assert all(isinstance(result, RequestMalformed) for result in results)
+    await client.aclose()
@@ -0,0 +1,75 @@
+import gzip
+import httpx
+from typesense_aio.compression import gzip_bytes, gzip_stream
+from typesense_aio.config import Configuration
+from typesense_aio.requester import Requester
+
+
+async def test_gzip_stream():
+
+    async def chunks():
+        yield b'{"id":"1"}'
+        yield b'\n{"id":"2"}'
+
+    compressed = b''.join([chunk async for chunk in gzip_stream(chunks())])
+    assert gzip.decompress(compressed) == b'{"id":"1"}\n{"id":"2"}'
+    assert gzip.decompress(gzip_bytes(b'abc')) == b'abc'
+    assert gzip_bytes(b'abc') == gzip_bytes(b'abc')
+
+
+async def test_response_decompression(api_key, respx_mock):
+    route = respx_mock.get("http://test.com:80/collections").mock(
+        return_value=httpx.Response(
+            200,
+            content=gzip.compress(b'[{"name": "fruits"}]'),
+            headers={'Content-Encoding': 'gzip'}
+        )
+    )
+    requester = Requester(Configuration(
+        urls=["http://test.com:80"], api_key=api_key
+    ))
+    assert await requester.get('/collections') == [{"name": "fruits"}]
+    assert 'gzip' in route.calls.last.request.headers['Accept-Encoding']
+    await requester.aclose()
+
+    requester = Requester(Configuration(
+        urls=["http://test.com:80"],
+        api_key=api_key,
+        response_compression=False
+    ))
+    await requester.get('/collections')
+    assert route.calls.last.request.headers['Accept-Encoding'] == 'identity'
+    await requester.aclose()
+
+
+async def test_request_compression(api_key, respx_mock):
+    route = respx_mock.post("http://test.com:80/collections").mock(
+        return_value=httpx.Response(200, content=b'{}')
+    )
+    requester = Requester(Configuration(
+        urls=["http://test.com:80"],
+        api_key=api_key,
+        request_compression_threshold=100
+    ))
+    await requester.post('/collections', data={"name": "fruits"})
+    request = route.calls.last.request
+    assert 'Content-Encoding' not in request.headers
+    assert request.content == b'{"name":"fruits"}'
+
+    document = {"name": "fruits", "fields": ["name"] * 50}
+    await requester.post('/collections', data=document)
+    request = route.calls.last.request
+    assert request.headers['Content-Encoding'] == 'gzip'
+    assert request.headers['Content-Type'] == 'application/json'
+    assert gzip.decompress(request.content) == requester.encoder(document)
+
+    async def chunks():
+        yield b'{"id":"1"}'
+
+    async with requester.stream(
+            'POST', '/collections', data=chunks()) as response:
+        await response.aread()
+    request = route.calls.last.request
+    assert request.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(request.read()) == b'{"id":"1"}'
+    await requester.aclose()
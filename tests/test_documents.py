@@ -1,6 +1,12 @@
 import httpx
+import orjson
 import pytest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from unittest import mock
+from typesense_aio.client import Client
+from typesense_aio.config import Configuration
+from typesense_aio.documents import iter_jsonl_parallel
+from typesense_aio.exc import ServiceUnavailable
 
 
 class TestDocuments:
@@ -82,3 +88,216 @@ class TestDocuments:
 
             with pytest.raises(httpx.HTTPStatusError):
                 await document_obj.retrieve()
+
+
+async def test_import_streaming(api_key, respx_mock):
+    received = []
+
+    def import_documents(request):
+        received.append(request.read())
+        return httpx.Response(
+            200,
+            content=b'{"success":true}\n{"success":false,"error":"Bad"}'
+        )
+
+    respx_mock.post(
+        "http://test.com:80/collections/fruits/documents/import"
+    ).mock(side_effect=import_documents)
+
+    async def documents():
+        for idx in range(3):
+            yield {"id": str(idx), "name": "apple"}
+
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key
+    ))
+    collection = client.collections["fruits"]
+    results = [
+        result async for result in collection.documents.import_iter(
+            documents(), chunk_size=16
+        )
+    ]
+    assert results == [
+        {"success": True},
+        {"success": False, "error": "Bad"}
+    ]
+    assert received == [
+        b'{"id":"0","name":"apple"}\n'
+        b'{"id":"1","name":"apple"}\n'
+        b'{"id":"2","name":"apple"}'
+    ]
+
+    results = await collection.documents.import_(
+        [{"id": "3", "name": "pear"}]
+    )
+    assert results == [
+        {"success": True},
+        {"success": False, "error": "Bad"}
+    ]
+    await client.aclose()
+
+
+async def test_import_retries(api_key, respx_mock):
+    received = []
+
+    def import_documents(request):
+        received.append(request.read())
+        if len(received) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, content=b'{"success":true}')
+
+    route = respx_mock.post(
+        "http://test.com:80/collections/fruits/documents/import"
+    ).mock(side_effect=import_documents)
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key, retry_interval=0.01
+    ))
+    documents = client.collections["fruits"].documents
+    assert await documents.import_([{"id": "1"}]) == [{"success": True}]
+    assert received == [b'{"id":"1"}', b'{"id":"1"}']
+
+    async def stream():
+        yield {"id": "2"}
+
+    # A streamed body is sent once.
+    received.clear()
+    with pytest.raises(ServiceUnavailable):
+        await documents.import_(stream())
+    assert received == [b'{"id":"2"}']
+
+    # Unless the connection failed, before any of it was sent.
+    route.mock(return_value=httpx.Response(200, content=b'{"success":true}'))
+    send = httpx.AsyncClient.send
+    attempts = []
+
+    async def refuse_once(http_client, request, **kwargs):
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("Refused.")
+        return await send(http_client, request, **kwargs)
+
+    route.reset()
+    with mock.patch.object(httpx.AsyncClient, "send", refuse_once):
+        assert await documents.import_(stream()) == [{"success": True}]
+    assert len(attempts) == 2
+    assert route.call_count == 1
+    assert route.calls.last.request.read() == b'{"id":"2"}'
+    await client.aclose()
+
+
+async def test_import_parallel_encoding(api_key, respx_mock):
+    received = []
+
+    def import_documents(request):
+        received.append(request.read())
+        return httpx.Response(200, content=b'{"success":true}\n' * 5)
+
+    respx_mock.post(
+        "http://test.com:80/collections/fruits/documents/import"
+    ).mock(side_effect=import_documents)
+
+    documents = [{"id": str(idx), "name": "apple"} for idx in range(5)]
+    with ThreadPoolExecutor(2) as executor:
+        client = Client(Configuration(
+            urls=["http://test.com:80"],
+            api_key=api_key,
+            encode_executor=executor,
+            encode_chunk_documents=2,
+            encode_concurrency=2
+        ))
+        encoder = mock.Mock(side_effect=orjson.dumps)
+        client.requester.encoder = encoder
+        summary = await client.collections["fruits"].documents \
+            .import_summary(documents)
+        await client.aclose()
+
+    assert summary.succeeded == 5
+    assert received == [b"\n".join(orjson.dumps(doc) for doc in documents)]
+    assert encoder.call_count == 5
+
+
+async def test_iter_jsonl_parallel():
+
+    async def documents():
+        for idx in range(7):
+            yield {"id": str(idx)}
+        yield b'{"id":"raw"}'
+
+    with ProcessPoolExecutor(2) as executor:
+        chunks = [
+            chunk async for chunk in iter_jsonl_parallel(
+                documents(), orjson.dumps, executor,
+                chunk_documents=3, concurrency=2
+            )
+        ]
+    assert chunks == [
+        b'{"id":"0"}\n{"id":"1"}\n{"id":"2"}',
+        b'\n{"id":"3"}\n{"id":"4"}\n{"id":"5"}',
+        b'\n{"id":"6"}\n{"id":"raw"}',
+    ]
+
+
+async def test_import_summary(api_key, respx_mock):
+    respx_mock.post(
+        "http://test.com:80/collections/fruits/documents/import"
+    ).mock(return_value=httpx.Response(200, content=(
+        b'{"success":true}\n'
+        b'{"code":400,"document":"{\\"id\\":\\"1\\",\\"name\\":1}",'
+        b'"error":"Bad JSON.","success":false}\n'
+        b'{"success":true,"id":"2"}\n'
+        b'{"code":409,"error":"Exists.","id":"3","success":false}\n'
+        b'{"code":400,"document":"{broken","error":"Bad","success":false}'
+    )))
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key
+    ))
+    decoder = mock.Mock(side_effect=client.requester.decoder)
+    client.requester.decoder = decoder
+    documents = client.collections["fruits"].documents
+    summary = await documents.import_summary(
+        [{"id": str(idx)} for idx in range(5)]
+    )
+    assert repr(summary) == '<ImportSummary succeeded=2 failed=3>'
+    assert not summary.ok
+    assert [(failure.index, failure.id) for failure in summary.failures] \
+        == [(1, "1"), (3, "3"), (4, None)]
+    assert summary.failures[1].result["error"] == "Exists."
+    # Successes are not decoded.
+    assert decoder.call_count == 5
+    await client.aclose()
+
+
+async def test_export_streaming(api_key, respx_mock):
+
+    async def chunks():
+        yield b'{"id":"1","name":"ap'
+        yield b'ple"}\n{"id":"2",'
+        yield b'"name":"pear"}'
+
+    route = respx_mock.get(
+        "http://test.com:80/collections/fruits/documents/export"
+    ).mock(side_effect=lambda request: httpx.Response(200, content=chunks()))
+
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key
+    ))
+    documents = client.collections["fruits"].documents
+    exported = [
+        document async for document in documents.export_iter(
+            filter_by="color:red", include_fields="id,name"
+        )
+    ]
+    assert exported == [
+        {"id": "1", "name": "apple"},
+        {"id": "2", "name": "pear"}
+    ]
+    assert route.calls.last.request.url.params == httpx.QueryParams({
+        "filter_by": "color:red", "include_fields": "id,name"
+    })
+
+    exported = [line async for line in documents.export_iter(raw=True)]
+    assert exported == [
+        b'{"id":"1","name":"apple"}',
+        b'{"id":"2","name":"pear"}'
+    ]
+    await client.aclose()
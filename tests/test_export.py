@@ -0,0 +1,149 @@
+import gzip
+import httpx
+import orjson
+import pytest
+from typesense_aio.client import Client
+from typesense_aio.config import Configuration
+from typesense_aio.exc import ExportIncomplete
+
+
+FRUITS = [{"id": str(year), "year": year} for year in range(1, 11)]
+
+
+def matching(filter_by: str):
+    # Understands the filters of partitioned exports only.
+    lower, upper = 0, float('inf')
+    for condition in filter_by.split(' && '):
+        if condition.startswith('year:>='):
+            lower = int(condition[7:])
+        elif condition.startswith('year:<'):
+            upper = int(condition[6:])
+    return [fruit for fruit in FRUITS if lower <= fruit["year"] < upper]
+
+
+class Server:
+
+    def __init__(self):
+        self.exports = []
+        # Partition whose first export fails midway.
+        self.failing: str | None = None
+
+
+@pytest.fixture
+def server(respx_mock):
+    server = Server()
+    exports = server.exports
+
+    def search(request):
+        order = request.url.params["sort_by"].split(':')[1]
+        fruit = FRUITS[0] if order == 'asc' else FRUITS[-1]
+        return httpx.Response(200, json={"hits": [{"document": fruit}]})
+
+    def export(request):
+        filter_by = request.url.params.get("filter_by")
+        exports.append(filter_by)
+        fruits = FRUITS if filter_by is None else matching(filter_by)
+        body = b'\n'.join(orjson.dumps(fruit) for fruit in fruits)
+
+        async def chunks():
+            yield body[:10]
+            if server.failing and filter_by == server.failing:
+                server.failing = None
+                raise httpx.ReadError('Connection lost.')
+            yield body[10:]
+
+        return httpx.Response(200, content=chunks())
+
+    respx_mock.get(
+        "http://test.com:80/collections/fruits/documents/search"
+    ).mock(side_effect=search)
+    respx_mock.get("http://test.com:80/collections/fruits").mock(
+        return_value=httpx.Response(200, json={
+            "name": "fruits", "num_documents": len(FRUITS)
+        })
+    )
+    respx_mock.get(
+        "http://test.com:80/collections/fruits/documents/export"
+    ).mock(side_effect=export)
+    return server
+
+
+async def test_export_to(api_key, server, tmp_path):
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key
+    ))
+    documents = client.collections["fruits"].documents
+    path = str(tmp_path / "fruits.jsonl")
+    assert await documents.export_to(path) == 10
+    with open(path, 'rb') as export:
+        assert export.read().splitlines() == [
+            orjson.dumps(fruit) for fruit in FRUITS
+        ]
+    assert server.exports == [None]
+    await client.aclose()
+
+
+async def test_export_to_resumes(api_key, server, tmp_path):
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key
+    ))
+    documents = client.collections["fruits"].documents
+    path = str(tmp_path / "fruits.jsonl.gz")
+    server.failing = 'year:>=5 && year:<9'
+    with pytest.raises(httpx.ReadError):
+        await documents.export_to(
+            path, compress=True, partition_by="year", partition_size=4
+        )
+    assert (tmp_path / "fruits.jsonl.gz.checkpoint").exists()
+
+    assert await documents.export_to(
+        path, compress=True, partition_by="year", partition_size=4
+    ) == 10
+    assert server.exports == [
+        'year:>=1 && year:<5',
+        'year:>=5 && year:<9',
+        'year:>=5 && year:<9',
+        'year:>=9',
+    ]
+    with gzip.open(path) as export:
+        assert export.read().splitlines() == [
+            orjson.dumps(fruit) for fruit in FRUITS
+        ]
+    assert not (tmp_path / "fruits.jsonl.gz.checkpoint").exists()
+
+    (tmp_path / "fruits.jsonl.gz.checkpoint").write_bytes(
+        b'{"field":"id","lower":1,"upper":2,"size":0,"exported":0}'
+    )
+    with pytest.raises(ValueError):
+        await documents.export_to(path, partition_by="year")
+    (tmp_path / "fruits.jsonl.gz.checkpoint").write_bytes(
+        b'{"field":"year","lower":1,"upper":2,"size":0,"exported":0,'
+        b'"compress":true}'
+    )
+    with pytest.raises(ValueError, match="is compressed"):
+        await documents.export_to(path, partition_by="year")
+    await client.aclose()
+
+
+async def test_export_to_missing_values(api_key, server, respx_mock,
+                                        tmp_path):
+    # A document without a year is in no partition.
+    respx_mock.get("http://test.com:80/collections/fruits").mock(
+        return_value=httpx.Response(200, json={
+            "name": "fruits", "num_documents": len(FRUITS) + 1
+        })
+    )
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key
+    ))
+    documents = client.collections["fruits"].documents
+    path = str(tmp_path / "fruits.jsonl")
+    with pytest.raises(ExportIncomplete):
+        await documents.export_to(
+            path, partition_by="year", partition_size=4
+        )
+    # Filtered, the count cannot be checked.
+    assert await documents.export_to(
+        path, filter_by="year:>0", partition_by="year", partition_size=4
+    ) == 10
+    await client.aclose()
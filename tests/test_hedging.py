@@ -0,0 +1,83 @@
+import asyncio
+import httpx
+from typesense_aio.balancing import RoundRobin
+from typesense_aio.config import Configuration
+from typesense_aio.hedging import LatencyWindow
+from typesense_aio.requester import Requester
+
+
+SLOW = "http://slow.com:8108"
+FAST = "http://fast.com:8108"
+
+
+def test_latency_window():
+    window = LatencyWindow(percentile=0.95, min_samples=10, refresh=10)
+    assert window.delay(0.5) == 0.5
+    for idx in range(100):
+        window.add(idx / 1000)
+    assert window.delay(0.5) == 0.095
+
+
+async def test_hedged_read(api_key, respx_mock):
+    cancelled = []
+
+    async def slow(request):
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(request)
+            raise
+        return httpx.Response(200, content=b'{"node": "slow"}')
+
+    respx_mock.get(f"{SLOW}/collections/fruits").mock(side_effect=slow)
+    respx_mock.get(f"{FAST}/collections/fruits").mock(
+        return_value=httpx.Response(200, content=b'{"node": "fast"}')
+    )
+    requester = Requester(Configuration(
+        urls=[SLOW, FAST],
+        api_key=api_key,
+        hedge_delay=0.02,
+        load_balancing=RoundRobin()
+    ))
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result = await requester.get('/collections/fruits', hedge=True)
+    assert result == {"node": "fast"}
+    assert loop.time() - started < 0.5
+    await asyncio.sleep(0)
+    assert len(cancelled) == 1
+    assert all(load.outstanding == 0 for load in requester.load.values())
+
+    # Requests without `hedge` are never duplicated.
+    started = loop.time()
+    result = await requester.get('/collections/fruits')
+    assert result == {"node": "fast"}
+    result = await requester.get('/collections/fruits')
+    assert result == {"node": "slow"}
+    assert loop.time() - started >= 1
+    await requester.aclose()
+
+
+async def test_hedged_read_failure(api_key, respx_mock):
+
+    async def failing(request):
+        await asyncio.sleep(0.05)
+        raise httpx.ConnectError("Unreachable")
+
+    async def slow(request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, content=b'{"node": "fast"}')
+
+    respx_mock.get(f"{SLOW}/collections/fruits").mock(side_effect=failing)
+    respx_mock.get(f"{FAST}/collections/fruits").mock(side_effect=slow)
+    requester = Requester(Configuration(
+        urls=[SLOW, FAST],
+        api_key=api_key,
+        hedge_delay=0.01,
+        hedge_percentile=0.95,
+        load_balancing=RoundRobin()
+    ))
+    result = await requester.get('/collections/fruits', hedge=True)
+    assert result == {"node": "fast"}
+    assert len(requester.latencies.samples) == 1
+    await requester.aclose()
@@ -1,3 +1,13 @@
+import httpx
+import pytest
+from typesense_aio.balancing import RoundRobin
+from typesense_aio.config import Configuration
+from typesense_aio.metrics import (
+    ClientMetrics, Registry, endpoint_class
+)
+from typesense_aio.requester import Requester
+
+
 class TestMetrics:
 
     async def test_get_metrics(self, typesense):
@@ -18,3 +28,124 @@ class TestMetrics:
             'typesense_memory_resident_bytes',
             'typesense_memory_retained_bytes'
         }
+
+
+def test_endpoint_class():
+    assert endpoint_class('/collections') == 'collections'
+    assert endpoint_class('/collections/books/documents/search') == \
+        'collections/{}/documents/search'
+    assert endpoint_class('/collections/books/documents/12') == \
+        'collections/{}/documents/{}'
+    assert endpoint_class('/keys/3') == 'keys/{}'
+
+
+def test_registry_exposition():
+    registry = Registry()
+    counter = registry.counter('requests_total', 'Requests.', ('node',))
+    counter.inc(('http://a"b',))
+    counter.inc(('http://a"b',), 2)
+    histogram = registry.histogram(
+        'latency_seconds', 'Latency.', buckets=(0.1, 1.0)
+    )
+    histogram.observe((), 0.1)
+    histogram.observe((), 0.5)
+    histogram.observe((), 3)
+    assert registry.expose() == (
+        '# HELP requests_total Requests.\n'
+        '# TYPE requests_total counter\n'
+        'requests_total{node="http://a\\"b"} 3\n'
+        '# HELP latency_seconds Latency.\n'
+        '# TYPE latency_seconds histogram\n'
+        'latency_seconds_bucket{le="0.1"} 1\n'
+        'latency_seconds_bucket{le="1"} 2\n'
+        'latency_seconds_bucket{le="+Inf"} 3\n'
+        'latency_seconds_sum 3.6\n'
+        'latency_seconds_count 3\n'
+    )
+    with pytest.raises(ValueError):
+        registry.counter('requests_total', 'Requests.')
+
+
+async def test_requester_metrics(api_key, respx_mock):
+    respx_mock.get("http://bad.com:8108/collections").mock(
+        return_value=httpx.Response(503)
+    )
+    respx_mock.get("http://good.com:8108/collections").mock(
+        return_value=httpx.Response(200, content=b'[]')
+    )
+    respx_mock.post("http://good.com:8108/collections").mock(
+        return_value=httpx.Response(201, content=b'{"name": "books"}')
+    )
+    transitions = []
+    metrics = ClientMetrics()
+    requester = Requester(Configuration(
+        urls=["http://bad.com:8108", "http://good.com:8108"],
+        api_key=api_key,
+        retry_interval=0.001,
+        load_balancing=RoundRobin(),
+        breaker_failure_threshold=1,
+        breaker_listener=lambda *args: transitions.append(args),
+        metrics=metrics
+    ))
+    assert await requester.get('/collections') == []
+    await requester.post('/collections', data={"name": "books"})
+
+    assert metrics.latency.count(('collections', 'GET', '503')) == 1
+    assert metrics.latency.count(('collections', 'GET', '200')) == 1
+    assert metrics.latency.count(('collections', 'POST', '201')) == 1
+    assert metrics.retries.get(('collections',)) == 1
+    assert metrics.sent.get(('collections',)) == len(b'{"name":"books"}')
+    assert metrics.received.get(('collections',)) == \
+        len(b'[]') + len(b'{"name": "books"}')
+    assert metrics.inflight.get(('http://bad.com:8108',)) == 0
+    assert metrics.inflight.get(('http://good.com:8108',)) == 0
+    # The breaker listener of the configuration is still notified.
+    assert transitions == [('http://bad.com:8108', 'closed', 'open')]
+    assert metrics.transitions.get(('http://bad.com:8108', 'open')) == 1
+    assert 'typesense_client_retries_total{endpoint="collections"} 1' \
+        in metrics.expose()
+    await requester.aclose()
+
+
+async def test_requester_metrics_errors(api_key, respx_mock):
+    respx_mock.get("http://test.com:80/health").mock(
+        side_effect=httpx.ConnectError
+    )
+    metrics = ClientMetrics()
+    requester = Requester(Configuration(
+        urls=["http://test.com:80"],
+        api_key=api_key,
+        retries=1,
+        metrics=metrics
+    ))
+    with pytest.raises(httpx.ConnectError):
+        await requester.get('/health')
+    assert metrics.latency.count(('health', 'GET', 'ConnectError')) == 1
+    assert metrics.inflight.get(('http://test.com:80',)) == 0
+    await requester.aclose()
+
+
+async def test_stream_metrics(api_key, respx_mock):
+    respx_mock.post(
+        "http://test.com:80/collections/books/documents/import"
+    ).mock(
+        return_value=httpx.Response(200, content=b'{"success":true}')
+    )
+    metrics = ClientMetrics()
+    requester = Requester(Configuration(
+        urls=["http://test.com:80"], api_key=api_key, metrics=metrics
+    ))
+
+    async def chunks():
+        yield b'{"id":"1"}'
+        yield b'\n{"id":"2"}'
+
+    async with requester.stream(
+        'POST', '/collections/books/documents/import', data=chunks()
+    ) as response:
+        assert await response.aread() == b'{"success":true}'
+    labels = ('collections/{}/documents/import',)
+    assert metrics.sent.get(labels) == 21
+    assert metrics.received.get(labels) == 16
+    assert metrics.latency.count((*labels, 'POST', '200')) == 1
+    await requester.aclose()
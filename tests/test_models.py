@@ -0,0 +1,104 @@
+import dataclasses
+import httpx
+import pytest
+from unittest import mock
+from typesense_aio.collections import Collection
+from typesense_aio.config import Configuration
+from typesense_aio.models import ModelCodec
+from typesense_aio.requester import Requester
+
+
+SEARCH_URL = "http://test.com:80/collections/fruits/documents/search"
+BODY = (
+    b'{"found": 1, "search_time_ms": 1, "hits": [{"document": '
+    b'{"id": "1", "name": "apple", "color": "red"}, "highlights": []}]}'
+)
+
+
+@dataclasses.dataclass(slots=True)
+class Fruit:
+    id: str
+    name: str
+
+
+def test_dataclass_codec_without_msgspec():
+    with mock.patch("typesense_aio.models.msgspec", None):
+        codec = ModelCodec(Fruit)
+        result = codec.search(BODY)
+        assert codec.document(b'{"id": "2", "name": "pear"}') == \
+            Fruit("2", "pear")
+        with pytest.raises(TypeError):
+            ModelCodec(dict)
+    assert result["found"] == 1
+    assert result["hits"][0]["document"] == Fruit("1", "apple")
+    assert result["hits"][0]["highlights"] == []
+
+
+def test_msgspec_codec():
+    msgspec = pytest.importorskip("msgspec")
+
+    class Struct(msgspec.Struct):
+        id: str
+        name: str
+
+    for model in (Fruit, Struct):
+        codec = ModelCodec(model)
+        result = codec.search(BODY)
+        # Keys missing from the response are left out.
+        assert set(result) == {"found", "search_time_ms", "hits"}
+        hit = result["hits"][0]
+        assert hit["document"] == model(id="1", name="apple")
+        assert hit["highlights"] == []
+        with pytest.raises(KeyError):
+            hit["unknown"]
+        assert codec.convert({
+            "found": 1,
+            "hits": [{"document": {"id": "1", "name": "apple"}}]
+        })["hits"][0]["document"] == model(id="1", name="apple")
+
+
+async def test_lazy_typed_search(api_key, respx_mock):
+    pytest.importorskip("msgspec")
+    respx_mock.get(SEARCH_URL).mock(
+        return_value=httpx.Response(200, content=BODY)
+    )
+    requester = Requester(Configuration(
+        urls=["http://test.com:80"], api_key=api_key, lazy_search=True
+    ))
+    documents = Collection(requester, "fruits", Fruit).documents
+    result = await documents.search("apple", query_by="name")
+    assert result["found"] == 1
+    assert result["hits"][0]["document"] == Fruit("1", "apple")
+    await requester.aclose()
+
+
+async def test_typed_collection(api_key, respx_mock):
+    respx_mock.get(SEARCH_URL).mock(
+        return_value=httpx.Response(200, content=BODY)
+    )
+    respx_mock.get(
+        "http://test.com:80/collections/fruits/documents/1"
+    ).mock(return_value=httpx.Response(
+        200, content=b'{"id": "1", "name": "apple"}'
+    ))
+    respx_mock.get(
+        "http://test.com:80/collections/fruits/documents/2"
+    ).mock(return_value=httpx.Response(404))
+    respx_mock.get(
+        "http://test.com:80/collections/fruits/documents/export"
+    ).mock(return_value=httpx.Response(
+        200, content=b'{"id": "1", "name": "apple"}\n'
+                     b'{"id": "2", "name": "pear"}'
+    ))
+    requester = Requester(Configuration(
+        urls=["http://test.com:80"], api_key=api_key
+    ))
+    documents = Collection(requester, "fruits", model=Fruit).documents
+    result = await documents.search("apple", query_by="name")
+    assert result["hits"][0]["document"] == Fruit("1", "apple")
+    assert await documents["1"].retrieve() == Fruit("1", "apple")
+    assert await documents["2"].retrieve() is None
+    assert [fruit async for fruit in documents.export_iter()] == [
+        Fruit("1", "apple"), Fruit("2", "pear")
+    ]
+    await requester.aclose()
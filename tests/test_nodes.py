@@ -134,7 +134,9 @@ async def test_requester_bad_nodes_quarantine(api_key, respx_mock):
             "http://example.com:12345/",
         ],
         api_key=api_key,
-        timeout=0.5
+        timeout=0.5,
+        breaker_failure_threshold=1,
+        breaker_open_interval=10
     )
     requester = Requester(config)
     assert len(requester.nodes.sane) == 2
@@ -149,6 +151,7 @@ async def test_requester_bad_nodes_quarantine(api_key, respx_mock):
 
     assert requester.nodes.get() is None
     assert len(requester.nodes.quarantined) == 2
+    await requester.aclose()
 
 
 @pytest.mark.async_timeout(10)
@@ -168,7 +171,9 @@ async def test_requester_quarantine_task(api_key, respx_mock):
         ],
         api_key=api_key,
         timeout=0.5,
-        healthcheck_interval=1
+        healthcheck_interval=1,
+        breaker_failure_threshold=1,
+        breaker_open_interval=10
     )
     requester = Requester(config)
 
@@ -183,7 +188,9 @@ async def test_requester_quarantine_task(api_key, respx_mock):
     )
     await asyncio.sleep(2)
     assert len(requester.nodes.quarantined) == 1
-    assert len(requester.nodes.timers) == 1
+    assert len(requester.nodes.scheduled) == 1
+    await requester.aclose()
+    assert len(requester.nodes.scheduled) == 0
 
 
 async def test_requester_verify_https(api_key, httpserver, server_cert):
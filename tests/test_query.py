@@ -0,0 +1,76 @@
+import httpx
+import pytest
+from typesense_aio.client import Client
+from typesense_aio.config import Configuration
+from typesense_aio.exc import InvalidParameter
+from typesense_aio.query import SearchQuery
+
+
+SEARCH_URL = "http://test.com:80/collections/fruits/documents/search"
+
+
+def test_search_query():
+    query = SearchQuery(
+        query_by=["name", "description"],
+        query_by_weights=[2, 1],
+        filter_by="price:>10 && color:=[red, green]",
+        prefix=False,
+        per_page=20,
+        facet_by=None
+    )
+    assert query.params == {
+        "query_by": "name,description",
+        "query_by_weights": "2,1",
+        "filter_by": "price:>10 && color:=[red, green]",
+        "prefix": False,
+        "per_page": 20
+    }
+    assert query.encoded == (
+        "query_by=name%2Cdescription&query_by_weights=2%2C1"
+        "&filter_by=price%3A%3E10%20%26%26%20color%3A%3D%5Bred%2C"
+        "%20green%5D&prefix=false&per_page=20"
+    )
+    assert httpx.QueryParams(query.query_string({"q": "a&b"})) == \
+        httpx.QueryParams({**query.params, "q": "a&b"})
+    assert SearchQuery().query_string({"q": "*"}) == "q=%2A"
+
+    with pytest.raises(InvalidParameter):
+        SearchQuery(query_by="name", per_pages=20)
+    with pytest.raises(InvalidParameter):
+        query.query_string({"per_page": 10})
+
+
+async def test_bound_search_query(api_key, respx_mock):
+    route = respx_mock.get(SEARCH_URL).mock(
+        return_value=httpx.Response(200, content=b'{"found": 1}')
+    )
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key
+    ))
+    documents = client.collections["fruits"].documents
+    search = documents.query(query_by="name", per_page=10)
+    assert repr(search) == \
+        '<BoundSearchQuery fruits query_by=name&per_page=10>'
+    assert await search(q="apple", page=2) == {"found": 1}
+    assert dict(route.calls.last.request.url.params) == {
+        "query_by": "name", "per_page": "10", "q": "apple", "page": "2"
+    }
+    with pytest.raises(InvalidParameter):
+        await search(q="apple", pages=2)
+    await client.aclose()
+
+
+async def test_bound_search_query_cache(api_key, respx_mock):
+    route = respx_mock.get(SEARCH_URL).mock(
+        return_value=httpx.Response(200, content=b'{"found": 1}')
+    )
+    client = Client(Configuration(
+        urls=["http://test.com:80"], api_key=api_key, cache_ttl=60
+    ))
+    documents = client.collections["fruits"].documents
+    search = SearchQuery(query_by="name").bind(documents)
+    assert await search(q="apple") == {"found": 1}
+    # Same entry as the equivalent search.
+    assert await documents.search("apple", query_by="name") == {"found": 1}
+    assert route.call_count == 1
+    await client.aclose()
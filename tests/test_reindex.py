@@ -0,0 +1,110 @@
+import httpx
+import orjson
+import pytest
+from typesense_aio.client import Client
+from typesense_aio.config import Configuration
+from typesense_aio.exc import ReindexFailed
+from typesense_aio.reindex import reindex
+
+
+URL = "http://test.com:80"
+FRUITS = [{"id": str(idx), "name": f"fruit {idx}"} for idx in range(5)]
+
+
+@pytest.fixture
+def server(respx_mock):
+    imported = []
+
+    def import_documents(request):
+        lines = request.read().split(b"\n")
+        imported.extend(orjson.loads(line) for line in lines)
+        return httpx.Response(
+            200, content=b"\n".join([b'{"success":true}'] * len(lines))
+        )
+
+    respx_mock.get(f"{URL}/aliases/fruits").mock(
+        return_value=httpx.Response(200, json={
+            "name": "fruits", "collection_name": "fruits_v1"
+        })
+    )
+    respx_mock.post(f"{URL}/collections").mock(
+        return_value=httpx.Response(201, json={"name": "fruits_v2"})
+    )
+    respx_mock.get(f"{URL}/collections/fruits_v1/documents/export").mock(
+        return_value=httpx.Response(
+            200, content=b"\n".join(orjson.dumps(f) for f in FRUITS)
+        )
+    )
+    respx_mock.post(f"{URL}/collections/fruits_v2/documents/import").mock(
+        side_effect=import_documents
+    )
+    respx_mock.get(f"{URL}/collections/fruits_v2").mock(
+        side_effect=lambda request: httpx.Response(200, json={
+            "name": "fruits_v2", "num_documents": len(imported)
+        })
+    )
+    return imported
+
+
+async def test_reindex(api_key, respx_mock, server):
+    alias = respx_mock.put(f"{URL}/aliases/fruits").mock(
+        return_value=httpx.Response(200, json={})
+    )
+    drop = respx_mock.delete(f"{URL}/collections/fruits_v1").mock(
+        return_value=httpx.Response(200, json={})
+    )
+    client = Client(Configuration(urls=[URL], api_key=api_key))
+
+    def transform(fruit):
+        if fruit["id"] == "4":
+            return None
+        return fruit | {"name": fruit["name"].upper()}
+
+    result = await reindex(
+        client, "fruits", {"name": "fruits_v2", "fields": []},
+        transform=transform, batch_size=2, drop_source=True
+    )
+    assert result.source == "fruits_v1"
+    assert result.target == "fruits_v2"
+    assert result.exported == 5
+    assert result.stats.succeeded == 4
+    assert result.stats.batches == 2
+    assert sorted(fruit["name"] for fruit in server) == [
+        "FRUIT 0", "FRUIT 1", "FRUIT 2", "FRUIT 3"
+    ]
+    assert orjson.loads(alias.calls.last.request.content) == {
+        "collection_name": "fruits_v2"
+    }
+    assert drop.called
+    await client.aclose()
+
+
+async def test_reindex_count_mismatch(api_key, respx_mock, server):
+    alias = respx_mock.put(f"{URL}/aliases/fruits")
+    respx_mock.get(f"{URL}/collections/fruits_v2").mock(
+        return_value=httpx.Response(200, json={
+            "name": "fruits_v2", "num_documents": 3
+        })
+    )
+    client = Client(Configuration(urls=[URL], api_key=api_key))
+    with pytest.raises(ReindexFailed):
+        await reindex(
+            client, "fruits", {"name": "fruits_v2", "fields": []},
+            source="fruits_v1"
+        )
+    # The raw export lines are imported as they are.
+    assert server == FRUITS
+    assert not alias.called
+    await client.aclose()
+
+
+async def test_reindex_missing_alias(api_key, respx_mock):
+    respx_mock.get(f"{URL}/aliases/fruits").mock(
+        return_value=httpx.Response(404, json={"message": "Not Found"})
+    )
+    create = respx_mock.post(f"{URL}/collections")
+    client = Client(Configuration(urls=[URL], api_key=api_key))
+    with pytest.raises(ReindexFailed, match="Alias fruits does not exist"):
+        await reindex(client, "fruits", {"name": "fruits_v2", "fields": []})
+    assert not create.called
+    await client.aclose()
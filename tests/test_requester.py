@@ -0,0 +1,181 @@
+import asyncio
+import httpx
+import pytest
+from unittest import mock
+from typesense_aio.client import Client
+from typesense_aio.config import Configuration
+from typesense_aio.exc import Timeout
+from typesense_aio.requester import Requester
+
+
+good_response = httpx.Response(
+    200,
+    content=b'{"ok": true}',
+    headers={'Content-Type': "application/json"}
+)
+
+
+async def test_requester_reuses_connections(api_key, respx_mock):
+    respx_mock.get("http://test.com:80/health").mock(
+        return_value=good_response
+    )
+    config = Configuration(
+        urls=["http://test.com:80"],
+        api_key=api_key,
+        pool_max_connections=4
+    )
+    requester = Requester(config)
+    assert await requester.get('/health') == {"ok": True}
+
+    node = requester.nodes.get()
+    http_client = requester.pool.clients[node]
+    assert await requester.get('/health') == {"ok": True}
+    assert requester.pool.clients[node] is http_client
+    assert len(requester.pool.clients) == 1
+
+    await requester.aclose()
+    assert http_client.is_closed
+    assert requester.pool.clients == {}
+
+
+async def test_requester_http_versions(api_key):
+    requester = Requester(Configuration(
+        urls=["http://test.com:80"],
+        api_key=api_key
+    ))
+    pool = requester.pool.get(requester.nodes.get())._transport._pool
+    assert pool._http1 is True
+    assert pool._http2 is False
+    await requester.aclose()
+
+    pytest.importorskip('h2')
+    requester = Requester(Configuration(
+        urls=["http://test.com:80"],
+        api_key=api_key,
+        http1=False,
+        http2=True
+    ))
+    pool = requester.pool.get(requester.nodes.get())._transport._pool
+    assert pool._http1 is False
+    assert pool._http2 is True
+    await requester.aclose()
+
+
+async def test_client_context_manager(api_key, respx_mock):
+    respx_mock.get("http://test.com:80/health").mock(
+        return_value=good_response
+    )
+    config = Configuration(urls=["http://test.com:80"], api_key=api_key)
+    async with Client(config) as client:
+        assert await client.health.check() == {"ok": True}
+        pool = client.requester.pool
+        assert len(pool.clients) == 1
+        http_client = next(iter(pool.clients.values()))
+
+    assert http_client.is_closed
+
+
+async def test_requester_singleflight(api_key, respx_mock):
+    calls = []
+
+    async def slow_search(request):
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, content=b'{"found": 1}')
+
+    respx_mock.get(
+        "http://test.com:80/collections/fruits/documents/search"
+    ).mock(side_effect=slow_search)
+    config = Configuration(
+        urls=["http://test.com:80"], api_key=api_key, singleflight=True
+    )
+    requester = Requester(config)
+    endpoint = '/collections/fruits/documents/search'
+    results = await asyncio.gather(
+        requester.get(endpoint, params={"q": "*", "query_by": "name"}),
+        requester.get(endpoint, params={"query_by": "name", "q": "*"}),
+        requester.get(endpoint, params={"q": "apple"}),
+        requester.get(endpoint, params={"q": "*", "query_by": "name"},
+                      as_json=False),
+    )
+    assert len(calls) == 3
+    assert results[0] is results[1]
+    assert results[2] == {"found": 1}
+    assert results[3] == b'{"found": 1}'
+    assert requester.inflight == {}
+
+    await requester.get(endpoint, params={"q": "*", "query_by": "name"})
+    assert len(calls) == 4
+    await requester.aclose()
+
+
+async def test_requester_singleflight_cancellation(api_key, respx_mock):
+
+    async def slow_search(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, content=b'{"found": 1}')
+
+    respx_mock.get("http://test.com:80/collections").mock(
+        side_effect=slow_search
+    )
+    config = Configuration(
+        urls=["http://test.com:80"], api_key=api_key, singleflight=True
+    )
+    requester = Requester(config)
+    first = asyncio.ensure_future(requester.get('/collections'))
+    second = asyncio.ensure_future(requester.get('/collections'))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    assert await second == {"found": 1}
+    await requester.aclose()
+
+
+async def test_requester_timeout_budget(api_key, respx_mock):
+    timeouts = []
+
+    async def slow_search(request):
+        timeouts.append(request.extensions["timeout"]["read"])
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, content=b'{"found": 1}')
+
+    respx_mock.get("http://test.com:80/collections").mock(
+        side_effect=slow_search
+    )
+    config = Configuration(urls=["http://test.com:80"], api_key=api_key)
+    requester = Requester(config)
+    with mock.patch.object(requester, "handle_faulty_node") as faulty:
+        with pytest.raises(Timeout):
+            await requester.get('/collections', timeout_budget=0.05)
+    # The attempt timeout is cut to the remaining budget.
+    assert timeouts[0] <= 0.05
+    # Running out of time is not the fault of the node.
+    assert not faulty.called
+
+    with pytest.raises(Timeout):
+        await requester.get('/collections', timeout_budget=0)
+    assert len(timeouts) == 1
+    await requester.aclose()
+
+
+async def test_requester_singleflight_timeout_budget(api_key, respx_mock):
+
+    async def slow_search(request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, content=b'{"found": 1}')
+
+    respx_mock.get("http://test.com:80/collections").mock(
+        side_effect=slow_search
+    )
+    config = Configuration(
+        urls=["http://test.com:80"], api_key=api_key, singleflight=True
+    )
+    requester = Requester(config)
+    impatient = asyncio.ensure_future(
+        requester.get('/collections', timeout_budget=0.01)
+    )
+    patient = asyncio.ensure_future(requester.get('/collections'))
+    with pytest.raises(Timeout):
+        await impatient
+    # The shared request outlives the budget of the caller which started it.
+    assert await patient == {"found": 1}
+    await requester.aclose()
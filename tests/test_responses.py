@@ -0,0 +1,79 @@
+import httpx
+import orjson
+from unittest import mock
+from typesense_aio.client import Client
+from typesense_aio.config import Configuration
+from typesense_aio.responses import LazySearchResponse
+
+
+SEARCH_URL = "http://test.com:80/collections/fruits/documents/search"
+BODY = b'{"found": 1, "hits": [{"document": {"name": "apple"}}]}'
+
+
+def test_lazy_search_response():
+    decoder = mock.Mock(side_effect=orjson.loads)
+    response = LazySearchResponse(BODY, decoder)
+    assert repr(response) == f'<LazySearchResponse {len(BODY)} bytes, raw>'
+    assert response.raw is BODY
+    assert not decoder.called
+
+    assert response["found"] == 1
+    # The hits are left undecoded.
+    assert decoder.call_count == 1
+    assert repr(response).endswith('bytes, 1/2 keys decoded>')
+    assert set(response) == {"found", "hits"}
+    assert len(response) == 2
+    assert response.get("facet_counts") is None
+    assert decoder.call_count == 1
+
+    assert response["hits"][0]["document"] == {"name": "apple"}
+    assert response == orjson.loads(BODY)
+    # Each key decoded once.
+    assert decoder.call_count == 2
+    assert repr(response).endswith('bytes, decoded>')
+
+
+def test_lazy_search_response_without_msgspec():
+    decoder = mock.Mock(side_effect=orjson.loads)
+    response = LazySearchResponse(BODY, decoder)
+    with mock.patch("typesense_aio.responses.msgspec", None):
+        assert response["found"] == 1
+    assert response.decoded == orjson.loads(BODY)
+    # Decoded at once.
+    assert decoder.call_count == 1
+
+
+async def test_lazy_search(api_key, respx_mock):
+    respx_mock.get(SEARCH_URL).mock(
+        return_value=httpx.Response(200, content=BODY)
+    )
+    client = Client(Configuration(
+        urls=["http://test.com:80"],
+        api_key=api_key,
+        lazy_search=True
+    ))
+    documents = client.collections["fruits"].documents
+    result = await documents.search("apple", query_by="name")
+    assert isinstance(result, LazySearchResponse)
+    assert result.raw == BODY
+    assert result["found"] == 1
+    await client.aclose()
+
+
+async def test_lazy_search_cached(api_key, respx_mock):
+    route = respx_mock.get(SEARCH_URL).mock(
+        return_value=httpx.Response(200, content=BODY)
+    )
+    client = Client(Configuration(
+        urls=["http://test.com:80"],
+        api_key=api_key,
+        lazy_search=True,
+        cache_ttl=60
+    ))
+    documents = client.collections["fruits"].documents
+    first = await documents.search("apple", query_by="name")
+    second = await documents.search("apple", query_by="name")
+    assert route.call_count == 1
+    assert first.raw == second.raw == BODY
+    assert first == second
+    await client.aclose()
@@ -0,0 +1,91 @@
+import httpx
+import pytest
+from unittest import mock
+from typesense_aio.balancing import RoundRobin
+from typesense_aio.config import Configuration
+from typesense_aio.exc import ServerError, ServiceUnavailable
+from typesense_aio.requester import Requester
+from typesense_aio.retry import RetryBudget, full_jitter
+
+
+def test_full_jitter():
+    with mock.patch("random.uniform", side_effect=lambda a, b: b):
+        assert full_jitter(1, 0.1, 1.0) == 0.1
+        assert full_jitter(3, 0.1, 1.0) == 0.4
+        assert full_jitter(10, 0.1, 1.0) == 1.0
+
+
+def test_retry_budget():
+    with mock.patch("typesense_aio.retry.monotonic", return_value=100):
+        budget = RetryBudget(ratio=0.5, minimum=2, capacity=3)
+        assert budget.withdraw()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+
+    with mock.patch("typesense_aio.retry.monotonic", return_value=110):
+        # Refilled with `minimum` per second, up to the capacity.
+        assert budget.tokens == 0
+        budget.refill()
+        assert budget.tokens == 3
+
+
+async def test_retry_other_node(api_key, respx_mock):
+    bad = respx_mock.get("http://bad.com:8108/collections").mock(
+        return_value=httpx.Response(503)
+    )
+    good = respx_mock.get("http://good.com:8108/collections").mock(
+        return_value=httpx.Response(200, content=b'[]')
+    )
+    requester = Requester(Configuration(
+        urls=["http://bad.com:8108", "http://good.com:8108"],
+        api_key=api_key,
+        retry_interval=0.001,
+        load_balancing=RoundRobin()
+    ))
+    assert await requester.get('/collections') == []
+    assert bad.call_count == 1
+    assert good.call_count == 1
+    await requester.aclose()
+
+
+async def test_retry_budget_exhausted(api_key, respx_mock):
+    route = respx_mock.get("http://bad.com:8108/collections").mock(
+        return_value=httpx.Response(500)
+    )
+    requester = Requester(Configuration(
+        urls=["http://bad.com:8108"],
+        api_key=api_key,
+        retries=5,
+        retry_interval=0.001,
+        retry_budget_minimum=0,
+        retry_budget_ratio=1
+    ))
+    requester.budget.tokens = 0
+    with pytest.raises(ServerError):
+        await requester.get('/collections')
+    # One deposit allowed a single retry.
+    assert route.call_count == 2
+    await requester.aclose()
+
+
+async def test_retry_timeout_budget(api_key, respx_mock):
+    route = respx_mock.get("http://bad.com:8108/collections").mock(
+        return_value=httpx.Response(503)
+    )
+    requester = Requester(Configuration(
+        urls=["http://bad.com:8108"],
+        api_key=api_key,
+        retry_interval=1.0
+    ))
+    with mock.patch("random.uniform", side_effect=lambda a, b: b):
+        with pytest.raises(ServiceUnavailable):
+            await requester.get('/collections', timeout_budget=0.5)
+    # The backoff would outlast the budget: no retry.
+    assert route.call_count == 1
+    # Nor is a token withdrawn from the retry budget.
+    assert requester.budget.tokens > 10
+    await requester.aclose()
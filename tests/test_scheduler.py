@@ -0,0 +1,94 @@
+import asyncio
+import httpx
+from typesense_aio.config import Configuration
+from typesense_aio.requester import Requester
+from typesense_aio.scheduler import get_scheduler, shutdown
+
+
+good_response = httpx.Response(200, content=b'{"ok": true}')
+
+
+async def test_shared_scheduler(api_key, respx_mock):
+    health = respx_mock.get("http://test.com:80/health").mock(
+        return_value=httpx.Response(500)
+    )
+    config = Configuration(
+        urls=["http://test.com:80", "http://example.com:12345"],
+        api_key=api_key,
+        healthcheck_interval=0.1
+    )
+    requesters = [Requester(config) for _ in range(3)]
+    for requester in requesters:
+        requester.nodes.quarantine(requester.nodes.nodes[0])
+
+    assert all(
+        requester.nodes.scheduled == [requester.nodes.nodes[0]]
+        for requester in requesters
+    )
+
+    await asyncio.sleep(0.15)
+    # A single probe for the node shared by the three clients.
+    assert health.call_count == 1
+    assert all(
+        requester.nodes.scheduled == [requester.nodes.nodes[0]]
+        for requester in requesters
+    )
+
+    health.mock(return_value=good_response)
+    await asyncio.sleep(0.15)
+    assert health.call_count == 2
+    assert all(
+        len(requester.nodes.sane) == 2 for requester in requesters
+    )
+    assert all(requester.nodes.scheduled == [] for requester in requesters)
+    for requester in requesters:
+        await requester.aclose()
+
+
+async def test_scheduler_shutdown(api_key, respx_mock):
+    health = respx_mock.get("http://test.com:80/health").mock(
+        return_value=httpx.Response(500)
+    )
+    config = Configuration(
+        urls=["http://test.com:80", "http://example.com:12345"],
+        api_key=api_key,
+        healthcheck_interval=0.05
+    )
+    requester = Requester(config)
+    other = Requester(config)
+    requester.nodes.quarantine(requester.nodes.nodes[0])
+    other.nodes.quarantine(other.nodes.nodes[0])
+
+    await requester.aclose()
+    scheduler = get_scheduler()
+    assert requester.nodes.scheduled == []
+    assert other.nodes.scheduled == [other.nodes.nodes[0]]
+
+    await shutdown()
+    assert scheduler.task is None
+    assert scheduler.watched == {}
+    assert scheduler.clients == {}
+    await asyncio.sleep(0.1)
+    assert health.call_count == 0
+
+
+async def test_scheduler_stops_when_idle(api_key, respx_mock):
+    respx_mock.get("http://test.com:80/health").mock(
+        return_value=httpx.Response(500)
+    )
+    config = Configuration(
+        urls=["http://test.com:80", "http://example.com:12345"],
+        api_key=api_key,
+        healthcheck_interval=60
+    )
+    requester = Requester(config)
+    requester.nodes.quarantine(requester.nodes.nodes[0])
+    scheduler = get_scheduler()
+    task = scheduler.task
+    assert task is not None
+
+    # Nothing left to watch: the task does not sleep for the interval.
+    await requester.aclose()
+    await asyncio.wait_for(task, 1)
+    assert scheduler.task is None
+    assert scheduler.clients == {}
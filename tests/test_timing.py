@@ -0,0 +1,96 @@
+import time
+from unittest import mock
+from typesense_aio.config import Configuration
+from typesense_aio.requester import Requester
+from typesense_aio.timing import PhaseTrace, RequestTiming
+
+
+async def test_phase_trace():
+    trace = PhaseTrace()
+    trace.mark('encode')
+    trace.mark('encode.complete')
+    await trace('http11.send_request_headers.started', {})
+    await trace('http2.send_request_body.complete', {})
+    assert set(trace.marks) == {
+        'encode',
+        'encode.complete',
+        'send_request_headers.started',
+        'send_request_body.complete'
+    }
+    assert trace.between('encode', 'encode.complete') >= 0
+    assert trace.between('encode', 'request.complete') is None
+
+    timing = RequestTiming('GET', 'http://test.com/health', trace)
+    assert timing.send >= 0
+    assert timing.wait is None
+    assert timing.network is None
+
+
+async def test_requester_timing(api_key, httpserver):
+    timings = []
+    requester = Requester(Configuration(
+        urls=[httpserver.url_for('/')],
+        api_key=api_key,
+        timing_callback=timings.append
+    ))
+    httpserver.expect_request(
+        '/collections/books/documents/search', method="GET"
+    ).respond_with_json({"found": 0, "hits": [], "search_time_ms": 2})
+    httpserver.expect_request(
+        '/collections/books/documents', method="POST"
+    ).respond_with_json({"id": "1"})
+
+    result = await requester.get(
+        '/collections/books/documents/search', params={"q": "*"}
+    )
+    assert result["found"] == 0
+    await requester.post(
+        '/collections/books/documents', data={"id": "1"}
+    )
+    search, create = timings
+    assert search.method == 'GET'
+    assert search.url.endswith('/collections/books/documents/search?q=%2A')
+    assert search.server == 0.002
+    for phase in ('encode', 'connection', 'send', 'wait',
+                  'transfer', 'decode', 'total'):
+        assert getattr(search, phase) >= 0
+    assert search.total >= search.wait + search.decode
+    assert search.network == search.wait - 0.002
+    assert create.method == 'POST'
+    assert create.server is None
+    assert 'decode=' in repr(create)
+    await requester.aclose()
+
+
+async def test_requester_no_timing(api_key, httpserver):
+    requester = Requester(Configuration(
+        urls=[httpserver.url_for('/')], api_key=api_key
+    ))
+    httpserver.expect_request('/health').respond_with_json({"ok": True})
+    response = await requester.request('GET', '/health')
+    assert 'typesense_aio.trace' not in response.extensions
+    await requester.aclose()
+
+
+async def test_requester_timing_client_creation(api_key, httpserver):
+    timings = []
+    requester = Requester(Configuration(
+        urls=[httpserver.url_for('/')],
+        api_key=api_key,
+        timing_callback=timings.append
+    ))
+    httpserver.expect_request('/health').respond_with_json({"ok": True})
+    create_client = requester.pool.create_client
+
+    def slow_create_client(node):
+        time.sleep(0.05)
+        return create_client(node)
+
+    # Creating the client of the node is part of the connection.
+    with mock.patch.object(
+            requester.pool, 'create_client', slow_create_client):
+        await requester.get('/health')
+    [timing] = timings
+    assert timing.encode < 0.05
+    assert timing.connection >= 0.05
+    await requester.aclose()
@@ -0,0 +1,156 @@
+import httpx
+import pytest
+from typesense_aio.balancing import RoundRobin
+from typesense_aio.config import Configuration
+from typesense_aio.documents import Documents
+from typesense_aio.exc import ObjectUnprocessable
+from typesense_aio.requester import Requester
+from typesense_aio.tracing import (
+    InMemoryExporter, RecordingTracer, OpenTelemetryTracer, collection_name
+)
+
+
+def test_collection_name():
+    assert collection_name('/collections/books/documents') == 'books'
+    assert collection_name('/collections') is None
+    assert collection_name('/multi_search') is None
+
+
+async def test_requester_spans(api_key, respx_mock):
+    respx_mock.get("http://bad.com:8108/collections/books").mock(
+        return_value=httpx.Response(503)
+    )
+    respx_mock.get("http://good.com:8108/collections/books").mock(
+        return_value=httpx.Response(200, content=b'{"name": "books"}')
+    )
+    exporter = InMemoryExporter()
+    requester = Requester(Configuration(
+        urls=["http://bad.com:8108", "http://good.com:8108"],
+        api_key=api_key,
+        retry_interval=0.001,
+        load_balancing=RoundRobin(),
+        tracer=RecordingTracer(exporter)
+    ))
+    assert await requester.get('/collections/books') == {"name": "books"}
+
+    failed, succeeded, request = exporter.spans
+    assert request.name == 'typesense.request'
+    assert request.parent is None
+    assert request.attributes == {
+        'typesense.method': 'GET',
+        'typesense.endpoint': 'collections/{}',
+        'typesense.collection': 'books',
+        'typesense.retries': 1,
+        'http.status_code': 200
+    }
+    assert failed.parent is request
+    assert failed.attributes == {
+        'typesense.node': 'http://bad.com:8108',
+        'typesense.attempt': 1,
+        'typesense.error': 'ServiceUnavailable'
+    }
+    assert isinstance(failed.error, Exception)
+    assert succeeded.parent is request
+    assert succeeded.attributes == {
+        'typesense.node': 'http://good.com:8108',
+        'typesense.attempt': 2,
+        'http.status_code': 200
+    }
+    assert succeeded.error is None
+    assert request.duration >= succeeded.duration
+    await requester.aclose()
+
+
+async def test_requester_stream_spans(api_key, respx_mock):
+    respx_mock.post(
+        "http://bad.com:8108/collections/books/documents/import"
+    ).mock(return_value=httpx.Response(503))
+    respx_mock.post(
+        "http://good.com:8108/collections/books/documents/import"
+    ).mock(return_value=httpx.Response(200, content=b'{"success":true}'))
+    exporter = InMemoryExporter()
+    requester = Requester(Configuration(
+        urls=["http://bad.com:8108", "http://good.com:8108"],
+        api_key=api_key,
+        retry_interval=0.001,
+        load_balancing=RoundRobin(),
+        tracer=RecordingTracer(exporter)
+    ))
+    documents = Documents(requester, 'books')
+    assert await documents.import_([{"id": "1"}]) == [{"success": True}]
+
+    failed, succeeded, request = exporter.spans
+    assert request.name == 'typesense.request'
+    assert request.parent is None
+    assert request.attributes == {
+        'typesense.method': 'POST',
+        'typesense.endpoint': 'collections/{}/documents/import',
+        'typesense.collection': 'books',
+        'typesense.retries': 1,
+        'http.status_code': 200
+    }
+    assert failed.name == succeeded.name == 'typesense.attempt'
+    assert failed.parent is request
+    assert failed.attributes == {
+        'typesense.node': 'http://bad.com:8108',
+        'typesense.attempt': 1,
+        'typesense.error': 'ServiceUnavailable'
+    }
+    assert succeeded.parent is request
+    assert succeeded.attributes == {
+        'typesense.node': 'http://good.com:8108',
+        'typesense.attempt': 2,
+        'http.status_code': 200
+    }
+    assert succeeded.error is None
+    await requester.aclose()
+
+
+async def test_requester_failed_span(api_key, respx_mock):
+    respx_mock.post("http://test.com:80/collections").mock(
+        return_value=httpx.Response(422, content=b'{"message": "no"}')
+    )
+    exporter = InMemoryExporter()
+    requester = Requester(Configuration(
+        urls=["http://test.com:80"],
+        api_key=api_key,
+        tracer=RecordingTracer(exporter)
+    ))
+    with pytest.raises(ObjectUnprocessable):
+        await requester.post('/collections', data={})
+    attempt, request = exporter.spans
+    assert isinstance(request.error, ObjectUnprocessable)
+    assert request.attributes['typesense.error'] == 'ObjectUnprocessable'
+    assert 'typesense.collection' not in request.attributes
+    exporter.clear()
+    assert exporter.spans == []
+    await requester.aclose()
+
+
+async def test_opentelemetry_tracer(api_key, respx_mock):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter
+    )
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    respx_mock.get("http://test.com:80/health").mock(
+        return_value=httpx.Response(200, content=b'{"ok": true}')
+    )
+    requester = Requester(Configuration(
+        urls=["http://test.com:80"],
+        api_key=api_key,
+        tracer=OpenTelemetryTracer(provider.get_tracer("tests"))
+    ))
+    assert await requester.get('/health') == {"ok": True}
+    attempt, request = exporter.get_finished_spans()
+    assert request.name == 'typesense.request'
+    assert attempt.parent.span_id == request.context.span_id
+    assert attempt.attributes['typesense.node'] == 'http://test.com:80'
+    assert request.attributes['http.status_code'] == 200
+    await requester.aclose()
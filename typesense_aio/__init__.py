@@ -3,12 +3,20 @@ from .config import Configuration
 from .client import Client
 from .collections import Collections, Collection
 from .documents import Documents
+from .bulk import BulkIndexer
+from .metrics import ClientMetrics
+from .query import SearchQuery
+from .reindex import reindex
 
 __all__ = [
+    "BulkIndexer",
     "Client",
+    "ClientMetrics",
     "Configuration",
     "Collection",
     "Collections",
     "Documents",
+    "SearchQuery",
+    "reindex",
     "types"
 ]
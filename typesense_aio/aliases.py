@@ -8,14 +8,26 @@ class Alias:
         self.name = name
         self.endpoint: str = f'/aliases/{name}'
 
-    def retrieve(self):
-        return self.requester.get(self.endpoint)
-
-    def delete(self):
-        return self.requester.delete(self.endpoint)
-
-    def upsert(self, mapping: dict):
-        return self.requester.put(self.endpoint, data=mapping)
+    def retrieve(self, timeout_budget: float | None = None):
+        return self.requester.get(self.endpoint, timeout_budget=timeout_budget)
+
+    async def delete(self, timeout_budget: float | None = None):
+        try:
+            return await self.requester.delete(
+                self.endpoint, timeout_budget=timeout_budget
+            )
+        finally:
+            # Searches through the alias were cached under its name.
+            self.requester.invalidate(self.name)
+
+    async def upsert(self, mapping: dict,
+                     timeout_budget: float | None = None):
+        try:
+            return await self.requester.put(
+                self.endpoint, data=mapping, timeout_budget=timeout_budget
+            )
+        finally:
+            self.requester.invalidate(self.name)
 
 
 class Aliases:
@@ -31,5 +43,5 @@ class Aliases:
             self.aliases[name] = Alias(self.requester, name)
         return self.aliases.get(name)
 
-    def retrieve(self):
-        return self.requester.get(self.endpoint)
+    def retrieve(self, timeout_budget: float | None = None):
+        return self.requester.get(self.endpoint, timeout_budget=timeout_budget)
@@ -8,14 +8,21 @@ class AnalyticsRule:
         self.rule_id = rule_id
         self.endpoint = f"/analytics/rules/{rule_id}"
 
-    async def retrieve(self):
-        return await self.requester.get(self.endpoint)
+    async def retrieve(self, timeout_budget: float | None = None):
+        return await self.requester.get(
+            self.endpoint, timeout_budget=timeout_budget
+        )
 
-    async def delete(self):
-        return await self.requester.delete(self.endpoint)
+    async def delete(self, timeout_budget: float | None = None):
+        return await self.requester.delete(
+            self.endpoint, timeout_budget=timeout_budget
+        )
 
-    async def upsert(self, rule: dict):
-        return await self.requester.put(self.endpoint, data=rule)
+    async def upsert(self, rule: dict,
+                     timeout_budget: float | None = None):
+        return await self.requester.put(
+            self.endpoint, data=rule, timeout_budget=timeout_budget
+        )
 
 
 class AnalyticsRules:
@@ -31,13 +38,19 @@ class AnalyticsRules:
             self.rules[rule_id] = AnalyticsRule(self.requester, rule_id)
         return self.rules[rule_id]
 
-    async def create(self, rule: dict, params: dict | None = None):
+    async def create(self, rule: dict, params: dict | None = None,
+                     timeout_budget: float | None = None):
         return await self.requester.post(
-            self.endpoint, data=rule, params=params
+            self.endpoint,
+            data=rule,
+            params=params,
+            timeout_budget=timeout_budget
         )
 
-    async def retrieve(self):
-        return await self.requester.get(self.endpoint)
+    async def retrieve(self, timeout_budget: float | None = None):
+        return await self.requester.get(
+            self.endpoint, timeout_budget=timeout_budget
+        )
 
 
 class Analytics:
@@ -0,0 +1,111 @@
+import random
+from abc import ABC, abstractmethod
+from itertools import count
+from typing import Dict, Mapping, Sequence, Type
+
+
+class NodeLoad:
+    # Per-node load counters, maintained by the requester.
+
+    __slots__ = ('outstanding', 'latency', 'requests')
+
+    decay: float = 0.3
+
+    def __init__(self):
+        self.outstanding: int = 0
+        self.latency: float | None = None
+        self.requests: int = 0
+
+    def __repr__(self):
+        return (
+            f'<NodeLoad outstanding={self.outstanding} '
+            f'latency={self.latency}>'
+        )
+
+    def started(self) -> None:
+        self.outstanding += 1
+        self.requests += 1
+
+    def finished(self, elapsed: float | None = None) -> None:
+        self.outstanding -= 1
+        if elapsed is not None:
+            if self.latency is None:
+                self.latency = elapsed
+            else:
+                self.latency += self.decay * (elapsed - self.latency)
+
+
+class Strategy(ABC):
+
+    @abstractmethod
+    def select(self,
+               nodes: Sequence[str],
+               load: Mapping[str, NodeLoad]) -> str:
+        # Picks a node among the non-empty sequence of candidates.
+        pass
+
+
+class RoundRobin(Strategy):
+
+    def __init__(self):
+        self.counter = count()
+
+    def select(self, nodes, load):
+        return nodes[next(self.counter) % len(nodes)]
+
+
+class Random(Strategy):
+
+    def select(self, nodes, load):
+        return random.choice(nodes)
+
+
+class LeastOutstanding(Strategy):
+
+    def select(self, nodes, load):
+        # Random tie-break, not to pile onto the first node.
+        best = []
+        lowest = None
+        for node in nodes:
+            outstanding = load[node].outstanding if node in load else 0
+            if lowest is None or outstanding < lowest:
+                best = [node]
+                lowest = outstanding
+            elif outstanding == lowest:
+                best.append(node)
+        return random.choice(best)
+
+
+class EWMALatency(Strategy):
+    # Power of two choices, weighted by the latency moving average
+    # and the requests in flight. Unmeasured nodes are tried first.
+
+    def cost(self, node: str, load: Mapping[str, NodeLoad]) -> float:
+        stats = load.get(node)
+        if stats is None or stats.latency is None:
+            return 0.0
+        return stats.latency * (stats.outstanding + 1)
+
+    def select(self, nodes, load):
+        if len(nodes) == 1:
+            return nodes[0]
+        first, second = random.sample(nodes, 2)
+        if self.cost(second, load) < self.cost(first, load):
+            return second
+        return first
+
+
+strategies: Dict[str, Type[Strategy]] = {
+    'round_robin': RoundRobin,
+    'random': Random,
+    'least_outstanding': LeastOutstanding,
+    'ewma': EWMALatency,
+}
+
+
+def resolve_strategy(strategy: str | Strategy) -> Strategy:
+    if isinstance(strategy, Strategy):
+        return strategy
+    if strategy not in strategies:
+        raise ValueError(f'Unknown load balancing strategy {strategy!r}.')
+    return strategies[strategy]()
@@ -0,0 +1,117 @@
+from collections import deque
+from time import monotonic
+from typing import Callable, Deque
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+StateListener = Callable[[str, str, str], None]
+
+
+class CircuitBreaker:
+    # Tracks the outcomes of the requests sent to a node.
+    #
+    # closed: the node gets traffic. It opens after too many
+    #   consecutive failures or a high error rate over the window.
+    # open: the node gets no traffic until the open interval elapses.
+    #   The interval doubles each time the node fails again.
+    # half_open: a few trial requests go through. Their success closes
+    #   the circuit, a failure opens it again.
+
+    def __init__(self,
+                 node: str,
+                 failure_threshold: int = 5,
+                 error_rate: float = 0.5,
+                 window: int = 20,
+                 open_interval: float = 1.0,
+                 max_open_interval: float = 60.0,
+                 half_open_requests: int = 1,
+                 listener: StateListener | None = None):
+        self.node = node
+        self.failure_threshold = failure_threshold
+        self.error_rate = error_rate
+        self.open_interval = open_interval
+        self.max_open_interval = max_open_interval
+        self.half_open_requests = half_open_requests
+        self.listener = listener
+        self.state: str = CLOSED
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.failures: int = 0
+        self.trips: int = 0
+        self.opened_at: float = 0.0
+        self.trials: int = 0
+        self.trial_started: float = 0.0
+        self.successes: int = 0
+
+    def __repr__(self):
+        return f'<CircuitBreaker {self.node!r} {self.state}>'
+
+    @property
+    def interval(self) -> float:
+        return min(
+            self.open_interval * 2 ** max(self.trips - 1, 0),
+            self.max_open_interval
+        )
+
+    def transition(self, state: str) -> None:
+        previous, self.state = self.state, state
+        if previous != state and self.listener is not None:
+            self.listener(self.node, previous, state)
+
+    def allow(self) -> bool:
+        # Whether a request may be sent now.
+        # In half-open state, this takes one of the trial permits.
+        if self.state == CLOSED:
+            return True
+        now = monotonic()
+        if self.state == OPEN:
+            if now - self.opened_at < self.interval:
+                return False
+            self.trials = self.successes = 0
+            self.transition(HALF_OPEN)
+        elif now - self.trial_started >= self.interval:
+            # Trials which never reported back, e.g. cancelled ones.
+            self.trials = 0
+        if self.trials >= self.half_open_requests:
+            return False
+        self.trials += 1
+        self.trial_started = now
+        return True
+
+    def record_success(self) -> None:
+        if self.state == HALF_OPEN:
+            self.successes += 1
+            if self.successes >= self.half_open_requests:
+                self.reset()
+        elif self.state == CLOSED:
+            self.failures = 0
+            self.outcomes.append(True)
+
+    def record_failure(self) -> None:
+        if self.state == HALF_OPEN:
+            self.trip()
+        elif self.state == CLOSED:
+            self.failures += 1
+            self.outcomes.append(False)
+            if self.failures >= self.failure_threshold:
+                self.trip()
+            elif len(self.outcomes) == self.outcomes.maxlen:
+                failed = self.outcomes.count(False)
+                if failed / len(self.outcomes) >= self.error_rate:
+                    self.trip()
+
+    def trip(self) -> None:
+        self.trips += 1
+        self.opened_at = monotonic()
+        self.failures = 0
+        self.outcomes.clear()
+        self.transition(OPEN)
+
+    def reset(self) -> None:
+        self.trips = 0
+        self.failures = 0
+        self.outcomes.clear()
+        self.transition(CLOSED)
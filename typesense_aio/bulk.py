@@ -0,0 +1,187 @@
+import asyncio
+import time
+from typing import Generic, List, Set, Tuple, TypeVar
+from .documents import Documents, ImportFailure
+
+
+T = TypeVar("T")
+
+
+class BulkStats:
+
+    def __init__(self):
+        self.submitted: int = 0
+        self.succeeded: int = 0
+        self.failed: int = 0
+        self.batches: int = 0
+        self.bytes: int = 0
+        self.started: float | None = None
+        self.finished: float | None = None
+        self.failures: List[Tuple[dict, dict]] = []
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def throughput(self) -> float:
+        # Documents processed per second.
+        elapsed = self.elapsed
+        if not elapsed:
+            return 0.0
+        return (self.succeeded + self.failed) / elapsed
+
+    def fail(self, document, failure: ImportFailure) -> None:
+        # Failures are kept along with their document.
+        self.failed += 1
+        self.failures.append((document, failure.result))
+
+    def __repr__(self):
+        return (
+            f'<BulkStats submitted={self.submitted} '
+            f'succeeded={self.succeeded} failed={self.failed} '
+            f'batches={self.batches} '
+            f'throughput={self.throughput:.1f}/s>'
+        )
+
+
+class BulkIndexer(Generic[T]):
+
+    def __init__(self,
+                 documents: Documents[T],
+                 *,
+                 batch_size: int = 1000,
+                 max_bytes: int = 4 * 1024 * 1024,
+                 flush_interval: float = 1.0,
+                 concurrency: int = 4,
+                 max_pending: int = 10000,
+                 params: dict | None = None):
+        self.documents = documents
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.params = params
+        self.stats = BulkStats()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self.slots = asyncio.Semaphore(concurrency)
+        self.imports: Set[asyncio.Task] = set()
+        self.batcher: asyncio.Task | None = None
+        self.closed: bool = False
+
+    async def __aenter__(self) -> 'BulkIndexer[T]':
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        if self.batcher is None:
+            self.stats.started = time.monotonic()
+            self.batcher = asyncio.ensure_future(self.run())
+
+    async def add(self, document: T) -> None:
+        # Waits for room in the queue when imports fall behind.
+        if self.closed:
+            raise RuntimeError('BulkIndexer is closed.')
+        self.start()
+        if self.batcher.done():
+            # Surfaces a crashed batcher instead of blocking forever.
+            self.batcher.result()
+        if self.queue.full():
+            put = asyncio.ensure_future(self.queue.put(document))
+            await asyncio.wait(
+                (put, self.batcher), return_when=asyncio.FIRST_COMPLETED
+            )
+            if not put.done():
+                put.cancel()
+                self.batcher.result()
+        else:
+            self.queue.put_nowait(document)
+        self.stats.submitted += 1
+
+    async def close(self) -> BulkStats:
+        if not self.closed:
+            self.closed = True
+            self.start()
+            if not self.batcher.done():
+                await self.queue.put(None)
+            await self.batcher
+            if self.imports:
+                await asyncio.gather(*self.imports)
+            self.stats.finished = time.monotonic()
+        return self.stats
+
+    async def run(self) -> None:
+        encoder = self.documents.requester.encoder
+        loop = asyncio.get_running_loop()
+        batch: List[T] = []
+        lines: List[bytes] = []
+        size = 0
+        deadline = 0.0
+        index = 0
+        while True:
+            timeout = max(deadline - loop.time(), 0) if batch else None
+            try:
+                document = await asyncio.wait_for(self.queue.get(), timeout)
+            except asyncio.TimeoutError:
+                await self.flush(batch, lines, size)
+                batch, lines, size = [], [], 0
+                continue
+
+            if document is None:
+                if batch:
+                    await self.flush(batch, lines, size)
+                return
+
+            index += 1
+            try:
+                # Bytes are taken as encoded documents.
+                line = document if isinstance(document, bytes) \
+                    else encoder(document)
+            except Exception as exc:
+                self.stats.fail(document, ImportFailure(
+                    index - 1,
+                    document.get("id") if isinstance(document, dict)
+                    else getattr(document, "id", None),
+                    {"success": False, "error": f"Not encodable: {exc}"}
+                ))
+                continue
+            if not batch:
+                deadline = loop.time() + self.flush_interval
+            batch.append(document)
+            lines.append(line)
+            size += len(line) + 1
+            if len(batch) >= self.batch_size or size >= self.max_bytes:
+                await self.flush(batch, lines, size)
+                batch, lines, size = [], [], 0
+
+    async def flush(self, batch: List[T], lines: List[bytes], size: int):
+        await self.slots.acquire()
+        task = asyncio.ensure_future(self.send(batch, lines))
+        self.imports.add(task)
+        task.add_done_callback(self.imports.discard)
+        self.stats.batches += 1
+        self.stats.bytes += size
+
+    async def send(self, batch: List[T], lines: List[bytes]) -> None:
+        stats = self.stats
+        try:
+            summary = await self.documents.import_summary(
+                lines, self.params
+            )
+        except Exception as exc:
+            stats.failed += len(batch)
+            stats.failures.extend(
+                (document, {"success": False, "error": repr(exc)})
+                for document in batch
+            )
+            return
+        finally:
+            self.slots.release()
+
+        stats.succeeded += summary.succeeded
+        for failure in summary.failures:
+            stats.fail(batch[failure.index], failure)
@@ -0,0 +1,122 @@
+import orjson
+from collections import OrderedDict
+from time import monotonic
+from typing import Awaitable, Callable, Dict, Iterable, NamedTuple, Tuple
+
+
+def normalize(value):
+    # Drops None values and sorts mappings so that equivalent
+    # parameter sets produce the same key.
+    if isinstance(value, dict):
+        return {
+            key: normalize(item)
+            for key, item in sorted(value.items())
+            if item is not None
+        }
+    if isinstance(value, (list, tuple)):
+        return [normalize(item) for item in value]
+    return value
+
+
+class CacheEntry(NamedTuple):
+    expires: float
+    collections: Tuple[str, ...]
+    content: bytes
+
+
+class SearchCache:
+
+    def __init__(self,
+                 ttl: float,
+                 max_entries: int = 1024,
+                 max_bytes: int = 32 * 1024 * 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict[bytes, CacheEntry] = OrderedDict()
+        self.size: int = 0
+        # Bumped on each invalidation, so that searches loading
+        # meanwhile are not cached.
+        self.generations: Dict[str, int] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def make_key(collections: Iterable[str], *parts) -> bytes:
+        return orjson.dumps(
+            [sorted(collections), *(normalize(part) for part in parts)]
+        )
+
+    def get(self, key: bytes) -> bytes | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires <= monotonic():
+            self.discard(key)
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry.content
+
+    def set(self,
+            key: bytes,
+            collections: Iterable[str],
+            content: bytes) -> None:
+        if len(content) > self.max_bytes:
+            return
+        self.discard(key)
+        self.entries[key] = CacheEntry(
+            monotonic() + self.ttl, tuple(collections), content
+        )
+        self.size += len(content)
+        while (len(self.entries) > self.max_entries
+               or self.size > self.max_bytes):
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted.content)
+
+    def discard(self, key: bytes) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry.content)
+
+    def generation(self, collections: Iterable[str]) -> Tuple[int, ...]:
+        return tuple(
+            self.generations.get(collection, 0)
+            for collection in collections
+        )
+
+    def invalidate(self, collection: str) -> None:
+        # Entries are tagged with the collection names used to query.
+        # A search through an alias is tagged with the alias name.
+        self.generations[collection] = \
+            self.generations.get(collection, 0) + 1
+        stale = [
+            key for key, entry in self.entries.items()
+            if collection in entry.collections
+        ]
+        for key in stale:
+            self.discard(key)
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.size = 0
+
+    async def fetch(self,
+                    key: bytes,
+                    collections: Iterable[str],
+                    loader: Callable[[], Awaitable[bytes | None]]
+                    ) -> bytes | None:
+        content = self.get(key)
+        if content is None:
+            collections = tuple(collections)
+            generation = self.generation(collections)
+            content = await loader()
+            if content is not None \
+                    and self.generation(collections) == generation:
+                self.set(key, collections, content)
+        return content
@@ -23,14 +23,28 @@ class Client:
         self.multi_search: MultiSearch = MultiSearch(self.requester)
         self.operations: Operations = Operations(self.requester)
 
-    def log_slow_request(self, threshold: int = 2000):
+    async def __aenter__(self) -> 'Client':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.requester.aclose()
+
+    def log_slow_request(self, threshold: int = 2000,
+                         timeout_budget: float | None = None):
         # -1 disables it.
         return self.requester.post('/config', data={
             "log-slow-requests-time-ms": threshold
-        })
+        }, timeout_budget=timeout_budget)
 
-    def get_metrics(self):
-        return self.requester.get('/metrics.json')
+    def get_metrics(self, timeout_budget: float | None = None):
+        return self.requester.get(
+            '/metrics.json', timeout_budget=timeout_budget
+        )
 
-    def get_stats(self):
-        return self.requester.get('/stats.json')
+    def get_stats(self, timeout_budget: float | None = None):
+        return self.requester.get(
+            '/stats.json', timeout_budget=timeout_budget
+        )
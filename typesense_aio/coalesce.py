@@ -0,0 +1,94 @@
+import asyncio
+from typing import List, Set, Tuple
+from .exc import resolve_exception, ObjectNotFound, Timeout
+from .types import BaseRequester
+
+
+class SearchCoalescer:
+    # Gathers searches issued within a short window and sends them
+    # as a single multi-search, fanning the results back out.
+
+    endpoint: str = '/multi_search'
+
+    def __init__(self,
+                 requester: BaseRequester,
+                 window: float = 0.002,
+                 max_batch: int = 20):
+        self.requester = requester
+        self.window = window
+        self.max_batch = max_batch
+        self.pending: List[Tuple[dict, asyncio.Future]] = []
+        self.timer: asyncio.TimerHandle | None = None
+        self.tasks: Set[asyncio.Task] = set()
+
+    async def search(self,
+                     collection_name: str,
+                     params: dict,
+                     timeout_budget: float | None = None):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append(({**params, "collection": collection_name},
+                             future))
+        if len(self.pending) >= self.max_batch:
+            self.flush()
+        elif self.timer is None:
+            self.timer = loop.call_later(self.window, self.flush)
+        if timeout_budget is None:
+            return await future
+        # The batch is shared: a caller out of time only gives up
+        # its own result, which the batch then skips.
+        try:
+            return await asyncio.wait_for(future, timeout_budget)
+        except asyncio.TimeoutError as exc:
+            raise Timeout('Deadline exceeded.') from exc
+
+    def flush(self) -> None:
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending = self.pending, []
+        if batch:
+            task = asyncio.ensure_future(self.send(batch))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def send(self, batch: List[Tuple[dict, asyncio.Future]]):
+        batch = [(query, future) for query, future in batch
+                 if not future.done()]
+        if not batch:
+            return
+
+        try:
+            if len(batch) == 1:
+                query, _ = batch[0]
+                params = {k: v for k, v in query.items() if k != "collection"}
+                results = [await self.requester.get(
+                    f"/collections/{query['collection']}/documents/search",
+                    params=params,
+                    hedge=True
+                )]
+            else:
+                response = await self.requester.post(
+                    self.endpoint,
+                    data={"searches": [query for query, _ in batch]},
+                    hedge=True
+                )
+                results = response["results"]
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if result is not None and "error" in result:
+                error = resolve_exception(result.get("code", 0))
+                if error is ObjectNotFound:
+                    # Consistent with a direct search.
+                    future.set_result(None)
+                else:
+                    future.set_exception(error(result["error"]))
+            else:
+                future.set_result(result)
@@ -1,5 +1,5 @@
 import httpx
-from typing import Dict, Optional, Generic, TypeVar
+from typing import Dict, Optional, Generic, Type, TypeVar
 from .requester import Requester
 from .documents import Documents
 from .types import CollectionDict
@@ -12,24 +12,36 @@ T = TypeVar("T")
 
 class Collection(Generic[T]):
 
-    def __init__(self, requester: Requester, name: str):
+    def __init__(self,
+                 requester: Requester,
+                 name: str,
+                 model: Type[T] | None = None):
         self.name = name
         self.requester = requester
-        self.documents: Documents[T] = Documents(requester, name)
+        self.documents: Documents[T] = Documents(requester, name, model)
         self.synonyms: Synonyms = Synonyms(requester, name)
         self.overrides: Overrides = Overrides(requester, name)
         self.endpoint = f"/collections/{self.name}"
 
-    async def retrieve(self) -> Optional[CollectionDict]:
+    async def retrieve(self,
+                       timeout_budget: float | None = None
+                       ) -> Optional[CollectionDict]:
         try:
-            return await self.requester.get(self.endpoint)
+            return await self.requester.get(
+                self.endpoint, hedge=True, timeout_budget=timeout_budget
+            )
         except httpx.HTTPStatusError as e:
             if e.response.status_code == httpx.codes.NOT_FOUND:
                 return None
             raise e
 
-    async def delete(self):
-        return await self.requester.delete(self.endpoint)
+    async def delete(self, timeout_budget: float | None = None):
+        try:
+            return await self.requester.delete(
+                self.endpoint, timeout_budget=timeout_budget
+            )
+        finally:
+            self.requester.invalidate(self.name)
 
 
 class Collections:
@@ -47,8 +59,15 @@ class Collections:
             )
         return self.collections.get(collection_name)
 
-    async def create(self, schema: CollectionDict) -> CollectionDict:
-        return await self.requester.post(self.endpoint, data=schema)
+    async def create(self, schema: CollectionDict,
+                     timeout_budget: float | None = None) -> CollectionDict:
+        return await self.requester.post(
+            self.endpoint, data=schema, timeout_budget=timeout_budget
+        )
 
-    async def retrieve(self) -> CollectionDict:
-        return await self.requester.get(self.endpoint)
+    async def retrieve(self,
+                       timeout_budget: float | None = None
+                       ) -> CollectionDict:
+        return await self.requester.get(
+            self.endpoint, timeout_budget=timeout_budget
+        )
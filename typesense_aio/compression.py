@@ -0,0 +1,18 @@
+import gzip
+import zlib
+from typing import AsyncIterable, AsyncIterator
+
+
+def gzip_bytes(data: bytes, level: int = 6) -> bytes:
+    return gzip.compress(data, level, mtime=0)
+
+
+async def gzip_stream(chunks: AsyncIterable[bytes],
+                      level: int = 6) -> AsyncIterator[bytes]:
+    # Compresses a streamed body as a single gzip member.
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -1,12 +1,87 @@
 import ssl
+from concurrent.futures import Executor
 from typing import List, NamedTuple, Literal
+from .balancing import Strategy
+from .breaker import StateListener
+from .metrics import ClientMetrics
+from .timing import TimingCallback
+from .tracing import Tracer
 
 
 class Configuration(NamedTuple):
     urls: List[str]
     api_key: str
     timeout: float = 5.0
+    # Attempts per request. Retries back off exponentially from
+    # `retry_interval`, with full jitter, and are capped by a budget
+    # of `retry_budget_ratio` retries per request, plus
+    # `retry_budget_minimum` per second.
     retries: int = 3
     retry_interval: float = 1.0
+    retry_max_interval: float = 10.0
+    retry_budget_ratio: float = 0.2
+    retry_budget_minimum: float = 10.0
     healthcheck_interval: float = 60.0
     verify: Literal[False] | str | ssl.SSLContext = False
+    pool_max_connections: int | None = 100
+    pool_max_keepalive: int | None = 20
+    pool_keepalive_expiry: float | None = 5.0
+    # HTTP/2 requires the `http2` extra. Disabling HTTP/1.1 forces
+    # HTTP/2 with prior knowledge on plain-text (h2c) nodes.
+    http2: bool = False
+    http1: bool = True
+    # Search results cache, disabled unless a TTL (seconds) is given.
+    cache_ttl: float | None = None
+    cache_max_entries: int = 1024
+    cache_max_bytes: int = 32 * 1024 * 1024
+    # Coalescing of concurrent searches into multi-searches,
+    # disabled unless a window (seconds) is given.
+    coalesce_window: float | None = None
+    coalesce_max_batch: int = 20
+    # One of 'round_robin', 'random', 'least_outstanding', 'ewma'
+    # or a `balancing.Strategy` instance.
+    load_balancing: str | Strategy = 'round_robin'
+    # Per-node circuit breaker. The listener is called with the node,
+    # the previous and the new state on each transition.
+    breaker_failure_threshold: int = 5
+    breaker_error_rate: float = 0.5
+    breaker_window: int = 20
+    breaker_open_interval: float = 1.0
+    breaker_max_open_interval: float = 60.0
+    breaker_half_open_requests: int = 1
+    breaker_listener: StateListener | None = None
+    # Hedging of idempotent reads, disabled unless a delay (seconds)
+    # is given. With a percentile, the delay is learned from the
+    # recent read latencies, `hedge_delay` being the fallback.
+    hedge_delay: float | None = None
+    hedge_percentile: float | None = None
+    # Identical concurrent GET requests share a single round trip.
+    singleflight: bool = False
+    # Request metrics, see `metrics.ClientMetrics.expose` for
+    # the Prometheus text format.
+    metrics: ClientMetrics | None = None
+    # Called with the per-phase `timing.RequestTiming` of each
+    # request answered with a body, streams aside.
+    timing_callback: TimingCallback | None = None
+    # Searches return a `responses.LazySearchResponse`, decoded on
+    # first access, unless coalesced.
+    lazy_search: bool = False
+    # Spans of the requests and of their attempts, see `tracing`.
+    tracer: Tracer | None = None
+    # Imported documents are encoded in this executor, off the event
+    # loop, by chunks of `encode_chunk_documents` documents and with
+    # up to `encode_concurrency` chunks encoded ahead of the upload.
+    # A process pool requires picklable documents and encoder.
+    encode_executor: Executor | None = None
+    encode_chunk_documents: int = 1000
+    encode_concurrency: int = 4
+    # Responses are decompressed as they are read. The encodings
+    # advertised are those httpx decodes: gzip and deflate, br and
+    # zstd with the `compression` extra. Disabled, `identity` is
+    # requested.
+    response_compression: bool = True
+    # Request bodies of at least this size (bytes) are gzipped, and
+    # streamed bodies, such as imports, whatever their size. Requires
+    # a server, or a proxy in front of it, accepting gzipped bodies.
+    request_compression_threshold: int | None = None
+    request_compression_level: int = 6
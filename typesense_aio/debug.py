@@ -8,5 +8,7 @@ class Debug:
     def __init__(self, requester: Requester):
         self.requester = requester
 
-    async def retrieve(self):
-        return await self.requester.get(self.endpoint)
+    async def retrieve(self, timeout_budget: float | None = None):
+        return await self.requester.get(
+            self.endpoint, timeout_budget=timeout_budget
+        )
@@ -1,50 +1,235 @@
-import json
+import asyncio
 import httpx
-from typing import Literal, List, Generic, TypeVar, Dict, Union
+from collections import deque
+from concurrent.futures import Executor
+from functools import partial
+from typing import (
+    Literal, List, Generic, TypeVar, Dict, Union,
+    AsyncIterable, AsyncIterator, Iterable, NamedTuple, Type
+)
+from .export import export_documents
+from .models import ModelCodec
+from .query import SearchQuery, BoundSearchQuery
 from .requester import Requester
-from .types import SearchResponse
+from .responses import LazySearchResponse
+from .types import SearchResponse, JSONDecoder, JSONEncoder
 
 
 T = TypeVar("T")
 
 
+async def aiter_documents(
+        documents: Iterable | AsyncIterable) -> AsyncIterator:
+    if isinstance(documents, AsyncIterable):
+        async for document in documents:
+            yield document
+    else:
+        for document in documents:
+            yield document
+
+
+async def iter_jsonl(documents: Iterable | AsyncIterable,
+                     encoder: JSONEncoder,
+                     chunk_size: int = 65536) -> AsyncIterator[bytes]:
+    # Lazily encodes documents as JSONL, yielding chunks of
+    # roughly `chunk_size` bytes. Bytes are taken as encoded documents.
+    chunk = bytearray()
+    separator = b""
+    async for document in aiter_documents(documents):
+        chunk += separator
+        if isinstance(document, bytes):
+            chunk += document
+        else:
+            chunk += encoder(document)
+        separator = b"\n"
+        if len(chunk) >= chunk_size:
+            yield bytes(chunk)
+            chunk.clear()
+    if chunk:
+        yield bytes(chunk)
+
+
+def encode_chunk(documents: list,
+                 encoder: JSONEncoder,
+                 separator: bytes = b"") -> bytes:
+    # Runs in the executor: the encoder, documents and result are
+    # pickled across a process pool.
+    return separator + b"\n".join(
+        document if isinstance(document, bytes) else encoder(document)
+        for document in documents
+    )
+
+
+async def iter_jsonl_parallel(documents: Iterable | AsyncIterable,
+                              encoder: JSONEncoder,
+                              executor: Executor,
+                              chunk_documents: int = 1000,
+                              concurrency: int = 4) -> AsyncIterator[bytes]:
+    # As `iter_jsonl`, the chunks of `chunk_documents` documents
+    # encoded in the executor, up to `concurrency` at once. Chunks
+    # are yielded in order, as soon as they are encoded.
+    loop = asyncio.get_running_loop()
+    pending: deque[asyncio.Future] = deque()
+    separator = b""
+    chunk = []
+
+    def submit():
+        nonlocal separator
+        pending.append(loop.run_in_executor(
+            executor, encode_chunk, chunk, encoder, separator
+        ))
+        separator = b"\n"
+
+    try:
+        async for document in aiter_documents(documents):
+            chunk.append(document)
+            if len(chunk) >= chunk_documents:
+                submit()
+                chunk = []
+                if len(pending) >= concurrency:
+                    yield await pending.popleft()
+        if chunk:
+            submit()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def iter_lines(response: httpx.Response) -> AsyncIterator[bytes]:
+    # Splits a streamed response body into non-empty lines.
+    pending = b""
+    async for data in response.aiter_bytes():
+        lines = (pending + data).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            if line:
+                yield line
+    if pending:
+        yield pending
+
+
+class ImportFailure(NamedTuple):
+    index: int
+    id: str | None
+    result: dict
+
+
+class ImportSummary:
+    # Outcome of an import, keeping only the failures.
+
+    def __init__(self):
+        self.succeeded: int = 0
+        self.failures: List[ImportFailure] = []
+
+    def __repr__(self):
+        return (
+            f'<ImportSummary succeeded={self.succeeded} '
+            f'failed={self.failed}>'
+        )
+
+    @property
+    def failed(self) -> int:
+        return len(self.failures)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    def add(self, index: int, line: bytes, decoder: JSONDecoder) -> None:
+        # Successes are counted without being decoded.
+        if line.startswith(b'{"success":true'):
+            self.succeeded += 1
+            return
+        result = decoder(line)
+        if result.get("success"):
+            self.succeeded += 1
+            return
+        document_id = result.get("id")
+        if document_id is None:
+            # The failing line comes back as a string.
+            document = result.get("document")
+            if isinstance(document, (str, bytes)):
+                try:
+                    document = decoder(document)
+                except ValueError:
+                    document = None
+            if isinstance(document, dict):
+                document_id = document.get("id")
+        self.failures.append(ImportFailure(index, document_id, result))
+
+
 class _DocumentProxy(Generic[T]):
 
     def __init__(self,
                  requester: Requester,
                  collection_name: str,
-                 document_id: str
+                 document_id: str,
+                 codec: ModelCodec[T] | None = None
                  ):
         self.requester = requester
         self.collection_name = collection_name
         self.document_id = document_id
+        self.codec = codec
         self.endpoint: str = (
             f"/collections/{collection_name}/documents/{document_id}"
         )
 
-    async def retrieve(self) -> T:
+    async def retrieve(self, timeout_budget: float | None = None) -> T:
         try:
-            return await self.requester.get(self.endpoint)
+            if self.codec is None:
+                return await self.requester.get(
+                    self.endpoint, hedge=True, timeout_budget=timeout_budget
+                )
+            content = await self.requester.get(
+                self.endpoint,
+                as_json=False,
+                hedge=True,
+                timeout_budget=timeout_budget
+            )
+            if content is None:
+                return None
+            return self.codec.document(content)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == httpx.codes.NOT_FOUND:
                 return None
             raise e
 
-    async def update(self, document: T):
-        return await self.requester.patch(
-            self.endpoint,
-            data=document
-        )
+    async def update(self,
+                     document: T,
+                     timeout_budget: float | None = None):
+        try:
+            return await self.requester.patch(
+                self.endpoint,
+                data=document,
+                timeout_budget=timeout_budget
+            )
+        finally:
+            self.requester.invalidate(self.collection_name)
 
-    async def delete(self) -> T:
-        return await self.requester.delete(self.endpoint)
+    async def delete(self, timeout_budget: float | None = None) -> T:
+        try:
+            return await self.requester.delete(
+                self.endpoint, timeout_budget=timeout_budget
+            )
+        finally:
+            self.requester.invalidate(self.collection_name)
 
 
 class Documents(Generic[T]):
 
-    def __init__(self, requester: Requester, collection_name: str):
+    def __init__(self,
+                 requester: Requester,
+                 collection_name: str,
+                 model: Type[T] | None = None):
+        # Reads decode documents into `model` instances, if given.
+        # See `models.ModelCodec`.
         self.requester = requester
         self.collection_name = collection_name
+        self.codec: ModelCodec[T] | None = (
+            None if model is None else ModelCodec(model)
+        )
         self.documents: Dict[str, _DocumentProxy[T]] = {}
         self.endpoint: str = (
             f"/collections/{collection_name}/documents"
@@ -53,57 +238,179 @@ class Documents(Generic[T]):
     def __getitem__(self, document_id) -> _DocumentProxy[T]:
         if document_id not in self.documents:
             self.documents[document_id] = _DocumentProxy(
-                self.requester, self.collection_name, document_id
+                self.requester, self.collection_name, document_id, self.codec
             )
         return self.documents[document_id]
 
-    async def create(self, document: T) -> T:
-        return await self.requester.post(
-            endpoint=self.endpoint,
-            data=document,
-            params={"action": "create"},
-        )
-
-    async def create_many(self, documents: List[T], params=None) -> List[dict]:
-        return await self.import_(documents, params)
+    async def create(self,
+                     document: T,
+                     timeout_budget: float | None = None) -> T:
+        try:
+            return await self.requester.post(
+                endpoint=self.endpoint,
+                data=document,
+                params={"action": "create"},
+                timeout_budget=timeout_budget
+            )
+        finally:
+            self.requester.invalidate(self.collection_name)
 
-    async def upsert(self, document: T) -> T:
-        return await self.requester.post(
-            self.endpoint,
-            data=document,
-            params={"action": "upsert"},
-        )
+    async def create_many(self,
+                          documents: Iterable[T] | AsyncIterable[T],
+                          params=None,
+                          timeout_budget: float | None = None) -> List[dict]:
+        return await self.import_(documents, params, timeout_budget)
 
-    async def update(self, document: T) -> T:
-        return await self.requester.post(
-            self.endpoint,
-            data=document,
-            params={"action": "update"},
-        )
+    async def upsert(self,
+                     document: T,
+                     timeout_budget: float | None = None) -> T:
+        try:
+            return await self.requester.post(
+                self.endpoint,
+                data=document,
+                params={"action": "upsert"},
+                timeout_budget=timeout_budget
+            )
+        finally:
+            self.requester.invalidate(self.collection_name)
 
-    async def import_(self, documents: List[T], params=None):
+    async def update(self,
+                     document: T,
+                     timeout_budget: float | None = None) -> T:
+        try:
+            return await self.requester.post(
+                self.endpoint,
+                data=document,
+                params={"action": "update"},
+                timeout_budget=timeout_budget
+            )
+        finally:
+            self.requester.invalidate(self.collection_name)
 
-        content = "\n".join([json.dumps(d) for d in documents])
+    async def import_(self,
+                      documents: Iterable[T] | AsyncIterable[T],
+                      params=None,
+                      timeout_budget: float | None = None) -> List[dict]:
+        return [
+            result async for result in self.import_iter(
+                documents, params, timeout_budget=timeout_budget
+            )
+        ]
 
-        api_response = await self.requester.post(
-            f"{self.endpoint}/import",
-            data=content.encode(),
-            params=params,
-            as_json=False
+    def encode(self,
+               documents: Iterable[T] | AsyncIterable[T],
+               chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        requester = self.requester
+        if requester.encode_executor is None:
+            return iter_jsonl(documents, requester.encoder, chunk_size)
+        return iter_jsonl_parallel(
+            documents,
+            requester.encoder,
+            requester.encode_executor,
+            chunk_documents=requester.encode_chunk_documents,
+            concurrency=requester.encode_concurrency
         )
 
-        res_obj_strs = api_response.split(b"\n")
-
-        response_objs = []
-        for res_obj_str in res_obj_strs:
-            response_objs.append(json.loads(res_obj_str))
+    async def import_iter(self,
+                          documents: Iterable[T] | AsyncIterable[T],
+                          params=None,
+                          chunk_size: int = 65536,
+                          timeout_budget: float | None = None,
+                          raw: bool = False
+                          ) -> AsyncIterator[dict | bytes]:
+        if isinstance(documents, (list, tuple)):
+            # Encoded anew for each attempt: the import is retried.
+            body = partial(self.encode, documents, chunk_size)
+        else:
+            body = self.encode(documents, chunk_size)
+        try:
+            async with self.requester.stream(
+                'POST',
+                f"{self.endpoint}/import",
+                data=body,
+                params=params,
+                timeout_budget=timeout_budget
+            ) as response:
+                async for line in iter_lines(response):
+                    yield line if raw else self.requester.decoder(line)
+        finally:
+            self.requester.invalidate(self.collection_name)
 
-        return response_objs
+    async def import_summary(self,
+                             documents: Iterable[T] | AsyncIterable[T],
+                             params=None,
+                             timeout_budget: float | None = None
+                             ) -> ImportSummary:
+        # As `import_`, without a result held per document.
+        summary = ImportSummary()
+        index = 0
+        async for line in self.import_iter(
+                documents, params, timeout_budget=timeout_budget, raw=True):
+            summary.add(index, line, self.requester.decoder)
+            index += 1
+        return summary
 
-    async def export(self):
+    async def export(self,
+                     filter_by: str = None,
+                     include_fields: str = None,
+                     exclude_fields: str = None,
+                     timeout_budget: float | None = None):
+        params = {
+            "filter_by": filter_by,
+            "include_fields": include_fields,
+            "exclude_fields": exclude_fields,
+        }
         return await self.requester.get(
             f"{self.endpoint}/export",
-            as_json=False
+            params={k: v for k, v in params.items() if v is not None},
+            as_json=False,
+            timeout_budget=timeout_budget
+        )
+
+    async def export_iter(self,
+                          filter_by: str = None,
+                          include_fields: str = None,
+                          exclude_fields: str = None,
+                          raw: bool = False,
+                          timeout_budget: float | None = None
+                          ) -> AsyncIterator[T | bytes]:
+        params = {
+            "filter_by": filter_by,
+            "include_fields": include_fields,
+            "exclude_fields": exclude_fields,
+        }
+        async with self.requester.stream(
+            'GET',
+            f"{self.endpoint}/export",
+            params={k: v for k, v in params.items() if v is not None},
+            timeout_budget=timeout_budget
+        ) as response:
+            decoder = self.requester.decoder
+            if self.codec is not None:
+                decoder = self.codec.document
+            async for line in iter_lines(response):
+                yield line if raw else decoder(line)
+
+    async def export_to(self,
+                        path: str,
+                        filter_by: str = None,
+                        include_fields: str = None,
+                        exclude_fields: str = None,
+                        compress: bool = False,
+                        partition_by: str | None = None,
+                        partition_size: int | float = 100000,
+                        timeout_budget: float | None = None) -> int:
+        # Streams the export to a file, see `export.export_documents`.
+        return await export_documents(
+            self,
+            path,
+            filter_by=filter_by,
+            include_fields=include_fields,
+            exclude_fields=exclude_fields,
+            compress=compress,
+            partition_by=partition_by,
+            partition_size=partition_size,
+            timeout_budget=timeout_budget
         )
 
     async def search(
@@ -134,6 +441,7 @@ class Documents(Generic[T]):
         typo_tokens_threshold: int = None,
         pinned_hits: str = None,
         hidden_hits: str = None,
+        timeout_budget: float | None = None,
     ) -> SearchResponse[T]:
         params = {
             "q": q,
@@ -171,13 +479,100 @@ class Documents(Generic[T]):
             "pinned_hits": pinned_hits,
             "hidden_hits": hidden_hits,
         }
-        return await self.requester.get(
-            f"{self.endpoint}/search",
-            params={k: v for k, v in params.items() if v is not None},
+        return await self.perform_search(
+            {k: v for k, v in params.items() if v is not None},
+            timeout_budget=timeout_budget
         )
 
-    async def delete(self, params=None):
-        return await self.requester.delete(
-            self.endpoint,
-            params=params
+    def query(self, **params) -> BoundSearchQuery[T]:
+        # A reusable search, its parameters encoded once.
+        return SearchQuery(**params).bind(self)
+
+    async def perform_search(self,
+                             params: dict,
+                             timeout_budget: float | None = None,
+                             query: SearchQuery | None = None
+                             ) -> SearchResponse[T]:
+        endpoint = f"{self.endpoint}/search"
+        request_params = params
+        if query is not None:
+            # The static parameters come encoded: only `params` are
+            # encoded, and the query string is not built by httpx.
+            endpoint = f"{endpoint}?{query.query_string(params)}"
+            request_params = None
+            params = {**query.params, **params}
+        cache = self.requester.cache
+        coalescer = self.requester.coalescer
+        if cache is None:
+            if coalescer is not None:
+                # Part of a decoded multi-search: never lazy.
+                result = await coalescer.search(
+                    self.collection_name, params, timeout_budget
+                )
+                if result is None or self.codec is None:
+                    return result
+                return self.codec.convert(result)
+            if not self.requester.lazy_search and self.codec is None:
+                return await self.requester.get(
+                    endpoint,
+                    params=request_params,
+                    hedge=True,
+                    timeout_budget=timeout_budget
+                )
+            return self.load_response(await self.requester.get(
+                endpoint,
+                params=request_params,
+                as_json=False,
+                hedge=True,
+                timeout_budget=timeout_budget
+            ))
+
+        async def load() -> bytes | None:
+            if coalescer is None:
+                return await self.requester.get(
+                    endpoint,
+                    params=request_params,
+                    as_json=False,
+                    hedge=True,
+                    timeout_budget=timeout_budget
+                )
+            result = await coalescer.search(
+                self.collection_name, params, timeout_budget
+            )
+            if result is not None:
+                return self.requester.encoder(result)
+
+        content = await cache.fetch(
+            cache.make_key((self.collection_name,), params),
+            (self.collection_name,),
+            load
         )
+        return self.load_response(content)
+
+    def load_response(self, content: bytes | None) -> SearchResponse[T]:
+        if content is None:
+            return None
+        decoder = self.requester.decoder
+        if self.requester.lazy_search:
+            if self.codec is None:
+                return LazySearchResponse(content, decoder)
+            if self.codec.key_decoders:
+                return LazySearchResponse(
+                    content, decoder, self.codec.key_decoders
+                )
+            return LazySearchResponse(content, self.codec.search)
+        if self.codec is not None:
+            return self.codec.search(content)
+        return decoder(content)
+
+    async def delete(self,
+                     params=None,
+                     timeout_budget: float | None = None):
+        try:
+            return await self.requester.delete(
+                self.endpoint,
+                params=params,
+                timeout_budget=timeout_budget
+            )
+        finally:
+            self.requester.invalidate(self.collection_name)
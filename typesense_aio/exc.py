@@ -49,6 +49,14 @@ class InvalidParameter(TypesenseClientError):
     pass
 
 
+class ReindexFailed(TypesenseClientError):
+    pass
+
+
+class ExportIncomplete(TypesenseClientError):
+    pass
+
+
 service_exceptions = (
     httpx.RequestError,
     httpx.ConnectTimeout,
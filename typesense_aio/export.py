@@ -0,0 +1,236 @@
+import asyncio
+import gzip
+import os
+import orjson
+from typing import BinaryIO, NamedTuple, TYPE_CHECKING
+from .exc import ExportIncomplete
+
+if TYPE_CHECKING:
+    from .documents import Documents
+
+
+class Checkpoint(NamedTuple):
+    # Saved once a partition is on disk. A resumed export truncates
+    # the file to `size` and goes on from the `lower` bound, up to
+    # the `upper` value found when the export started.
+    field: str
+    lower: int | float
+    upper: int | float
+    size: int
+    exported: int
+    compress: bool = False
+
+    @classmethod
+    def load(cls, path: str) -> 'Checkpoint | None':
+        try:
+            with open(path, 'rb') as checkpoint:
+                return cls(**orjson.loads(checkpoint.read()))
+        except FileNotFoundError:
+            return None
+
+    def save(self, path: str) -> None:
+        pending = f'{path}.tmp'
+        with open(pending, 'wb') as checkpoint:
+            checkpoint.write(orjson.dumps(self._asdict()))
+            checkpoint.flush()
+            os.fsync(checkpoint.fileno())
+        os.replace(pending, path)
+
+
+class ExportFile:
+    # Buffered writes, off the event loop. Compressed, each partition
+    # is a gzip member of its own: a truncated file still ends on
+    # a complete member, and readers decompress all the members.
+
+    def __init__(self,
+                 path: str,
+                 compress: bool = False,
+                 buffer_size: int = 1024 * 1024,
+                 size: int = 0):
+        self.compress = compress
+        self.buffer_size = buffer_size
+        self.buffer = bytearray()
+        self.member: gzip.GzipFile | None = None
+        self.file: BinaryIO = open(path, 'r+b' if size else 'wb')
+        self.file.truncate(size)
+        self.file.seek(size)
+
+    def write_through(self, data: bytes) -> None:
+        if not self.compress:
+            self.file.write(data)
+            return
+        if self.member is None:
+            self.member = gzip.GzipFile(
+                fileobj=self.file, mode='wb', mtime=0
+            )
+        self.member.write(data)
+
+    async def flush(self) -> None:
+        if self.buffer:
+            data = bytes(self.buffer)
+            self.buffer.clear()
+            await asyncio.to_thread(self.write_through, data)
+
+    async def write(self, chunk: bytes) -> None:
+        self.buffer += chunk
+        if len(self.buffer) >= self.buffer_size:
+            await self.flush()
+
+    def sync(self) -> int:
+        if self.member is not None:
+            self.member.close()
+            self.member = None
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return self.file.tell()
+
+    async def commit(self) -> int:
+        # Writes out the buffer, returns the size of the file.
+        await self.flush()
+        return await asyncio.to_thread(self.sync)
+
+    def close(self) -> None:
+        # The pending partition is abandoned, to be exported again.
+        self.file.close()
+
+
+async def export_partition(documents: 'Documents',
+                           output: ExportFile,
+                           params: dict,
+                           timeout_budget: float | None = None) -> int:
+    # Streams the export as received, one document per line.
+    # Returns the number of documents.
+    exported = 0
+    last = b'\n'
+    async with documents.requester.stream(
+        'GET',
+        f"{documents.endpoint}/export",
+        params={k: v for k, v in params.items() if v is not None},
+        timeout_budget=timeout_budget
+    ) as response:
+        async for chunk in response.aiter_bytes():
+            if chunk:
+                exported += chunk.count(b'\n')
+                last = chunk[-1:]
+                await output.write(chunk)
+    if last != b'\n':
+        exported += 1
+        await output.write(b'\n')
+    return exported
+
+
+async def value_range(documents: 'Documents',
+                      field: str,
+                      filter_by: str | None = None
+                      ) -> tuple[int | float, int | float] | None:
+    # Lowest and highest values of a sortable numeric field.
+    params = {"q": "*", "per_page": 1, "include_fields": field}
+    if filter_by:
+        params["filter_by"] = filter_by
+    values = []
+    for order in ('asc', 'desc'):
+        result = await documents.requester.get(
+            f"{documents.endpoint}/search",
+            params=params | {"sort_by": f"{field}:{order}"}
+        )
+        hits = result.get("hits")
+        if not hits:
+            return None
+        values.append(hits[0]["document"][field])
+    return values[0], values[1]
+
+
+async def export_documents(documents: 'Documents',
+                           path: str,
+                           *,
+                           filter_by: str | None = None,
+                           include_fields: str | None = None,
+                           exclude_fields: str | None = None,
+                           compress: bool = False,
+                           partition_by: str | None = None,
+                           partition_size: int | float = 100000,
+                           buffer_size: int = 1024 * 1024,
+                           timeout_budget: float | None = None) -> int:
+    # Exports to a JSONL file, gzipped if `compress`. Returns the
+    # number of documents exported.
+    #
+    # Partitioned by a numeric field, each range of `partition_size`
+    # values is exported on its own and checkpointed next to the file.
+    # Called again after a failure, the export resumes after the last
+    # complete partition. The last partition is open-ended, taking
+    # documents added since the export started. Documents without
+    # a value for the field are in no partition: without `filter_by`,
+    # `ExportIncomplete` is raised unless the collection holds as
+    # many documents as were exported.
+    params = {
+        "filter_by": filter_by,
+        "include_fields": include_fields,
+        "exclude_fields": exclude_fields,
+    }
+    if partition_by is None:
+        output = ExportFile(path, compress, buffer_size)
+        try:
+            exported = await export_partition(
+                documents, output, params, timeout_budget
+            )
+            await output.commit()
+        finally:
+            output.close()
+        return exported
+
+    checkpoint_path = f'{path}.checkpoint'
+    checkpoint = Checkpoint.load(checkpoint_path)
+    if checkpoint is None:
+        bounds = await value_range(documents, partition_by, filter_by)
+        if bounds is None:
+            ExportFile(path, compress).close()
+            return 0
+        checkpoint = Checkpoint(
+            partition_by, *bounds, size=0, exported=0, compress=compress
+        )
+    elif checkpoint.field != partition_by:
+        raise ValueError(
+            f'{path} is partitioned by {checkpoint.field!r}, '
+            f'not {partition_by!r}.'
+        )
+    elif checkpoint.compress != compress:
+        raise ValueError(
+            f'{path} is {"" if checkpoint.compress else "not "}compressed.'
+        )
+
+    output = ExportFile(path, compress, buffer_size, checkpoint.size)
+    try:
+        while checkpoint.lower <= checkpoint.upper:
+            lower = checkpoint.lower
+            upper = lower + partition_size
+            partition = f"{partition_by}:>={lower}"
+            if upper <= checkpoint.upper:
+                partition += f" && {partition_by}:<{upper}"
+            if filter_by:
+                partition = f"({filter_by}) && {partition}"
+            exported = await export_partition(
+                documents,
+                output,
+                params | {"filter_by": partition},
+                timeout_budget
+            )
+            checkpoint = checkpoint._replace(
+                lower=upper,
+                size=await output.commit(),
+                exported=checkpoint.exported + exported
+            )
+            await asyncio.to_thread(checkpoint.save, checkpoint_path)
+    finally:
+        output.close()
+    os.remove(checkpoint_path)
+    if filter_by is None:
+        collection = await documents.requester.get(
+            f"/collections/{documents.collection_name}"
+        )
+        if collection["num_documents"] != checkpoint.exported:
+            raise ExportIncomplete(
+                f'{checkpoint.exported} documents exported, the collection '
+                f'holds {collection["num_documents"]}: documents have no '
+                f'{partition_by!r} value, or were written meanwhile.'
+            )
+    return checkpoint.exported
@@ -7,5 +7,7 @@ class Health:
     def __init__(self, requester: Requester):
         self.requester = requester
 
-    async def check(self) -> bool:
-        return await self.requester.get(self.endpoint)
+    async def check(self, timeout_budget: float | None = None) -> bool:
+        return await self.requester.get(
+            self.endpoint, timeout_budget=timeout_budget
+        )
@@ -0,0 +1,37 @@
+from collections import deque
+from typing import Deque
+
+
+class LatencyWindow:
+    # Recent latencies of hedgeable reads, used to learn the delay
+    # after which a read is hedged.
+
+    def __init__(self,
+                 percentile: float = 0.95,
+                 size: int = 256,
+                 min_samples: int = 32,
+                 refresh: int = 32):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.refresh = refresh
+        self.samples: Deque[float] = deque(maxlen=size)
+        self.pending: int = 0
+        self.value: float | None = None
+
+    def add(self, elapsed: float) -> None:
+        self.samples.append(elapsed)
+        self.pending += 1
+        # Sorting is amortized over `refresh` samples.
+        if self.pending >= self.refresh \
+                and len(self.samples) >= self.min_samples:
+            self.pending = 0
+            ordered = sorted(self.samples)
+            index = min(
+                int(len(ordered) * self.percentile), len(ordered) - 1
+            )
+            self.value = ordered[index]
+
+    def delay(self, default: float) -> float:
+        if self.value is None:
+            return default
+        return self.value
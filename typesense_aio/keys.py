@@ -11,11 +11,15 @@ class Key:
         self.requester = requester
         self.endpoint = f"/keys/{key_id}"
 
-    async def retrieve(self):
-        return await self.requester.get(self.endpoint)
+    async def retrieve(self, timeout_budget: float | None = None):
+        return await self.requester.get(
+            self.endpoint, timeout_budget=timeout_budget
+        )
 
-    async def delete(self):
-        return await self.requester.delete(self.endpoint)
+    async def delete(self, timeout_budget: float | None = None):
+        return await self.requester.delete(
+            self.endpoint, timeout_budget=timeout_budget
+        )
 
 
 class Keys:
@@ -30,8 +34,11 @@ class Keys:
             self.keys[key_id] = Key(self.requester, key_id)
         return self.keys.get(key_id)
 
-    async def create(self, schema):
-        return await self.requester.post(self.endpoint, data=schema)
+    async def create(self, schema,
+                     timeout_budget: float | None = None):
+        return await self.requester.post(
+            self.endpoint, data=schema, timeout_budget=timeout_budget
+        )
 
     def generate_scoped_search_key(self, search_key, parameters):
         # Note: only a key generated with the `documents:search`
@@ -52,5 +59,7 @@ class Keys:
         )
         return base64.b64encode(raw_scoped_key.encode('utf-8'))
 
-    async def retrieve(self):
-        return await self.requester.get(self.endpoint)
+    async def retrieve(self, timeout_budget: float | None = None):
+        return await self.requester.get(
+            self.endpoint, timeout_budget=timeout_budget
+        )
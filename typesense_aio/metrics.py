@@ -0,0 +1,278 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Sequence, Tuple
+from .breaker import StateListener
+
+
+Labels = Tuple[str, ...]
+
+
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+# Path segments kept as such in endpoint classes.
+# Any other segment is a name or an id.
+static_segments = frozenset((
+    'aliases', 'analytics', 'collections', 'config', 'debug',
+    'documents', 'export', 'health', 'import', 'keys', 'metrics.json',
+    'multi_search', 'operations', 'overrides', 'rules', 'search',
+    'stats.json', 'synonyms'
+))
+
+
+def endpoint_class(endpoint: str) -> str:
+    # Collapses names and ids, so that label values stay bounded:
+    # '/collections/books/documents/search' is 'collections/{}/...'.
+    return '/'.join(
+        segment if segment in static_segments else '{}'
+        for segment in endpoint.partition('?')[0].strip('/').split('/')
+    )
+
+
+def escape(value: str) -> str:
+    return (
+        value.replace('\\', '\\\\')
+        .replace('\n', '\\n')
+        .replace('"', '\\"')
+    )
+
+
+def format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    pairs = ','.join(
+        f'{name}="{escape(str(value))}"'
+        for name, value in zip(names, values)
+    )
+    return '{' + pairs + '}'
+
+
+def format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric(ABC):
+    type: str
+
+    def __init__(self, name: str, documentation: str,
+                 labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    @abstractmethod
+    def samples(self) -> Iterator[Tuple[str, Tuple, Tuple, float]]:
+        # Yields (name, label names, label values, value).
+        pass
+
+    def expose(self) -> str:
+        lines = [
+            f'# HELP {self.name} {escape(self.documentation)}',
+            f'# TYPE {self.name} {self.type}'
+        ]
+        for name, labelnames, values, value in self.samples():
+            lines.append(
+                f'{name}{format_labels(labelnames, values)} '
+                f'{format_value(value)}'
+            )
+        return '\n'.join(lines)
+
+
+class Counter(Metric):
+    type = 'counter'
+
+    def __init__(self, name: str, documentation: str,
+                 labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.values: Dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def get(self, labels: Labels = ()) -> float:
+        return self.values.get(labels, 0)
+
+    def samples(self):
+        for labels, value in self.values.items():
+            yield self.name, self.labelnames, labels, value
+
+
+class Gauge(Counter):
+    type = 'gauge'
+
+    def dec(self, labels: Labels = (), amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) - amount
+
+    def set(self, labels: Labels, value: float) -> None:
+        self.values[labels] = value
+
+
+class Histogram(Metric):
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str,
+                 labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        # Per label set: the count of each bucket, +Inf last, and sum.
+        self.counts: Dict[Labels, List[int]] = {}
+        self.sums: Dict[Labels, float] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        counts = self.counts.get(labels)
+        if counts is None:
+            counts = self.counts[labels] = [0] * (len(self.buckets) + 1)
+            self.sums[labels] = 0.0
+        counts[bisect_left(self.buckets, value)] += 1
+        self.sums[labels] += value
+
+    def count(self, labels: Labels = ()) -> int:
+        return sum(self.counts.get(labels, ()))
+
+    def samples(self):
+        names = (*self.labelnames, 'le')
+        for labels, counts in self.counts.items():
+            total = 0
+            for bound, count in zip((*self.buckets, float('inf')), counts):
+                total += count
+                yield (f'{self.name}_bucket', names,
+                       (*labels, format_value(bound)), total)
+            yield f'{self.name}_sum', self.labelnames, labels, \
+                self.sums[labels]
+            yield f'{self.name}_count', self.labelnames, labels, total
+
+
+class Registry:
+    # In-process registry, exposed in the Prometheus text format.
+
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self.metrics:
+            raise ValueError(f'Metric {metric.name!r} already registered.')
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str,
+                labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str,
+              labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str,
+                  labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(
+            Histogram(name, documentation, labelnames, buckets)
+        )
+
+    def expose(self) -> str:
+        if not self.metrics:
+            return ''
+        return '\n'.join(
+            metric.expose() for metric in self.metrics.values()
+        ) + '\n'
+
+
+class ClientMetrics:
+    # What the requester records when metrics are enabled.
+
+    def __init__(self,
+                 registry: Registry | None = None,
+                 prefix: str = 'typesense_client',
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        if registry is None:
+            registry = Registry()
+        self.registry = registry
+        self.latency = registry.histogram(
+            f'{prefix}_request_duration_seconds',
+            'Duration of the requests sent to the nodes.',
+            ('endpoint', 'method', 'status'),
+            buckets
+        )
+        self.sent = registry.counter(
+            f'{prefix}_request_bytes_total',
+            'Bytes of request bodies.',
+            ('endpoint',)
+        )
+        self.received = registry.counter(
+            f'{prefix}_response_bytes_total',
+            'Bytes of response bodies.',
+            ('endpoint',)
+        )
+        self.retries = registry.counter(
+            f'{prefix}_retries_total',
+            'Requests sent again after a failure.',
+            ('endpoint',)
+        )
+        self.hedges = registry.counter(
+            f'{prefix}_hedges_total',
+            'Reads sent to a second node for being slow.',
+            ('endpoint',)
+        )
+        self.transitions = registry.counter(
+            f'{prefix}_breaker_transitions_total',
+            'Circuit breaker transitions, per node and new state.',
+            ('node', 'state')
+        )
+        self.inflight = registry.gauge(
+            f'{prefix}_inflight_requests',
+            'Requests awaiting a response, per node.',
+            ('node',)
+        )
+
+    def started(self, node: str) -> None:
+        self.inflight.inc((str(node),))
+
+    def finished(self,
+                 node: str,
+                 method: str,
+                 endpoint: str,
+                 status: int | str,
+                 elapsed: float,
+                 sent: int = 0,
+                 received: int = 0) -> None:
+        # `status` is the HTTP status code or the name of the error.
+        self.inflight.dec((str(node),))
+        labels = (endpoint_class(endpoint),)
+        self.latency.observe((*labels, method, str(status)), elapsed)
+        if sent:
+            self.sent.inc(labels, sent)
+        if received:
+            self.received.inc(labels, received)
+
+    def retried(self, endpoint: str) -> None:
+        self.retries.inc((endpoint_class(endpoint),))
+
+    def hedged(self, endpoint: str) -> None:
+        self.hedges.inc((endpoint_class(endpoint),))
+
+    def transition(self, node: str, previous: str, state: str) -> None:
+        self.transitions.inc((node, state))
+
+    def listener(self, forward: StateListener | None = None
+                 ) -> StateListener:
+        # A breaker listener recording the transitions, then
+        # forwarding them to `forward`, if any.
+        if forward is None:
+            return self.transition
+
+        def notify(node: str, previous: str, state: str) -> None:
+            self.transition(node, previous, state)
+            forward(node, previous, state)
+
+        return notify
+
+    def expose(self) -> str:
+        return self.registry.expose()
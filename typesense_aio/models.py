@@ -0,0 +1,131 @@
+import dataclasses
+import orjson
+from typing import Any, Callable, Dict, Generic, List, Type, TypeVar
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+T = TypeVar("T")
+
+
+if msgspec is not None:
+
+    class Record(msgspec.Struct):
+        # Hits and groups of hits are read like the decoded dicts.
+
+        def __getitem__(self, item: str):
+            try:
+                return getattr(self, item)
+            except AttributeError:
+                raise KeyError(item) from None
+
+        def get(self, item: str, default=None):
+            return getattr(self, item, default)
+
+
+def search_types(model: type) -> type:
+    # The search response envelope, with typed documents.
+    # Unknown keys of the envelope and of the hits are dropped.
+    hit = msgspec.defstruct('Hit', [
+        ('document', model),
+        ('highlight', Any, None),
+        ('highlights', Any, None),
+        ('text_match', Any, None),
+        ('text_match_info', Any, None),
+        ('geo_distance_meters', Any, None),
+        ('vector_distance', Any, None),
+        ('hybrid_search_info', Any, None),
+        ('curated', Any, None),
+    ], bases=(Record,), omit_defaults=True)
+    group = msgspec.defstruct('Group', [
+        ('found', Any, None),
+        ('group_key', Any, None),
+        ('hits', List[hit], []),
+    ], bases=(Record,), omit_defaults=True)
+    return msgspec.defstruct('SearchResult', [
+        ('facet_counts', Any, None),
+        ('found', Any, None),
+        ('out_of', Any, None),
+        ('page', Any, None),
+        ('request_params', Any, None),
+        ('search_cutoff', Any, None),
+        ('search_time_ms', Any, None),
+        ('took_ms', Any, None),
+        ('hits', List[hit] | None, None),
+        ('grouped_hits', List[group] | None, None),
+    ], omit_defaults=True)
+
+
+class ModelCodec(Generic[T]):
+    # Decodes documents, and the hits of search responses, into
+    # instances of a document model.
+    #
+    # With msgspec installed, the model is a `msgspec.Struct` or a
+    # dataclass, decoded in a single pass. Otherwise, the model is
+    # a dataclass, built from the decoded dicts; unknown fields
+    # are ignored either way.
+
+    def __init__(self, model: Type[T]):
+        self.model = model
+        if msgspec is not None:
+            self.document: Callable[[bytes], T] = \
+                msgspec.json.Decoder(model).decode
+            self.result_type = search_types(model)
+            self.result_decoder = msgspec.json.Decoder(self.result_type)
+            # Decoders of the typed keys, for lazy responses.
+            self.key_decoders: Dict[str, Callable[[bytes], Any]] = {
+                field.name: msgspec.json.Decoder(field.type).decode
+                for field in msgspec.structs.fields(self.result_type)
+                if field.name in ('hits', 'grouped_hits')
+            }
+        elif dataclasses.is_dataclass(model):
+            self.fields = frozenset(
+                field.name for field in dataclasses.fields(model)
+            )
+            self.document = self.build_document
+            self.key_decoders = {}
+        else:
+            raise TypeError(
+                'Document models are dataclasses, unless msgspec '
+                'is installed.'
+            )
+
+    def __repr__(self):
+        return f'<ModelCodec {self.model.__name__}>'
+
+    def build(self, document: dict) -> T:
+        return self.model(**{
+            key: value for key, value in document.items()
+            if key in self.fields
+        })
+
+    def build_document(self, raw: bytes) -> T:
+        return self.build(orjson.loads(raw))
+
+    @staticmethod
+    def envelope(result) -> dict:
+        # Keys missing from the response are left out.
+        return {
+            key: value for key, value in msgspec.structs.asdict(
+                result
+            ).items() if value is not None
+        }
+
+    def search(self, raw: bytes) -> dict:
+        if msgspec is not None:
+            return self.envelope(self.result_decoder.decode(raw))
+        return self.convert(orjson.loads(raw))
+
+    def convert(self, result: dict) -> dict:
+        # Types the hits of an already decoded search response.
+        if msgspec is not None:
+            return self.envelope(msgspec.convert(result, self.result_type))
+        for hit in result.get('hits', ()):
+            hit['document'] = self.build(hit['document'])
+        for group in result.get('grouped_hits', ()):
+            for hit in group.get('hits', ()):
+                hit['document'] = self.build(hit['document'])
+        return result
@@ -8,9 +8,45 @@ class MultiSearch:
     def __init__(self, requester: Requester):
         self.requester = requester
 
-    async def perform(self, search_queries, params: dict | None = None):
-        return await self.requester.post(
-            self.endpoint,
-            data=search_queries,
-            params=params
+    async def perform(self,
+                      search_queries,
+                      params: dict | None = None,
+                      timeout_budget: float | None = None):
+        cache = self.requester.cache
+        if cache is None:
+            return await self.requester.post(
+                self.endpoint,
+                data=search_queries,
+                params=params,
+                hedge=True,
+                timeout_budget=timeout_budget
+            )
+
+        default = (params or {}).get("collection")
+        collections = {
+            search.get("collection", default)
+            for search in search_queries.get("searches", ())
+        }
+        if None in collections:
+            # Unknown target: it could not be invalidated.
+            return await self.requester.post(
+                self.endpoint,
+                data=search_queries,
+                params=params,
+                hedge=True,
+                timeout_budget=timeout_budget
+            )
+
+        content = await cache.fetch(
+            cache.make_key(collections, search_queries, params),
+            collections,
+            lambda: self.requester.post(
+                self.endpoint,
+                data=search_queries,
+                params=params,
+                as_json=False,
+                hedge=True,
+                timeout_budget=timeout_budget
+            )
         )
+        return self.requester.decoder(content)
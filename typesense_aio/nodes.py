@@ -1,12 +1,15 @@
 import ssl
-import asyncio
-import httpx
 from pathlib import Path
 from time import time
 from urllib.parse import urlparse, ParseResult
-from typing import Iterable, Union, MutableSet, Dict
+from typing import (
+    Callable, Collection, Iterable, Union, MutableSet, Dict, List, Mapping
+)
 from .types import NodePolicy
 from .config import Configuration
+from .balancing import NodeLoad, Strategy, resolve_strategy
+from .breaker import CircuitBreaker, OPEN, CLOSED
+from .scheduler import get_scheduler
 
 
 class Node(str):
@@ -59,79 +62,118 @@ class Node(str):
 
 class SingleNode(NodePolicy):
 
-    def __init__(self, urls, healthcheck_interval: float = 60.0):
+    def __init__(self,
+                 urls,
+                 healthcheck_interval: float = 60.0,
+                 strategy: str | Strategy = 'round_robin',
+                 load: Mapping[Node, NodeLoad] | None = None,
+                 breaker: Callable[[Node], CircuitBreaker] = CircuitBreaker):
         self.node: Node = Node(urls[0])
 
-    def get(self) -> Node:
+    def get(self, exclude: Collection[Node] = ()) -> Node | None:
+        if self.node in exclude:
+            return None
         return self.node
 
 
 class NodeList(NodePolicy):
 
-    def __init__(self, urls, healthcheck_interval: float = 60.0):
+    def __init__(self,
+                 urls,
+                 healthcheck_interval: float = 60.0,
+                 strategy: str | Strategy = 'round_robin',
+                 load: Mapping[Node, NodeLoad] | None = None,
+                 breaker: Callable[[Node], CircuitBreaker] = CircuitBreaker):
+        self.nodes: List[Node] = list(dict.fromkeys(Node(url) for url in urls))
+        self.breakers: Dict[Node, CircuitBreaker] = {
+            node: breaker(node) for node in self.nodes
+        }
         self.quarantined: MutableSet[Node] = set()
-        self.sane: MutableSet[Node] = set([Node(url) for url in urls])
-        self.timers: Dict[Node, asyncio.Task] = {}
+        self.sane: MutableSet[Node] = set(self.nodes)
         self.check_interval: float = healthcheck_interval
-
-    def get(self):
-        if self.sane:
-            return next(iter(self.sane))
-
-    async def check_health(self, node) -> bool:
-        url = f'{node}/health'
-        try:
-            async with httpx.AsyncClient(verify=node.verify) as http_client:
-                response: httpx.Response = await http_client.request(
-                    'GET', url, timeout=3.0
-                )
-        except httpx.RequestError:
-            return False
-        else:
-            if response.status_code == 200:
-                if response.json() == {"ok": True}:
-                    return True
-        return False
-
-    async def health_task(self, node: Node, timer: float) -> None:
-        await asyncio.sleep(timer)
-        is_healthy: bool = await self.check_health(node)
-        if is_healthy:
+        self.closed: bool = False
+        self.strategy: Strategy = resolve_strategy(strategy)
+        self.load: Mapping[Node, NodeLoad] = {} if load is None else load
+
+    def get(self, exclude: Collection[Node] = ()) -> Node | None:
+        # Half-open nodes get a trickle of trial requests.
+        for node in self.nodes:
+            if node in self.quarantined and node not in exclude:
+                if self.breakers[node].allow():
+                    return node
+
+        candidates = [
+            node for node in self.nodes
+            if node in self.sane and node not in exclude
+        ]
+        if not candidates:
+            return None
+        if len(candidates) == 1:
+            return candidates[0]
+        return self.strategy.select(candidates, self.load)
+
+    def record_success(self, node: Node) -> None:
+        breaker = self.breakers.get(node)
+        if breaker is None:
+            return
+        breaker.record_success()
+        if breaker.state == CLOSED and node in self.quarantined:
             self.restore(node)
-            return True
-        else:
-            del self.timers[node]
-            self.timers[node]: asyncio.Task = asyncio.ensure_future(
-                self.health_task(node, self.check_interval)
-            )
-            return False
+
+    def record_failure(self, node: Node) -> None:
+        breaker = self.breakers.get(node)
+        if breaker is None:
+            raise LookupError('Unknown node.')
+        breaker.record_failure()
+        if breaker.state == OPEN and node in self.sane:
+            self.eject(node)
 
     def quarantine(self, node: Node) -> None:
+        if node not in self.breakers:
+            raise LookupError('Unknown node.')
+        self.breakers[node].trip()
+        self.eject(node)
+
+    def eject(self, node: Node) -> None:
         if node in self.sane:
             self.sane.discard(node)
             self.quarantined.add(node)
         elif node in self.quarantined:
             # We can re-quarantine a node.
-            # It resets the timer task.
+            # It reschedules the health check.
             pass
         else:
             raise LookupError('Unknown node.')
 
-        if node in self.timers:
-            self.timers[node].cancel()
-            del self.timers[node]
-
-        self.timers[node]: asyncio.Task = asyncio.ensure_future(
-            self.health_task(node, self.check_interval)
-        )
+        scheduler = get_scheduler()
+        if scheduler is not None:
+            scheduler.schedule(self, node, self.check_interval)
 
     def restore(self, node: Node) -> None:
         if node not in self.quarantined:
             raise LookupError('Unknown node.')
 
-        if node in self.timers:
-            self.timers[node].cancel()
-            del self.timers[node]
+        breaker = self.breakers[node]
+        if breaker.state != CLOSED:
+            breaker.reset()
+
+        scheduler = get_scheduler()
+        if scheduler is not None:
+            scheduler.unschedule(self, node)
 
         self.quarantined.discard(node)
         self.sane.add(node)
+
+    @property
+    def scheduled(self) -> List[Node]:
+        # Quarantined nodes awaiting a health check.
+        scheduler = get_scheduler()
+        if scheduler is None:
+            return []
+        return scheduler.scheduled(self)
+
+    def close(self) -> None:
+        self.closed = True
+        scheduler = get_scheduler()
+        if scheduler is not None:
+            scheduler.unregister(self)
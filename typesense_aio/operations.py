@@ -7,6 +7,9 @@ class Operations:
     def __init__(self, requester: Requester):
         self.requester = requester
 
-    def perform(self, operation_name: str, params: dict | None = None):
+    def perform(self, operation_name: str, params: dict | None = None,
+                timeout_budget: float | None = None):
         endpoint = f'/operations/{operation_name}'
-        return self.requester.post(endpoint, params=params)
+        return self.requester.post(
+            endpoint, params=params, timeout_budget=timeout_budget
+        )
@@ -13,14 +13,21 @@ class Override:
             f"/collections/{collection_name}/overrides/{override_id}"
         )
 
-    async def retrieve(self):
-        return await self.requester.get(self.endpoint)
+    async def retrieve(self, timeout_budget: float | None = None):
+        return await self.requester.get(
+            self.endpoint, timeout_budget=timeout_budget
+        )
 
-    async def delete(self):
-        return await self.requester.delete(self.endpoint)
+    async def delete(self, timeout_budget: float | None = None):
+        return await self.requester.delete(
+            self.endpoint, timeout_budget=timeout_budget
+        )
 
-    async def upsert(self, schema: dict):
-        return await self.requester.put(self.endpoint, data=schema)
+    async def upsert(self, schema: dict,
+                     timeout_budget: float | None = None):
+        return await self.requester.put(
+            self.endpoint, data=schema, timeout_budget=timeout_budget
+        )
 
 
 class Overrides:
@@ -40,5 +47,7 @@ class Overrides:
             )
         return self.overrides[override_id]
 
-    async def retrieve(self):
-        return await self.requester.get(self.endpoint)
+    async def retrieve(self, timeout_budget: float | None = None):
+        return await self.requester.get(
+            self.endpoint, timeout_budget=timeout_budget
+        )
@@ -0,0 +1,38 @@
+import httpx
+from typing import Dict
+from .config import Configuration
+from .nodes import Node
+
+
+class ConnectionPool:
+    # Long-lived keep-alive HTTP clients, one per node.
+
+    def __init__(self, config: Configuration):
+        self.limits = httpx.Limits(
+            max_connections=config.pool_max_connections,
+            max_keepalive_connections=config.pool_max_keepalive,
+            keepalive_expiry=config.pool_keepalive_expiry
+        )
+        self.http1: bool = config.http1
+        self.http2: bool = config.http2
+        self.clients: Dict[Node, httpx.AsyncClient] = {}
+
+    def create_client(self, node: Node) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            verify=node.verify,
+            limits=self.limits,
+            http1=self.http1,
+            http2=self.http2
+        )
+
+    def get(self, node: Node) -> httpx.AsyncClient:
+        client = self.clients.get(node)
+        if client is None or client.is_closed:
+            client = self.clients[node] = self.create_client(node)
+        return client
+
+    async def aclose(self) -> None:
+        clients = list(self.clients.values())
+        self.clients.clear()
+        for client in clients:
+            await client.aclose()
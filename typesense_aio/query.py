@@ -0,0 +1,103 @@
+from typing import Generic, TypeVar, TYPE_CHECKING
+from urllib.parse import quote
+from .exc import InvalidParameter
+from .types import SearchResponse
+
+if TYPE_CHECKING:
+    from .documents import Documents
+
+
+T = TypeVar("T")
+
+
+parameters = frozenset((
+    'q', 'query_by', 'query_by_weights', 'max_hits', 'prefix',
+    'filter_by', 'sort_by', 'facet_by', 'max_facet_values',
+    'facet_query', 'num_typos', 'page', 'per_page', 'group_by',
+    'group_limit', 'include_fields', 'exclude_fields',
+    'highlight_full_fields', 'highlight_affix_num_tokens',
+    'highlight_start_tag', 'highlight_end_tag', 'snippet_threshold',
+    'drop_tokens_threshold', 'typo_tokens_threshold', 'pinned_hits',
+    'hidden_hits'
+))
+
+
+def prepare_params(params: dict) -> dict:
+    unknown = params.keys() - parameters
+    if unknown:
+        raise InvalidParameter(
+            f"Unknown search parameters: {', '.join(sorted(unknown))}."
+        )
+    return {
+        key: (
+            ','.join(str(item) for item in value)
+            if isinstance(value, (list, tuple)) else value
+        )
+        for key, value in params.items() if value is not None
+    }
+
+
+def encode_value(value) -> str:
+    # As httpx encodes the primitive values.
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    return quote(str(value), safe='')
+
+
+def encode_params(params: dict) -> str:
+    return '&'.join(
+        f'{key}={encode_value(value)}' for key, value in params.items()
+    )
+
+
+class SearchQuery:
+    # Search parameters validated and URL-encoded once, for queries
+    # run many times with only a few parameters, such as `q` and
+    # `page`, changing.
+
+    def __init__(self, **params):
+        self.params: dict = prepare_params(params)
+        self.encoded: str = encode_params(self.params)
+
+    def __repr__(self):
+        return f'<SearchQuery {self.encoded}>'
+
+    def query_string(self, params: dict) -> str:
+        # The encoded query string, the given parameters added.
+        if not params:
+            return self.encoded
+        if not params.keys().isdisjoint(self.params):
+            raise InvalidParameter(
+                'Search parameters cannot override the static ones.'
+            )
+        encoded = encode_params(params)
+        if not self.encoded:
+            return encoded
+        return f'{self.encoded}&{encoded}'
+
+    def bind(self, documents: 'Documents[T]') -> 'BoundSearchQuery[T]':
+        return BoundSearchQuery(self, documents)
+
+
+class BoundSearchQuery(Generic[T]):
+
+    def __init__(self, query: SearchQuery, documents: 'Documents[T]'):
+        self.query = query
+        self.documents = documents
+
+    def __repr__(self):
+        return (
+            f'<BoundSearchQuery {self.documents.collection_name} '
+            f'{self.query.encoded}>'
+        )
+
+    async def __call__(self,
+                       timeout_budget: float | None = None,
+                       **params) -> SearchResponse[T]:
+        return await self.documents.perform_search(
+            prepare_params(params),
+            timeout_budget=timeout_budget,
+            query=self.query
+        )
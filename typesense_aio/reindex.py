@@ -0,0 +1,81 @@
+from typing import Callable, NamedTuple
+from .bulk import BulkIndexer, BulkStats
+from .client import Client
+from .exc import ReindexFailed
+from .types import CollectionDict
+
+
+class Reindexed(NamedTuple):
+    source: str
+    target: str
+    exported: int
+    stats: BulkStats
+
+
+async def reindex(client: Client,
+                  alias: str,
+                  schema: CollectionDict,
+                  *,
+                  source: str | None = None,
+                  transform: Callable[[dict], dict | None] | None = None,
+                  filter_by: str | None = None,
+                  batch_size: int = 1000,
+                  concurrency: int = 4,
+                  max_pending: int = 10000,
+                  drop_source: bool = False) -> Reindexed:
+    # Creates the collection of `schema` and fills it with the
+    # documents of `source`, the collection behind the alias unless
+    # given, then points the alias at it.
+    #
+    # Documents are streamed from the export into concurrent imports,
+    # at most `max_pending` of them in memory. `transform` returns the
+    # document to import, or None to leave it out; without it, the
+    # exported lines are imported as they are.
+    #
+    # The alias is only moved once every document was imported and
+    # the new collection holds as many. Otherwise, `ReindexFailed` is
+    # raised and the new collection is left for inspection.
+    if source is None:
+        current = await client.aliases[alias].retrieve()
+        if current is None:
+            raise ReindexFailed(
+                f'Alias {alias} does not exist: a source is required.'
+            )
+        source = current["collection_name"]
+    target = schema["name"]
+    await client.collections.create(schema)
+
+    exported = skipped = 0
+    async with BulkIndexer(
+            client.collections[target].documents,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            max_pending=max_pending) as indexer:
+        async for document in client.collections[source].documents \
+                .export_iter(filter_by=filter_by, raw=transform is None):
+            exported += 1
+            if transform is not None:
+                document = transform(document)
+                if document is None:
+                    skipped += 1
+                    continue
+            await indexer.add(document)
+
+    stats = indexer.stats
+    expected = exported - skipped
+    if stats.failed:
+        raise ReindexFailed(
+            f'{stats.failed} documents of {source} failed to import '
+            f'into {target}.'
+        )
+    collection = await client.collections[target].retrieve()
+    if collection["num_documents"] != expected:
+        raise ReindexFailed(
+            f'{target} holds {collection["num_documents"]} documents, '
+            f'{expected} expected.'
+        )
+
+    await client.aliases[alias].upsert({"collection_name": target})
+    if drop_source:
+        await client.collections[source].delete()
+    return Reindexed(source, target, exported, stats)
@@ -1,14 +1,32 @@
 import asyncio
 import httpx
 import orjson
-from the_retry import retry
+from collections import defaultdict
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager
+from functools import wraps
+from itertools import count
+from time import monotonic, perf_counter
+from typing import AsyncIterable, AsyncIterator, Collection, Dict
 from .types import BaseRequester
 from .config import Configuration
 from .nodes import Node, SingleNode, NodeList
+from .balancing import NodeLoad
+from .hedging import LatencyWindow
+from .breaker import CircuitBreaker
+from .retry import RetryBudget, retry, retry_delay
+from .metrics import ClientMetrics, endpoint_class
+from .pool import ConnectionPool
+from .timing import TRACE, PhaseTrace, RequestTiming
+from .tracing import Span, Tracer, collection_name, current_span
+from .cache import SearchCache, normalize
+from .compression import gzip_bytes, gzip_stream
+from .coalesce import SearchCoalescer
 from .exc import (
     resolve_exception,
     service_exceptions,
     ObjectNotFound,
+    Timeout,
 )
 
 
@@ -21,81 +39,642 @@ class Requester(BaseRequester):
         if headers is None:
             headers = {}
         headers["X-TYPESENSE-API-KEY"] = config.api_key
+        if not config.response_compression:
+            headers["Accept-Encoding"] = "identity"
         self.headers = headers
 
+        self.pool = ConnectionPool(config)
+        self.load: Dict[Node, NodeLoad] = defaultdict(NodeLoad)
+        self.metrics: ClientMetrics | None = config.metrics
+        self.on_timing = config.timing_callback
+        self.tracer: Tracer | None = config.tracer
+        self.lazy_search: bool = config.lazy_search
+        self.encode_executor: Executor | None = config.encode_executor
+        self.encode_chunk_documents: int = config.encode_chunk_documents
+        self.encode_concurrency: int = config.encode_concurrency
+        self.compression_threshold: int | None = \
+            config.request_compression_threshold
+        self.compression_level: int = config.request_compression_level
+        listener = config.breaker_listener
+        if self.metrics is not None:
+            listener = self.metrics.listener(listener)
         node_policy = SingleNode if len(config.urls) == 1 else NodeList
-        self.nodes = node_policy(config.urls, config.healthcheck_interval)
+        self.nodes = node_policy(
+            config.urls,
+            config.healthcheck_interval,
+            strategy=config.load_balancing,
+            load=self.load,
+            breaker=lambda node: CircuitBreaker(
+                node,
+                failure_threshold=config.breaker_failure_threshold,
+                error_rate=config.breaker_error_rate,
+                window=config.breaker_window,
+                open_interval=config.breaker_open_interval,
+                max_open_interval=config.breaker_max_open_interval,
+                half_open_requests=config.breaker_half_open_requests,
+                listener=listener
+            )
+        )
 
-        self.request = retry(
-            expected_exception=service_exceptions,
-            attempts=config.retries,
-            backoff=config.retry_interval
-        )(self._request)
+        self.retries: int = config.retries
+        self.retry_interval: float = config.retry_interval
+        self.retry_max_interval: float = config.retry_max_interval
+        self.budget = RetryBudget(
+            ratio=config.retry_budget_ratio,
+            minimum=config.retry_budget_minimum
+        )
+        self.request = self.retrying(self._request, config)
+        self.hedged_request = self.retrying(self._hedged_request, config)
+        if self.tracer is not None:
+            self.request = self.traced(self.request)
+            self.hedged_request = self.traced(self.hedged_request)
         self.timeout: float = config.timeout
+        self.hedge_delay: float | None = config.hedge_delay
+        self.latencies: LatencyWindow | None = None
+        if config.hedge_delay is not None and config.hedge_percentile:
+            self.latencies = LatencyWindow(config.hedge_percentile)
+        self.cache: SearchCache | None = None
+        if config.cache_ttl:
+            self.cache = SearchCache(
+                config.cache_ttl,
+                max_entries=config.cache_max_entries,
+                max_bytes=config.cache_max_bytes
+            )
+        self.coalescer: SearchCoalescer | None = None
+        if config.coalesce_window is not None:
+            self.coalescer = SearchCoalescer(
+                self,
+                window=config.coalesce_window,
+                max_batch=config.coalesce_max_batch
+            )
+
+        self.inflight: Dict[bytes, asyncio.Future] | None = (
+            {} if config.singleflight else None
+        )
+
+    def retrying(self, send, config: Configuration):
+        return retry(
+            send,
+            attempts=config.retries,
+            interval=config.retry_interval,
+            max_interval=config.retry_max_interval,
+            budget=self.budget,
+            expected=service_exceptions,
+            on_retry=None if self.metrics is None else self.retried
+        )
+
+    def retried(self, method: str, endpoint: str, **kwargs) -> None:
+        self.metrics.retried(endpoint)
+
+    def request_span(self, method: str, endpoint: str) -> Span:
+        attributes = {
+            'typesense.method': method,
+            'typesense.endpoint': endpoint_class(endpoint)
+        }
+        collection = collection_name(endpoint)
+        if collection is not None:
+            attributes['typesense.collection'] = collection
+        return self.tracer.start_span(
+            'typesense.request', attributes, current_span.get()
+        )
+
+    def attempt_span(self,
+                     node: Node,
+                     attempt: int,
+                     parent: Span | None) -> Span:
+        if parent is not None and attempt > 1:
+            parent.set_attribute('typesense.retries', attempt - 1)
+        return self.tracer.start_span('typesense.attempt', {
+            'typesense.node': str(node),
+            'typesense.attempt': attempt
+        }, parent)
+
+    @staticmethod
+    def end_span(span: Span,
+                 response: httpx.Response | None = None,
+                 error: BaseException | None = None) -> None:
+        if error is not None:
+            span.set_attribute('typesense.error', type(error).__name__)
+            span.end(error)
+        else:
+            span.set_attribute('http.status_code', response.status_code)
+            span.end()
+
+    def traced(self, request):
+        # Wraps the request, retries included, in a span.
+
+        @wraps(request)
+        async def traced_request(method: str, endpoint: str, **kwargs):
+            span = self.request_span(method, endpoint)
+            token = current_span.set(span)
+            try:
+                response = await request(method, endpoint, **kwargs)
+            except BaseException as exc:
+                self.end_span(span, error=exc)
+                raise
+            finally:
+                current_span.reset(token)
+            self.end_span(span, response)
+            return response
+
+        return traced_request
+
+    def invalidate(self, collection_name: str) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(collection_name)
 
     def handle_faulty_node(self, node: Node) -> None:
-        self.nodes.quarantine(node)
+        self.nodes.record_failure(node)
+
+    async def aclose(self) -> None:
+        self.nodes.close()
+        await self.pool.aclose()
+
+    def select_node(self, exclude: Collection[Node] = ()) -> Node:
+        node = self.nodes.get(exclude)
+        if node is None and exclude:
+            # Every node was tried already: any sane one will do.
+            node = self.nodes.get()
+        if node is None:
+            raise LookupError('No valid nodes.')
+        return node
+
+    def attempt_timeout(self, deadline: float | None) -> float:
+        # The configured timeout, shortened to what is left of
+        # the time budget of the call.
+        if deadline is None:
+            return self.timeout
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            raise Timeout('Deadline exceeded.')
+        return min(self.timeout, remaining)
+
+    def read(self, response: httpx.Response, as_json: bool):
+        if self.on_timing is None or TRACE not in response.extensions:
+            if as_json:
+                return self.decoder(response.content)
+            return response.content
+
+        timing = RequestTiming(
+            response.request.method,
+            str(response.request.url),
+            response.extensions[TRACE]
+        )
+        if not as_json:
+            self.on_timing(timing)
+            return response.content
+        started = perf_counter()
+        result = self.decoder(response.content)
+        timing.decode = perf_counter() - started
+        if timing.total is not None:
+            timing.total += timing.decode
+        if isinstance(result, dict):
+            took = result.get('search_time_ms', result.get('took_ms'))
+            if isinstance(took, (int, float)):
+                timing.server = took / 1000
+        self.on_timing(timing)
+        return result
+
+    def prepare(self, data, headers: dict | None):
+        headers = (headers or {}) | self.headers
+        if data is not None and not isinstance(
+                data, (bytes, AsyncIterable)):
+            headers["Content-Type"] = "application/json"
+            data = self.encoder(data)
+        threshold = self.compression_threshold
+        if threshold is not None and data is not None:
+            if isinstance(data, AsyncIterable):
+                data = gzip_stream(data, self.compression_level)
+            elif len(data) >= threshold:
+                data = gzip_bytes(data, self.compression_level)
+            else:
+                return data, headers
+            headers["Content-Encoding"] = "gzip"
+        return data, headers
+
+    async def check_response(self, node: Node, response: httpx.Response):
+        if 200 <= response.status_code < 300:
+            self.nodes.record_success(node)
+            return
+        error_message = await response.aread()
+        error = resolve_exception(response.status_code)
+        if error in service_exceptions:
+            self.handle_faulty_node(node)
+        else:
+            # The node is sound, the request is not.
+            self.nodes.record_success(node)
+        raise error(error_message)
 
     async def _request(self,
                       method: str,
                       endpoint: str,
                       *,
-                      data=None,
-                      params=None,
-                      headers: dict | None = None):
-
-        node = self.nodes.get()
+                      node: Node | None = None,
+                      tried: list | None = None,
+                      attempt: int = 1,
+                      **kwargs):
         if node is None:
-            raise LookupError('No valid nodes.')
+            node = self.select_node(tried or ())
+        if tried is not None:
+            tried.append(node)
+        if self.tracer is None:
+            return await self._send(method, endpoint, node, **kwargs)
 
+        span = self.attempt_span(node, attempt, current_span.get())
+        try:
+            response = await self._send(method, endpoint, node, **kwargs)
+        except BaseException as exc:
+            self.end_span(span, error=exc)
+            raise
+        self.end_span(span, response)
+        return response
+
+    async def _send(self,
+                    method: str,
+                    endpoint: str,
+                    node: Node,
+                    *,
+                    data=None,
+                    params=None,
+                    headers: dict | None = None,
+                    deadline: float | None = None):
+        timeout = self.attempt_timeout(deadline)
         url = f"{node}/{endpoint.strip('/')}"
-        headers = (headers or {}) | self.headers
+        trace = None
+        if self.on_timing is not None:
+            trace = PhaseTrace()
+            trace.mark('encode')
+        data, headers = self.prepare(data, headers)
+        if trace is not None:
+            trace.mark('encode.complete')
 
-        if data is not None and not isinstance(data, bytes):
-            headers["Content-Type"] = "application/json"
-            data = self.encoder(data)
+        http_client: httpx.AsyncClient = self.pool.get(node)
+        load = self.load[node]
+        load.started()
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.started(node)
+            started = perf_counter()
+        elapsed = None
+        status: int | str = 'cancelled'
+        try:
+            sending = http_client.request(
+                method,
+                url,
+                content=data,
+                headers=headers,
+                params=params,
+                timeout=timeout,
+                extensions=None if trace is None else {'trace': trace}
+            )
+            if deadline is None:
+                response: httpx.Response = await sending
+            else:
+                # httpx timeouts apply to each phase, not to the whole.
+                response = await asyncio.wait_for(
+                    sending, deadline - monotonic()
+                )
+            elapsed = response.elapsed.total_seconds()
+            status = response.status_code
+            if trace is not None:
+                trace.mark('request.complete')
+                response.extensions[TRACE] = trace
+        except asyncio.TimeoutError as exc:
+            status = 'Timeout'
+            raise Timeout('Deadline exceeded.') from exc
+        except httpx.RequestError as exc:
+            status = type(exc).__name__
+            if isinstance(exc, httpx.TimeoutException) \
+                    and deadline is not None and monotonic() >= deadline:
+                # Out of budget: the node is not to blame.
+                status = 'Timeout'
+                raise Timeout('Deadline exceeded.') from exc
+            self.handle_faulty_node(node)
+            raise
+        finally:
+            load.finished(elapsed)
+            if metrics is not None:
+                metrics.finished(
+                    node,
+                    method,
+                    endpoint,
+                    status,
+                    perf_counter() - started,
+                    sent=len(data) if isinstance(data, bytes) else 0,
+                    received=(
+                        response.num_bytes_downloaded
+                        if isinstance(status, int) else 0
+                    )
+                )
+        await self.check_response(node, response)
+        return response
+
+    async def _hedged_request(self,
+                              method: str,
+                              endpoint: str,
+                              tried: list | None = None,
+                              deadline: float | None = None,
+                              **kwargs):
+        # Sends the request to a second node if the first one is slow
+        # to answer. The first success wins, the other one is cancelled.
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        delay = self.hedge_delay
+        if self.latencies is not None:
+            delay = self.latencies.delay(delay)
+        kwargs['deadline'] = deadline
+
+        if tried is None:
+            tried = []
+        node = self.select_node(tried)
+        attempts = {asyncio.ensure_future(self._request(
+            method, endpoint, node=node, tried=tried, **kwargs
+        ))}
+        try:
+            done, pending = await asyncio.wait(attempts, timeout=delay)
+            if not done:
+                backup = self.nodes.get(exclude=(*tried, node))
+                if backup is not None:
+                    if self.metrics is not None:
+                        self.metrics.hedged(endpoint)
+                    attempts.add(asyncio.ensure_future(self._request(
+                        method, endpoint, node=backup, tried=tried, **kwargs
+                    )))
+            error = None
+            while attempts:
+                done, attempts = await asyncio.wait(
+                    attempts, return_when=asyncio.FIRST_COMPLETED
+                )
+                for attempt in done:
+                    if attempt.exception() is None:
+                        if self.latencies is not None:
+                            self.latencies.add(loop.time() - started)
+                        return attempt.result()
+                    error = attempt.exception()
+            raise error
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    @asynccontextmanager
+    async def stream(self,
+                     method: str,
+                     endpoint: str,
+                     *,
+                     data=None,
+                     params=None,
+                     headers: dict | None = None,
+                     timeout_budget: float | None = None
+                     ) -> AsyncIterator[httpx.Response]:
+        # Streams the request and response bodies.
+        # `data` may be a callable returning a new body for each
+        # attempt: such a body is retried as any other request,
+        # until the response is handed over. A streamed body can only
+        # be consumed once: it is retried on connection errors only,
+        # none of it having been sent.
+        # The time budget bounds each read, the body being consumed
+        # at the pace of the caller.
+        deadline = None
+        if timeout_budget is not None:
+            deadline = monotonic() + timeout_budget
+        replayable = callable(data) or not isinstance(data, AsyncIterable)
+        pulled = False
+        if not replayable:
+            chunks = aiter(data)
+
+            async def once():
+                # A new generator per attempt, over the same chunks:
+                # httpx may close the one of a failed attempt.
+                nonlocal pulled
+                async for chunk in chunks:
+                    pulled = True
+                    yield chunk
 
-        http_client: httpx.AsyncClient
+        tried = []
+        self.budget.deposit()
+        # Not the current span: it would be the parent of the spans
+        # of the requests sent while the response is streamed.
+        span = None
+        if self.tracer is not None:
+            span = self.request_span(method, endpoint)
         try:
-            async with httpx.AsyncClient(verify=node.verify) as http_client:
-                response: httpx.Response = await http_client.request(
+            for attempt in count(1):
+                if callable(data):
+                    body = data()
+                elif replayable:
+                    body = data
+                else:
+                    body = once()
+                streaming = self._stream(
                     method,
-                    url,
-                    content=data,
-                    headers=headers,
+                    endpoint,
+                    data=body,
                     params=params,
-                    timeout=self.timeout
+                    headers=headers,
+                    tried=tried,
+                    deadline=deadline,
+                    attempt=attempt,
+                    span=span
                 )
-        except httpx.RequestError:
-            self.handle_faulty_node(node)
+                opened = False
+                try:
+                    async with streaming as response:
+                        opened = True
+                        yield response
+                    break
+                except service_exceptions as exc:
+                    if opened:
+                        raise
+                    if not replayable and (pulled or not isinstance(
+                            exc, (httpx.ConnectError, httpx.ConnectTimeout))):
+                        raise
+                    delay = retry_delay(
+                        attempt,
+                        attempts=self.retries,
+                        interval=self.retry_interval,
+                        max_interval=self.retry_max_interval,
+                        budget=self.budget,
+                        deadline=deadline
+                    )
+                    if delay is None:
+                        raise
+                if self.metrics is not None:
+                    self.retried(method, endpoint)
+                await asyncio.sleep(delay)
+        except BaseException as exc:
+            if span is not None:
+                self.end_span(span, error=exc)
             raise
-        else:
-            if not 200 <= response.status_code < 300:
-                error_message = response.content
-                error = resolve_exception(response.status_code)
-                if error in service_exceptions:
-                    self.handle_faulty_node(node)
-                raise error(error_message)
-        return response
+        if span is not None:
+            self.end_span(span, response)
+
+    @asynccontextmanager
+    async def _stream(self,
+                      method: str,
+                      endpoint: str,
+                      *,
+                      data=None,
+                      params=None,
+                      headers: dict | None = None,
+                      tried: list | None = None,
+                      deadline: float | None = None,
+                      attempt: int = 1,
+                      span: Span | None = None
+                      ) -> AsyncIterator[httpx.Response]:
+        # `span` is the span of the request, parent of the attempt's.
+        timeout = self.attempt_timeout(deadline)
+        node = self.select_node(tried or ())
+        if tried is not None:
+            tried.append(node)
+        attempt_span = None
+        if span is not None:
+            attempt_span = self.attempt_span(node, attempt, span)
+        url = f"{node}/{endpoint.strip('/')}"
+        data, headers = self.prepare(data, headers)
+
+        sent = len(data) if isinstance(data, bytes) else 0
+        if self.metrics is not None and isinstance(data, AsyncIterable):
+
+            async def counting(chunks: AsyncIterable[bytes]):
+                nonlocal sent
+                async for chunk in chunks:
+                    sent += len(chunk)
+                    yield chunk
+
+            data = counting(data)
+
+        http_client: httpx.AsyncClient = self.pool.get(node)
+        request = http_client.build_request(
+            method,
+            url,
+            content=data,
+            headers=headers,
+            params=params,
+            timeout=timeout
+        )
+        load = self.load[node]
+        load.started()
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.started(node)
+            started = perf_counter()
+        response: httpx.Response | None = None
+        status: int | str = 'cancelled'
+        error: BaseException | None = None
+        # Streamed bodies take arbitrarily long: no latency sample.
+        try:
+            response = await http_client.send(request, stream=True)
+            status = response.status_code
+            await self.check_response(node, response)
+            yield response
+        except BaseException as exc:
+            error = exc
+            if isinstance(exc, httpx.RequestError):
+                status = type(exc).__name__
+                if isinstance(exc, httpx.TimeoutException) \
+                        and deadline is not None \
+                        and monotonic() >= deadline:
+                    status = 'Timeout'
+                    error = Timeout('Deadline exceeded.')
+                    raise error from exc
+                self.handle_faulty_node(node)
+            raise
+        finally:
+            if response is not None:
+                await response.aclose()
+            if attempt_span is not None:
+                self.end_span(attempt_span, response, error)
+            load.finished()
+            if metrics is not None:
+                metrics.finished(
+                    node,
+                    method,
+                    endpoint,
+                    status,
+                    perf_counter() - started,
+                    sent=sent,
+                    received=(
+                        0 if response is None
+                        else response.num_bytes_downloaded
+                    )
+                )
 
     async def get(self,
                   endpoint: str,
                   *,
                   params=None,
                   headers: dict | None = None,
-                  as_json: bool = True):
+                  as_json: bool = True,
+                  hedge: bool = False,
+                  timeout_budget: float | None = None):
+        if self.inflight is None:
+            return await self._get(
+                endpoint,
+                params=params,
+                headers=headers,
+                as_json=as_json,
+                hedge=hedge,
+                timeout_budget=timeout_budget
+            )
+
+        # Callers of an identical in-flight GET share its outcome,
+        # including the decoded object: treat it as read-only.
+        key = self.encoder([
+            endpoint.strip('/'),
+            normalize(params),
+            sorted(((headers or {}) | self.headers).items()),
+            as_json
+        ])
+        future = self.inflight.get(key)
+        if future is None:
+            # The shared request is not bound by the budget of the
+            # caller which started it: each caller waits on its own.
+            future = asyncio.ensure_future(self._get(
+                endpoint,
+                params=params,
+                headers=headers,
+                as_json=as_json,
+                hedge=hedge
+            ))
+            self.inflight[key] = future
+
+            def forget(done: asyncio.Future) -> None:
+                if self.inflight.get(key) is done:
+                    del self.inflight[key]
+
+            future.add_done_callback(forget)
+        # Shielded: a cancelled caller does not cancel the others.
+        if timeout_budget is None:
+            return await asyncio.shield(future)
         try:
-            response = await self.request(
+            return await asyncio.wait_for(
+                asyncio.shield(future), timeout_budget
+            )
+        except asyncio.TimeoutError as exc:
+            raise Timeout('Deadline exceeded.') from exc
+
+    async def _get(self,
+                   endpoint: str,
+                   *,
+                   params=None,
+                   headers: dict | None = None,
+                   as_json: bool = True,
+                   hedge: bool = False,
+                   timeout_budget: float | None = None):
+        request = self.request
+        if hedge and self.hedge_delay is not None:
+            request = self.hedged_request
+        try:
+            response = await request(
                 'GET',
                 endpoint,
                 params=params,
-                headers=headers
+                headers=headers,
+                timeout_budget=timeout_budget
             )
         except ObjectNotFound:
             return None
-        if as_json:
-            return self.decoder(response.content)
-        return response.content
+        return self.read(response, as_json)
 
     async def post(self,
                    endpoint,
@@ -103,17 +682,22 @@ class Requester(BaseRequester):
                    data=None,
                    params=None,
                    headers: dict | None = None,
-                   as_json: bool = True):
-        response = await self.request(
+                   as_json: bool = True,
+                   hedge: bool = False,
+                   timeout_budget: float | None = None):
+        # Only idempotent POSTs, such as multi-searches, may be hedged.
+        request = self.request
+        if hedge and self.hedge_delay is not None:
+            request = self.hedged_request
+        response = await request(
             'POST',
             endpoint,
             params=params,
             data=data,
-            headers=headers
+            headers=headers,
+            timeout_budget=timeout_budget
         )
-        if as_json:
-            return self.decoder(response.content)
-        return response.content
+        return self.read(response, as_json)
 
     async def put(self,
                   endpoint,
@@ -121,17 +705,17 @@ class Requester(BaseRequester):
                   data=None,
                   params=None,
                   headers: dict | None = None,
-                  as_json: bool = True):
+                  as_json: bool = True,
+                  timeout_budget: float | None = None):
         response = await self.request(
             'PUT',
             endpoint,
             params=params,
             data=data,
-            headers=headers
+            headers=headers,
+            timeout_budget=timeout_budget
         )
-        if as_json:
-            return self.decoder(response.content)
-        return response.content
+        return self.read(response, as_json)
 
     async def patch(self,
                     endpoint,
@@ -139,30 +723,30 @@ class Requester(BaseRequester):
                     data=None,
                     params=None,
                     headers: dict | None = None,
-                    as_json: bool = True):
+                    as_json: bool = True,
+                    timeout_budget: float | None = None):
         response = await self.request(
             'PATCH',
             endpoint,
             params=params,
             data=data,
-            headers=headers
+            headers=headers,
+            timeout_budget=timeout_budget
         )
-        if as_json:
-            return self.decoder(response.content)
-        return response.content
+        return self.read(response, as_json)
 
     async def delete(self,
                      endpoint: str,
                      *,
                      params=None,
                      headers: dict | None = None,
-                     as_json: bool = True):
+                     as_json: bool = True,
+                     timeout_budget: float | None = None):
         response = await self.request(
             'DELETE',
             endpoint,
             params=params,
-            headers=headers
+            headers=headers,
+            timeout_budget=timeout_budget
         )
-        if as_json:
-            return self.decoder(response.content)
-        return response.content
+        return self.read(response, as_json)
@@ -0,0 +1,74 @@
+from collections.abc import Mapping
+from typing import Dict, Generic, TypeVar
+from .types import JSONDecoder
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+T = TypeVar("T")
+
+
+if msgspec is not None:
+    # Top-level keys, their values left as undecoded JSON.
+    split_decoder = msgspec.json.Decoder(Dict[str, msgspec.Raw])
+
+
+class LazySearchResponse(Mapping, Generic[T]):
+    # Search response holding the body as received, each of its keys
+    # decoded on first access: reading `found` leaves the hits, the
+    # facet counts, etc., undecoded. `key_decoders` overrides
+    # `decoder` for some keys, such as the typed hits of a model.
+    #
+    # Splitting the body into keys requires msgspec, see the `models`
+    # extra. Without it, the first access decodes the whole body.
+    # A response forwarded as `raw` bytes is never decoded.
+
+    __slots__ = ('raw', 'decoder', 'key_decoders', '_split', '_decoded')
+
+    def __init__(self,
+                 raw: bytes,
+                 decoder: JSONDecoder,
+                 key_decoders: Dict[str, JSONDecoder] | None = None):
+        self.raw = raw
+        self.decoder = decoder
+        self.key_decoders = key_decoders or {}
+        self._split: dict | None = None
+        self._decoded: dict = {}
+
+    def __repr__(self):
+        if self._split is None:
+            state = 'raw'
+        elif len(self._decoded) == len(self._split):
+            state = 'decoded'
+        else:
+            state = f'{len(self._decoded)}/{len(self._split)} keys decoded'
+        return f'<LazySearchResponse {len(self.raw)} bytes, {state}>'
+
+    def split(self) -> dict:
+        if self._split is None:
+            if msgspec is None:
+                self._decoded = self.decoder(self.raw)
+                self._split = dict.fromkeys(self._decoded)
+            else:
+                self._split = split_decoder.decode(self.raw)
+        return self._split
+
+    @property
+    def decoded(self) -> dict:
+        return {key: self[key] for key in self.split()}
+
+    def __getitem__(self, item):
+        split = self.split()
+        if item not in self._decoded:
+            decoder = self.key_decoders.get(item, self.decoder)
+            self._decoded[item] = decoder(memoryview(split[item]))
+        return self._decoded[item]
+
+    def __iter__(self):
+        return iter(self.split())
+
+    def __len__(self):
+        return len(self.split())
@@ -0,0 +1,115 @@
+import asyncio
+import random
+from functools import wraps
+from itertools import count
+from time import monotonic
+from typing import Awaitable, Callable, Tuple, Type
+
+
+class RetryBudget:
+    # Token bucket capping retries to a share of the traffic.
+    # Each request deposits `ratio` token, each retry withdraws one.
+    # `minimum` tokens per second are granted regardless of traffic,
+    # so that a quiet client can still retry.
+
+    def __init__(self,
+                 ratio: float = 0.2,
+                 minimum: float = 10.0,
+                 capacity: float = 100.0):
+        self.ratio = ratio
+        self.minimum = minimum
+        self.capacity = capacity
+        self.tokens: float = minimum
+        self.updated: float = monotonic()
+
+    def refill(self) -> None:
+        now = monotonic()
+        self.tokens = min(
+            self.tokens + (now - self.updated) * self.minimum,
+            self.capacity
+        )
+        self.updated = now
+
+    def deposit(self) -> None:
+        self.refill()
+        self.tokens = min(self.tokens + self.ratio, self.capacity)
+
+    def withdraw(self) -> bool:
+        self.refill()
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+def full_jitter(attempt: int, interval: float, max_interval: float) -> float:
+    # Exponential backoff with full jitter: retries of concurrent
+    # requests are spread instead of happening in lockstep.
+    return random.uniform(0, min(max_interval, interval * 2 ** (attempt - 1)))
+
+
+def retry_delay(attempt: int,
+                *,
+                attempts: int,
+                interval: float,
+                max_interval: float,
+                budget: RetryBudget,
+                deadline: float | None = None) -> float | None:
+    # The delay before the next attempt, or None if not to retry.
+    if attempt >= attempts:
+        return None
+    delay = full_jitter(attempt, interval, max_interval)
+    # A retry the deadline would cut short is not sent.
+    if deadline is not None and monotonic() + delay >= deadline:
+        return None
+    if not budget.withdraw():
+        return None
+    return delay
+
+
+def retry(send: Callable[..., Awaitable],
+          *,
+          attempts: int,
+          interval: float,
+          max_interval: float,
+          budget: RetryBudget,
+          expected: Tuple[Type[BaseException], ...],
+          on_retry: Callable[..., None] | None = None):
+    # `send` receives a `tried` list of the nodes already used,
+    # so that retries can prefer another node, the `deadline`
+    # derived from the time budget of the call, if any, and the
+    # `attempt` number.
+    # `on_retry` is called with the arguments of the call on each retry.
+
+    @wraps(send)
+    async def request(*args, timeout_budget: float | None = None, **kwargs):
+        deadline = None
+        if timeout_budget is not None:
+            deadline = monotonic() + timeout_budget
+        tried = []
+        budget.deposit()
+        for attempt in count(1):
+            try:
+                return await send(
+                    *args,
+                    tried=tried,
+                    deadline=deadline,
+                    attempt=attempt,
+                    **kwargs
+                )
+            except expected:
+                delay = retry_delay(
+                    attempt,
+                    attempts=attempts,
+                    interval=interval,
+                    max_interval=max_interval,
+                    budget=budget,
+                    deadline=deadline
+                )
+                if delay is None:
+                    raise
+            if on_retry is not None:
+                on_retry(*args, **kwargs)
+            await asyncio.sleep(delay)
+
+    return request
@@ -0,0 +1,167 @@
+import asyncio
+import httpx
+import random
+import weakref
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .nodes import Node, NodeList
+
+
+Entry = Tuple['NodeList', 'Node']
+
+
+class HealthScheduler:
+    # Probes the quarantined nodes of every node list of an event loop
+    # from a single task, on a shared connection pool.
+
+    def __init__(self,
+                 jitter: float = 0.1,
+                 concurrency: int = 16,
+                 timeout: float = 3.0):
+        self.jitter = jitter
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.watched: Dict[Entry, float] = {}
+        self.clients: Dict[object, httpx.AsyncClient] = {}
+        self.task: asyncio.Task | None = None
+        self.wakeup: asyncio.Event | None = None
+
+    def schedule(self, nodes: 'NodeList', node: 'Node', delay: float):
+        loop = asyncio.get_running_loop()
+        delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        self.watched[(nodes, node)] = loop.time() + delay
+        if self.task is None:
+            self.wakeup = asyncio.Event()
+            self.task = asyncio.ensure_future(self.run())
+        else:
+            self.notify()
+
+    def unschedule(self, nodes: 'NodeList', node: 'Node') -> None:
+        self.watched.pop((nodes, node), None)
+        self.notify()
+
+    def unregister(self, nodes: 'NodeList') -> None:
+        for entry in [entry for entry in self.watched if entry[0] is nodes]:
+            del self.watched[entry]
+        self.notify()
+
+    def notify(self) -> None:
+        # Wakes the task up, to stop once there is nothing to watch.
+        if self.wakeup is not None:
+            self.wakeup.set()
+
+    def scheduled(self, nodes: 'NodeList') -> List['Node']:
+        return [node for owner, node in self.watched if owner is nodes]
+
+    def get_client(self, node: 'Node') -> httpx.AsyncClient:
+        client = self.clients.get(node.verify)
+        if client is None:
+            client = self.clients[node.verify] = httpx.AsyncClient(
+                verify=node.verify
+            )
+        return client
+
+    async def check_health(self, node: 'Node') -> bool:
+        try:
+            response: httpx.Response = await self.get_client(node).request(
+                'GET', f'{node}/health', timeout=self.timeout
+            )
+        except httpx.RequestError:
+            return False
+        if response.status_code == 200:
+            if response.json() == {"ok": True}:
+                return True
+        return False
+
+    async def probe(self, entries: List[Entry]) -> None:
+        # Each distinct node is probed once, whatever the number
+        # of node lists it belongs to.
+        grouped: Dict['Node', List['NodeList']] = {}
+        for nodes, node in entries:
+            grouped.setdefault(node, []).append(nodes)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def check(node: 'Node') -> bool:
+            async with semaphore:
+                return await self.check_health(node)
+
+        nodes = list(grouped)
+        results = await asyncio.gather(*(check(node) for node in nodes))
+        for node, healthy in zip(nodes, results):
+            for node_list in grouped[node]:
+                if node_list.closed or node not in node_list.quarantined:
+                    continue
+                if healthy:
+                    node_list.restore(node)
+                else:
+                    self.schedule(node_list, node, node_list.check_interval)
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self.watched:
+                self.wakeup.clear()
+                now = loop.time()
+                due = min(self.watched.values())
+                if due > now:
+                    try:
+                        await asyncio.wait_for(self.wakeup.wait(), due - now)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                # A due node is probed for every list watching it.
+                due_nodes = {
+                    node for (_, node), when in self.watched.items()
+                    if when <= now
+                }
+                ready = [
+                    entry for entry in self.watched if entry[1] in due_nodes
+                ]
+                for entry in ready:
+                    del self.watched[entry]
+                await self.probe(ready)
+        finally:
+            # Idle: the connections are released until the next
+            # quarantine starts a new run.
+            clients, self.clients = self.clients, {}
+            if self.task is asyncio.current_task():
+                self.task = None
+            for client in clients.values():
+                await client.aclose()
+
+    async def aclose(self) -> None:
+        self.watched.clear()
+        task, self.task = self.task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        clients, self.clients = self.clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+
+schedulers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_scheduler() -> HealthScheduler | None:
+    # The scheduler of the running event loop, if any.
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    scheduler = schedulers.get(loop)
+    if scheduler is None:
+        scheduler = schedulers[loop] = HealthScheduler()
+    return scheduler
+
+
+async def shutdown() -> None:
+    # Stops the health checks of the running event loop.
+    scheduler = get_scheduler()
+    if scheduler is not None:
+        await scheduler.aclose()
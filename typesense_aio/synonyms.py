@@ -15,14 +15,21 @@ class Synonym:
             f"/collections/{collection_name}/synonyms/{synonym_id}"
         )
 
-    async def upsert(self, schema: dict):
-        return await self.requester.put(self.endpoint, data=schema)
+    async def upsert(self, schema: dict,
+                     timeout_budget: float | None = None):
+        return await self.requester.put(
+            self.endpoint, data=schema, timeout_budget=timeout_budget
+        )
 
-    async def retrieve(self):
-        return await self.requester.get(self.endpoint)
+    async def retrieve(self, timeout_budget: float | None = None):
+        return await self.requester.get(
+            self.endpoint, timeout_budget=timeout_budget
+        )
 
-    async def delete(self):
-        return await self.requester.delete(self.endpoint)
+    async def delete(self, timeout_budget: float | None = None):
+        return await self.requester.delete(
+            self.endpoint, timeout_budget=timeout_budget
+        )
 
 
 class Synonyms:
@@ -42,5 +49,7 @@ class Synonyms:
             )
         return self.synonyms[synonym_id]
 
-    async def retrieve(self):
-        return await self.requester.get(self.endpoint)
+    async def retrieve(self, timeout_budget: float | None = None):
+        return await self.requester.get(
+            self.endpoint, timeout_budget=timeout_budget
+        )
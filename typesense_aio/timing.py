@@ -0,0 +1,89 @@
+from time import perf_counter
+from typing import Callable, Dict
+
+
+# Key of the phase trace in the extensions of a response.
+TRACE = 'typesense_aio.trace'
+
+
+class PhaseTrace:
+    # Timestamps of an attempt, fed by the `trace` extension of httpx.
+    # The protocol prefix of the events ('http11.', 'http2.', ...)
+    # is dropped, so that both protocols yield the same marks.
+
+    __slots__ = ('marks',)
+
+    def __init__(self):
+        self.marks: Dict[str, float] = {}
+
+    def mark(self, name: str) -> None:
+        self.marks[name] = perf_counter()
+
+    async def __call__(self, name: str, info: dict) -> None:
+        self.marks[name.partition('.')[2]] = perf_counter()
+
+    def between(self, start: str, end: str) -> float | None:
+        if start in self.marks and end in self.marks:
+            return self.marks[end] - self.marks[start]
+        return None
+
+
+class RequestTiming:
+    # Where the time of a request went, in seconds.
+    #
+    # encode: JSON encoding of the request body.
+    # connection: from the body encoded to writing the request
+    #   headers, that is getting the client of the node, waiting for
+    #   a pooled connection, or connecting.
+    # send: writing the request.
+    # wait: from the request written to the response headers, that is
+    #   the server time plus a round trip.
+    # transfer: reading the response body.
+    # decode: JSON decoding of the response body.
+    # server: the `took_ms` reported by search responses.
+    # The network phases are None when the transport does not trace.
+
+    __slots__ = (
+        'method', 'url', 'encode', 'connection', 'send', 'wait',
+        'transfer', 'decode', 'total', 'server'
+    )
+
+    def __init__(self, method: str, url: str, trace: PhaseTrace):
+        self.method = method
+        self.url = url
+        self.encode = trace.between('encode', 'encode.complete')
+        self.connection = trace.between(
+            'encode.complete', 'send_request_headers.started'
+        )
+        self.send = trace.between(
+            'send_request_headers.started', 'send_request_body.complete'
+        )
+        self.wait = trace.between(
+            'send_request_body.complete',
+            'receive_response_headers.complete'
+        )
+        self.transfer = trace.between(
+            'receive_response_body.started',
+            'receive_response_body.complete'
+        )
+        self.total = trace.between('encode', 'request.complete')
+        self.decode: float | None = None
+        self.server: float | None = None
+
+    def __repr__(self):
+        phases = ' '.join(
+            f'{name}={value * 1000:.3f}ms'
+            for name in self.__slots__[2:]
+            if (value := getattr(self, name)) is not None
+        )
+        return f'<RequestTiming {self.method} {self.url} {phases}>'
+
+    @property
+    def network(self) -> float | None:
+        # The part of the wait not spent by the server.
+        if self.wait is None or self.server is None:
+            return None
+        return self.wait - self.server
+
+
+TimingCallback = Callable[[RequestTiming], None]
@@ -0,0 +1,154 @@
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from time import time_ns
+from typing import Any, Dict, List
+
+
+class Span(ABC):
+
+    @abstractmethod
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    @abstractmethod
+    def end(self, error: BaseException | None = None) -> None:
+        # Ends the span, failed if an error is given.
+        pass
+
+
+class Tracer(ABC):
+
+    @abstractmethod
+    def start_span(self,
+                   name: str,
+                   attributes: Dict[str, Any],
+                   parent: Span | None = None) -> Span:
+        # Without a parent, the span is a root span as far as
+        # this client is concerned.
+        pass
+
+
+# The span of the request being sent, parent of its attempts.
+current_span: ContextVar[Span | None] = ContextVar(
+    'typesense_aio.span', default=None
+)
+
+
+def collection_name(endpoint: str) -> str | None:
+    parts = endpoint.strip('/').split('/')
+    if len(parts) > 1 and parts[0] == 'collections':
+        return parts[1]
+    return None
+
+
+class RecordedSpan(Span):
+
+    def __init__(self,
+                 exporter: 'SpanExporter',
+                 name: str,
+                 attributes: Dict[str, Any],
+                 parent: 'RecordedSpan | None' = None):
+        self.exporter = exporter
+        self.name = name
+        self.attributes = dict(attributes)
+        self.parent = parent
+        self.start: int = time_ns()
+        self.finish: int | None = None
+        self.error: BaseException | None = None
+
+    def __repr__(self):
+        return f'<RecordedSpan {self.name!r} {self.attributes}>'
+
+    @property
+    def duration(self) -> float | None:
+        if self.finish is None:
+            return None
+        return (self.finish - self.start) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self, error: BaseException | None = None) -> None:
+        self.finish = time_ns()
+        self.error = error
+        self.exporter.export(self)
+
+
+class SpanExporter(ABC):
+
+    @abstractmethod
+    def export(self, span: RecordedSpan) -> None:
+        # Called with each span, once it ended.
+        pass
+
+
+class InMemoryExporter(SpanExporter):
+
+    def __init__(self):
+        self.spans: List[RecordedSpan] = []
+
+    def export(self, span: RecordedSpan) -> None:
+        self.spans.append(span)
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+
+class RecordingTracer(Tracer):
+
+    def __init__(self, exporter: SpanExporter):
+        self.exporter = exporter
+
+    def start_span(self,
+                   name: str,
+                   attributes: Dict[str, Any],
+                   parent: RecordedSpan | None = None) -> RecordedSpan:
+        return RecordedSpan(self.exporter, name, attributes, parent)
+
+
+class OpenTelemetrySpan(Span):
+
+    def __init__(self, span, trace):
+        self.span = span
+        self.trace = trace
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.span.set_attribute(key, value)
+
+    def end(self, error: BaseException | None = None) -> None:
+        if error is not None:
+            self.span.record_exception(error)
+            self.span.set_status(
+                self.trace.Status(self.trace.StatusCode.ERROR, str(error))
+            )
+        self.span.end()
+
+
+class OpenTelemetryTracer(Tracer):
+    # Requires `opentelemetry-api`, see the `opentelemetry` extra.
+    # Root spans are children of the active OpenTelemetry span.
+
+    def __init__(self, tracer=None):
+        from opentelemetry import trace
+        self.trace = trace
+        if tracer is None:
+            tracer = trace.get_tracer('typesense_aio')
+        self.tracer = tracer
+
+    def start_span(self,
+                   name: str,
+                   attributes: Dict[str, Any],
+                   parent: OpenTelemetrySpan | None = None
+                   ) -> OpenTelemetrySpan:
+        context = None
+        if parent is not None:
+            context = self.trace.set_span_in_context(parent.span)
+        return OpenTelemetrySpan(
+            self.tracer.start_span(
+                name,
+                context=context,
+                kind=self.trace.SpanKind.CLIENT,
+                attributes=attributes
+            ),
+            self.trace
+        )
@@ -77,8 +77,8 @@ class SearchResponse(t.Protocol[T]):
 class NodePolicy(ABC):
 
     @abstractmethod
-    def get(self) -> str | None:
-        # Returns the most relevant active node.
+    def get(self, exclude: t.Collection[str] = ()) -> str | None:
+        # Returns the most relevant active node, not in `exclude`.
         pass
 
     def quarantine(self, node: str) -> bool:
@@ -90,6 +90,18 @@ class NodePolicy(ABC):
         # Restores a node to active duty.
         pass
 
+    def record_success(self, node: str) -> None:
+        # Reports a request the node answered properly.
+        pass
+
+    def record_failure(self, node: str) -> None:
+        # Reports a request the node failed to answer.
+        self.quarantine(node)
+
+    def close(self) -> None:
+        # Cancels any pending background work.
+        pass
+
 
 class BaseRequester(ABC):
 
@@ -101,13 +113,24 @@ class BaseRequester(ABC):
     def handle_faulty_node(self, node: str) -> None:
         pass
 
+    async def aclose(self) -> None:
+        # Releases the pooled connections.
+        pass
+
+    def invalidate(self, collection_name: str) -> None:
+        # Drops cached results involving the collection.
+        pass
+
     @abstractmethod
     async def get(self,
                   endpoint: str,
                   *,
                   params: dict | None = None,
                   headers: dict | None = None,
-                  as_json: bool = True) -> JSON | t.AnyStr | None:
+                  as_json: bool = True,
+                  hedge: bool = False,
+                  timeout_budget: float | None = None
+                  ) -> JSON | t.AnyStr | None:
         pass
 
     @abstractmethod
@@ -117,7 +140,10 @@ class BaseRequester(ABC):
                    data: dict | str | bytes | None = None,
                    params: dict | None = None,
                    headers: dict | None = None,
-                   as_json: bool = True) -> JSON | t.AnyStr | None:
+                   as_json: bool = True,
+                   hedge: bool = False,
+                   timeout_budget: float | None = None
+                   ) -> JSON | t.AnyStr | None:
         pass
 
     @abstractmethod
@@ -127,7 +153,9 @@ class BaseRequester(ABC):
                   data: dict | bytes | None = None,
                   params: dict | None = None,
                   headers: dict | None = None,
-                  as_json: bool = True) -> JSON | t.AnyStr | None:
+                  as_json: bool = True,
+                  timeout_budget: float | None = None
+                  ) -> JSON | t.AnyStr | None:
         pass
 
     @abstractmethod
@@ -137,7 +165,9 @@ class BaseRequester(ABC):
                     data: dict | bytes | None = None,
                     params: dict | None = None,
                     headers: dict | None = None,
-                    as_json: bool = True) -> JSON | t.AnyStr | None:
+                    as_json: bool = True,
+                    timeout_budget: float | None = None
+                    ) -> JSON | t.AnyStr | None:
         pass
 
     @abstractmethod
@@ -146,5 +176,7 @@ class BaseRequester(ABC):
                      *,
                      params: dict | None = None,
                      headers: dict | None = None,
-                     as_json: bool = True) -> JSON | t.AnyStr | None:
+                     as_json: bool = True,
+                     timeout_budget: float | None = None
+                     ) -> JSON | t.AnyStr | None:
         pass